@@ -0,0 +1,257 @@
+# -*- coding: utf-8 -*-
+"""End-to-end GLPIClient benchmarks against the local fake server.
+
+Scenarios (all by default, or pick with --scenario):
+
+- pagination: iter_items over every row, sequential vs parallel range windows
+- search: iter_search over every row, sequential vs parallel range windows
+- concurrency: get_items against a server that sheds load above 8 requests
+  in flight, with fixed vs adaptive concurrency, and with random 503s
+- cache: get_item without cache, with a cold cache, served fresh from the
+  cache and revalidated by ETag (304)
+- bulk: add_items/update_items/delete_items one item per request vs batches
+- dropdowns: iter_items with names expanded by the server, resolved from the
+  local DropdownCache (cold and warm) and as raw IDs
+
+Each row shows the wall time, throughput, response bytes received and how
+many requests reached the server (REQS) or were answered with an injected
+error (ERROS). Client and
+server share one process and the GIL, so CPU-bound variants (many workers)
+understate what a real server allows.
+
+Usage:
+    python benchmarks/bench_client.py [--items 2000] [--scenario pagination cache]
+"""
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Iterable
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from glpi_cli.cache import ResponseCache  # noqa: E402
+from glpi_cli.client import GLPIClient  # noqa: E402
+from glpi_cli.config import Config  # noqa: E402
+from glpi_cli.dropdowns import DropdownCache  # noqa: E402
+
+from fake_glpi import make_server  # noqa: E402
+
+SCENARIOS = ("pagination", "search", "concurrency", "cache", "bulk", "dropdowns")
+
+
+class Bench:
+    """Fake server plus a client factory and a result printer."""
+
+    def __init__(self, items: int, latency: float, item_latency: float, workers: int):
+        self.items = items
+        self.workers = workers
+        self.server, self.url = make_server(
+            base_latency=latency, items=items, item_latency=item_latency
+        )
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.bytes = 0
+        print(
+            f"{'CENÁRIO':<12} {'VARIANTE':<24} {'ITENS':>6} {'S':>7} "
+            f"{'ITENS/S':>9} {'KIB':>8} {'REQS':>6} {'ERROS':>6}"
+        )
+
+    def _record(self, event):
+        # Client hook: += on an int is atomic enough for a benchmark total
+        if event["event"] == "request":
+            self.bytes += event.get("bytes") or 0
+
+    def close(self):
+        self.server.shutdown()
+        self.cache_dir.cleanup()
+
+    def client(self, **kwargs) -> GLPIClient:
+        config = Config()
+        config.url = self.url
+        config.app_token = config.user_token = "bench"
+        kwargs.setdefault("pool_size", self.workers)
+        client = GLPIClient(config, **kwargs)
+        client.hooks.append(self._record)
+        client.init_session()
+        return client
+
+    def run(self, scenario: str, variant: str, func: Callable[[], Iterable]):
+        """Time func, consuming the iterable it returns, and print one row."""
+        before = self.server.counters.copy()
+        received = self.bytes
+        started = time.perf_counter()
+        count = sum(1 for _ in func())
+        elapsed = time.perf_counter() - started
+        counters = self.server.counters - before
+        requests = sum(
+            n for name, n in counters.items() if name not in ("initSession", "killSession")
+        )
+        print(
+            f"{scenario:<12} {variant:<24} {count:>6} {elapsed:>7.2f} "
+            f"{count / elapsed:>9.0f} {(self.bytes - received) / 1024:>8.0f} "
+            f"{requests:>6} {counters['injected_errors']:>6}"
+        )
+
+
+def bench_pagination(bench: Bench, page_size: int):
+    client = bench.client()
+    for concurrency in (1, 4, bench.workers):
+        bench.run(
+            "pagination",
+            f"page {page_size}, conc. {concurrency}",
+            lambda: client.iter_items("Ticket", page_size=page_size, concurrency=concurrency),
+        )
+    client.close()
+
+
+def bench_search(bench: Bench, page_size: int):
+    client = bench.client()
+    for concurrency in (1, 4, bench.workers):
+        bench.run(
+            "search",
+            f"page {page_size}, conc. {concurrency}",
+            lambda: client.iter_search("Ticket", page_size=page_size, concurrency=concurrency),
+        )
+    client.close()
+
+
+def bench_concurrency(bench: Bench):
+    ids = range(1, min(bench.items, 500) + 1)
+    workers = 2 * bench.workers
+    bench.server.max_in_flight = 8
+    try:
+        for adaptive in (False, True):
+            client = bench.client(pool_size=workers, adaptive=adaptive, max_retries=10)
+            bench.run(
+                "concurrency",
+                f"{workers} workers, {'adaptativo' if adaptive else 'fixo'}",
+                lambda: client.get_items("Ticket", ids, workers=workers, profile="minimal"),
+            )
+            client.close()
+    finally:
+        bench.server.max_in_flight = 0
+
+    bench.server.error_rate = 0.05
+    try:
+        client = bench.client(max_retries=10)
+        bench.run(
+            "concurrency",
+            f"{bench.workers} workers, 5% de 503",
+            lambda: client.get_items("Ticket", ids, workers=bench.workers, profile="minimal"),
+        )
+        client.close()
+    finally:
+        bench.server.error_rate = 0.0
+
+
+def bench_cache(bench: Bench):
+    ids = range(1, min(bench.items, 200) + 1)
+    path = Path(bench.cache_dir.name) / "responses.sqlite"
+
+    def fetch_all(client: GLPIClient, use_cache: bool = True):
+        return (client.get_item("Ticket", i, use_cache=use_cache, profile="assets") for i in ids)
+
+    client = bench.client(response_cache=ResponseCache(path, ttl=3600))
+    bench.run("cache", "sem cache", lambda: fetch_all(client, use_cache=False))
+    bench.run("cache", "cache frio", lambda: fetch_all(client))
+    bench.run("cache", "cache quente (TTL)", lambda: fetch_all(client))
+    client.close()
+
+    # ttl=0: every entry is stale and revalidated with If-None-Match
+    client = bench.client(response_cache=ResponseCache(path, ttl=0))
+    bench.run("cache", "revalidação (304)", lambda: fetch_all(client))
+    client.close()
+
+
+def bench_bulk(bench: Bench):
+    count = min(bench.items, 1000)
+    client = bench.client()
+    for batch_size in (1, 100):
+        new = [{"name": f"bench-{n}", "content": "Criado pelo benchmark"} for n in range(count)]
+        created = []
+
+        def add():
+            for _, item_id, _ in client.add_items("Ticket", new, batch_size, bench.workers):
+                created.append(item_id)
+                yield item_id
+
+        bench.run("bulk", f"add, lote {batch_size}", add)
+        changes = [{"id": item_id, "urgency": 5} for item_id in created]
+        bench.run(
+            "bulk",
+            f"update, lote {batch_size}",
+            lambda: client.update_items("Ticket", changes, batch_size, bench.workers),
+        )
+        bench.run(
+            "bulk",
+            f"delete, lote {batch_size}",
+            lambda: client.delete_items(
+                "Ticket", [{"id": item_id} for item_id in created], batch_size, bench.workers
+            ),
+        )
+    client.close()
+
+
+def bench_dropdowns(bench: Bench, page_size: int):
+    client = bench.client()
+    dropdowns = DropdownCache(Path(bench.cache_dir.name) / "dropdowns.sqlite")
+
+    def listing(**params):
+        return client.iter_items(
+            "Ticket", page_size=page_size, concurrency=bench.workers, **params
+        )
+
+    bench.run("dropdowns", "servidor", listing)
+    bench.run(
+        "dropdowns",
+        "cache local frio",
+        lambda: dropdowns.resolve_rows(client, listing(expand_dropdowns="false")),
+    )
+    bench.run(
+        "dropdowns",
+        "cache local quente",
+        lambda: dropdowns.resolve_rows(client, listing(expand_dropdowns="false")),
+    )
+    bench.run("dropdowns", "IDs crus", lambda: listing(expand_dropdowns="false"))
+    dropdowns.close()
+    client.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=2000, help="Synthetic rows per itemtype")
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument(
+        "--workers", type=int, default=8, help="Parallelism of the fast variants"
+    )
+    parser.add_argument(
+        "--latency", type=float, default=0.005, help="Seconds added to every request"
+    )
+    parser.add_argument(
+        "--item-latency", type=float, default=0.00002, help="Seconds added per row served"
+    )
+    parser.add_argument("--scenario", nargs="+", choices=SCENARIOS, default=list(SCENARIOS))
+    args = parser.parse_args()
+
+    bench = Bench(args.items, args.latency, args.item_latency, args.workers)
+    try:
+        for scenario in args.scenario:
+            if scenario == "pagination":
+                bench_pagination(bench, args.page_size)
+            elif scenario == "search":
+                bench_search(bench, args.page_size)
+            elif scenario == "concurrency":
+                bench_concurrency(bench)
+            elif scenario == "cache":
+                bench_cache(bench)
+            elif scenario == "bulk":
+                bench_bulk(bench)
+            elif scenario == "dropdowns":
+                bench_dropdowns(bench, args.page_size)
+    finally:
+        bench.close()
+
+
+if __name__ == "__main__":
+    main()
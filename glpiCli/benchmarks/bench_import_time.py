@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+"""Startup import cost of glpi_cli.cli, checked against a budget.
+
+Runs `python -X importtime -c "import glpi_cli.cli"` several times in fresh
+interpreters, reports the median cumulative import time of glpi_cli.cli and
+exits with status 1 when it exceeds the budget or when a module that should
+load lazily (requests, rich, yaml, sqlite3, concurrent.futures) is imported
+at startup. tests/test_import_time.py runs the same checks in the test suite.
+
+Usage:
+    python benchmarks/bench_import_time.py [--runs 7] [--budget-ms 80]
+"""
+import argparse
+import re
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+PROJECT_DIR = Path(__file__).resolve().parent.parent
+
+# Heavy dependencies only the commands that need them may import: third-party
+# packages, and the stdlib modules behind the caches, mirror, crawl and snapshot
+LAZY_MODULES = ("requests", "urllib3", "rich", "yaml", "sqlite3", "concurrent", "gzip")
+
+# "import time: self [us] | cumulative | imported package"
+_LINE = re.compile(r"import time:\s+\d+\s+\|\s+(\d+)\s+\|(\s+)(\S+)")
+
+
+def measure(module: str):
+    """Import a module in a fresh interpreter.
+
+    Returns:
+        Tuple of (cumulative microseconds of module, set of top-level modules imported)
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PROJECT_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    cumulative = None
+    imported = set()
+    for line in result.stderr.splitlines():
+        match = _LINE.match(line)
+        if not match:
+            continue
+        micros, _, name = match.groups()
+        imported.add(name.split(".")[0])
+        if name == module:
+            cumulative = int(micros)
+    return cumulative, imported
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--module", default="glpi_cli.cli")
+    parser.add_argument("--runs", type=int, default=7, help="Fresh interpreters to sample")
+    parser.add_argument(
+        "--budget-ms", type=float, default=80, help="Max median cumulative import time"
+    )
+    args = parser.parse_args()
+
+    # First run warms the bytecode cache and is discarded
+    measure(args.module)
+    samples = []
+    imported = set()
+    for _ in range(args.runs):
+        micros, modules = measure(args.module)
+        samples.append(micros / 1000)
+        imported |= modules
+
+    median = statistics.median(samples)
+    print(
+        f"{args.module}: median {median:.1f} ms, min {min(samples):.1f} ms, "
+        f"max {max(samples):.1f} ms over {args.runs} runs (budget {args.budget_ms:.0f} ms)"
+    )
+
+    failed = False
+    eager = [name for name in LAZY_MODULES if name in imported]
+    if eager:
+        print(f"FAIL: imported at startup: {', '.join(eager)}")
+        failed = True
+    if median > args.budget_ms:
+        print(f"FAIL: {median:.1f} ms exceeds the {args.budget_ms:.0f} ms budget")
+        failed = True
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
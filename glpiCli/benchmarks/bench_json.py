@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+"""JSON encode/decode throughput of each available fast_json backend.
+
+Times the operations the CLI runs on large listings: decoding a response
+body, the indented dump of --json, the compact dump of --compact and one
+NDJSON line per item. The input is a recorded response
+(`glpi list ticket --all --format json > tickets.json`) or synthetic
+tickets with expanded dropdown names.
+
+Usage:
+    python benchmarks/bench_json.py [--fixture tickets.json] [--items 20000] [--runs 5]
+"""
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from glpi_cli.fast_json import available_backends, load_backend  # noqa: E402
+
+
+def synthetic_tickets(count: int) -> List[Dict[str, Any]]:
+    """Tickets shaped like GET /Ticket with expand_dropdowns=true."""
+    return [
+        {
+            "id": i,
+            "entities_id": "Entidade raiz > Filial São Paulo",
+            "name": f"Impressora do 3º andar não imprime #{i}",
+            "date": "2024-03-01 08:15:00",
+            "date_mod": "2024-03-02 17:40:12",
+            "status": i % 6 + 1,
+            "users_id_recipient": "joão.silva",
+            "requesttypes_id": "Helpdesk",
+            "content": "&lt;p&gt;Descrição longa do chamado: ação, não, é.&lt;/p&gt;" * 4,
+            "urgency": 3,
+            "impact": 3,
+            "priority": 3,
+            "itilcategories_id": "Hardware > Impressoras",
+            "type": 1,
+            "locations_id": "Prédio A > 3º andar",
+            "time_to_resolve": None,
+            "actiontime": 3600,
+            "links": [
+                {"rel": "Entity", "href": "http://glpi/apirest.php/Entity/1"},
+                {"rel": "ITILCategory", "href": "http://glpi/apirest.php/ITILCategory/12"},
+            ],
+        }
+        for i in range(1, count + 1)
+    ]
+
+
+def median_of(runs: int, func: Callable[[], Any]) -> float:
+    """Median seconds of func over several runs."""
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--fixture", type=Path, help="Recorded JSON array of items")
+    parser.add_argument(
+        "--items", type=int, default=20000, help="Synthetic items without --fixture"
+    )
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    if args.fixture:
+        data = json.loads(args.fixture.read_bytes())
+    else:
+        data = synthetic_tickets(args.items)
+    body = json.dumps(data, ensure_ascii=False).encode("utf-8")
+    megabytes = len(body) / 1024 / 1024
+    print(f"{len(data)} itens, {megabytes:.1f} MiB")
+
+    print(f"{'BACKEND':<8} {'OPERATION':<10} {'MS':>9} {'MIB/S':>9}")
+    for name in available_backends():
+        loads, dumps = load_backend(name)
+        operations = {
+            "loads": lambda: loads(body),
+            "indent": lambda: dumps(data, indent=True),
+            "compact": lambda: dumps(data),
+            "ndjson": lambda: "\n".join(dumps(item) for item in data),
+        }
+        for operation, func in operations.items():
+            seconds = median_of(args.runs, func)
+            print(
+                f"{name:<8} {operation:<10} {seconds * 1000:>9.1f} {megabytes / seconds:>9.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+"""Latency and payload size of get_item expansion profiles.
+
+Runs against the local fake server by default, or against the GLPI instance
+from your configuration with --live.
+
+Usage:
+    python benchmarks/bench_profiles.py [--requests 50] [--fixture computer.json]
+    python benchmarks/bench_profiles.py --live --itemtype Computer --id 42
+"""
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from glpi_cli.client import GLPIClient  # noqa: E402
+from glpi_cli.expansions import EXPANSION_PROFILES  # noqa: E402
+from glpi_cli.config import Config  # noqa: E402
+
+from fake_glpi import make_server  # noqa: E402
+
+
+def percentile(values, pct: float) -> float:
+    """Nearest-rank percentile of a list of numbers."""
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def run_profile(client: GLPIClient, itemtype: str, item_id: int, profile: str, requests: int):
+    """Fetch the same item repeatedly and collect latency and wire size."""
+    sizes = []
+
+    def record_size(response, *args, **kwargs):
+        sizes.append(len(response.content))
+
+    client.http.hooks["response"] = [record_size]
+
+    latencies = []
+    for _ in range(requests):
+        started = time.perf_counter()
+        client.get_item(itemtype, item_id, use_cache=False, profile=profile)
+        latencies.append((time.perf_counter() - started) * 1000)
+
+    client.http.hooks["response"] = []
+    return latencies, sizes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=50, help="Requests per profile")
+    parser.add_argument("--itemtype", default="Computer")
+    parser.add_argument("--id", type=int, default=42)
+    parser.add_argument("--fixture", help="Recorded item JSON for the fake server")
+    parser.add_argument("--live", action="store_true", help="Use the configured GLPI instance")
+    args = parser.parse_args()
+
+    config = Config()
+    server = None
+    if not args.live:
+        fixture = None
+        if args.fixture:
+            with open(args.fixture, "r", encoding="utf-8") as f:
+                fixture = json.load(f)
+        server, config.url = make_server(fixture=fixture)
+        config.app_token = config.user_token = "bench"
+
+    client = GLPIClient(config)
+    client.init_session()
+    try:
+        print(f"{'perfil':<10} {'média ms':>9} {'p50 ms':>8} {'p95 ms':>8} {'KiB/req':>9}")
+        for profile in EXPANSION_PROFILES:
+            latencies, sizes = run_profile(client, args.itemtype, args.id, profile, args.requests)
+            print(
+                f"{profile:<10} {statistics.mean(latencies):>9.1f} "
+                f"{percentile(latencies, 50):>8.1f} {percentile(latencies, 95):>8.1f} "
+                f"{statistics.mean(sizes) / 1024:>9.1f}"
+            )
+    finally:
+        client.kill_session()
+        client.close()
+        if server:
+            server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
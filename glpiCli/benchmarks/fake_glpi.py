@@ -0,0 +1,693 @@
+# -*- coding: utf-8 -*-
+"""Local stand-in for the GLPI REST API, used by the benchmarks.
+
+Serves initSession/killSession and:
+
+- GET /:itemtype/:id, with with_<name>=true expansions and ETag/If-None-Match
+- GET /:itemtype with range, sort/order, searchText[field] and Content-Range;
+  dropdown IDs are replaced by names unless expand_dropdowns=false
+- GET /search/:itemtype with criteria (nested groups included), forcedisplay
+  and range, answering totalcount
+- POST/PUT/DELETE /:itemtype with an input object or array, answering one
+  result per item (207 when some fail)
+- GET /:itemtype/:id/Item_<Itemtype> (and <Itemtype>_Item), linking two Computers
+- PluginFields<Itemtype>fingerprint collections for the fingerprint commands
+
+Every itemtype holds --items synthetic rows, created on first use; writes
+change them for the lifetime of the server. Item documents are synthetic by
+default, or loaded from a recorded response (`glpi get computer 42 --json >
+computer.json`). Each expansion adds a fixed delay to mimic the extra joins
+GLPI runs, and every listed or written row a smaller one.
+
+Failures can be injected: --error-rate answers a random share of API
+requests with --error-status, and --max-in-flight answers 503 while more
+requests than that are being served. Session endpoints never fail.
+
+Usage:
+    python benchmarks/fake_glpi.py --port 8080 [--fixture computer.json] [--items 5000]
+    python benchmarks/fake_glpi.py --error-rate 0.05 --max-in-flight 8
+"""
+import argparse
+import functools
+import json
+import random
+import re
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+SESSION_TOKEN = "fake-session-token"
+
+EXPANSION_KEYS = (
+    "devices",
+    "disks",
+    "softwares",
+    "connections",
+    "networkports",
+    "infocoms",
+    "contracts",
+    "documents",
+    "tickets",
+    "problems",
+    "changes",
+    "notes",
+    "logs",
+)
+
+# Search option ID -> row field, as in GLPI's default search options
+SEARCH_OPTIONS = {
+    1: "name",
+    2: "id",
+    7: "itilcategories_id",
+    12: "status",
+    15: "date",
+    17: "solvedate",
+    19: "date_mod",
+    80: "entities_id",
+}
+PLUGIN_SEARCH_OPTIONS = {1: "id", 2: "fingerprint", 3: "items_id"}
+
+# Foreign key -> dropdown itemtype, replaced by the row name unless expand_dropdowns=false
+DROPDOWN_FIELDS = {
+    "entities_id": "Entity",
+    "locations_id": "Location",
+    "itilcategories_id": "ITILCategory",
+    "users_id_recipient": "User",
+}
+
+_PLUGIN_ITEMTYPE = re.compile(r"^PluginFields(\w+)fingerprint$")
+_BRACKETS = re.compile(r"\[([^\]]*)\]")
+
+_EPOCH = datetime(2025, 1, 1, 8, 0, 0)
+
+
+@functools.lru_cache(maxsize=256)
+def synthetic_item(item_id: int) -> Dict[str, Any]:
+    """Build a fully expanded, Computer-like document.
+
+    Documents are cached (the benchmark client shares the process and the
+    GIL with the server); callers must not modify them.
+
+    Args:
+        item_id: ID of the item
+
+    Returns:
+        Document with every `_<expansion>` block filled
+    """
+    item: Dict[str, Any] = {
+        "id": item_id,
+        "name": f"srv-{item_id:05d}",
+        "entities_id": "Root entity > TI",
+        "serial": f"SN{item_id:08d}",
+        "otherserial": f"PAT-{item_id}",
+        "states_id": "Em produção",
+        "locations_id": "Datacenter SP > Rack 12",
+        "users_id_tech": "suporte.n2",
+        "groups_id_tech": "Infraestrutura",
+        "comment": "Servidor de aplicação",
+        "date_mod": "2026-01-15 10:32:11",
+        "date_creation": "2024-03-02 08:00:00",
+    }
+    item["_devices"] = {
+        "Item_DeviceProcessor": {
+            str(n): {"id": n, "designation": "Intel Xeon Gold 6338", "frequency": 2000}
+            for n in range(2)
+        },
+        "Item_DeviceMemory": {
+            str(n): {"id": n, "designation": "DDR4 32GB", "size": 32768} for n in range(8)
+        },
+        "Item_DeviceHardDrive": {
+            str(n): {"id": n, "designation": "SSD 960GB", "capacity": 960000} for n in range(4)
+        },
+    }
+    item["_disks"] = [
+        {"id": n, "name": f"/dev/sda{n}", "mountpoint": f"/data{n}", "totalsize": 500000}
+        for n in range(4)
+    ]
+    item["_softwares"] = [
+        {
+            "softwares_id": n,
+            "name": f"package-{n}",
+            "softwareversions_id": f"{n % 7}.{n % 13}.{n % 5}",
+            "date_install": "2025-06-01",
+        }
+        for n in range(400)
+    ]
+    item["_connections"] = {"Monitor": [{"id": n, "name": f"MON-{n}"} for n in range(2)]}
+    item["_networkports"] = {
+        "NetworkPortEthernet": [
+            {
+                "id": n,
+                "name": f"eth{n}",
+                "mac": f"00:50:56:00:{n:02x}:{item_id % 256:02x}",
+                "NetworkName": {"FQDN": "corp.local", "IPAddress": [f"10.0.{n}.{item_id % 254}"]},
+            }
+            for n in range(4)
+        ]
+    }
+    item["_infocoms"] = {"buy_date": "2024-02-20", "value": "45000.00", "warranty_duration": 36}
+    # Contract_Item rows: id is the link, contracts_id the contract
+    item["_contracts"] = [
+        {"id": 100 + n, "contracts_id": n + 1, "name": f"Suporte 24x7 #{n}"} for n in range(2)
+    ]
+    item["_documents"] = [{"id": n, "filename": f"nf-{n}.pdf"} for n in range(3)]
+    item["_tickets"] = [{"id": n, "name": f"Incidente {n}", "status": 6} for n in range(40)]
+    item["_problems"] = [{"id": n, "name": f"Problema {n}"} for n in range(5)]
+    item["_changes"] = [{"id": n, "name": f"Mudança {n}"} for n in range(10)]
+    item["_notes"] = [{"id": n, "content": "Observação " * 20} for n in range(3)]
+    item["_logs"] = [
+        {"id": n, "date_mod": "2025-01-01 00:00:00", "old_value": "a", "new_value": "b"}
+        for n in range(300)
+    ]
+    return item
+
+
+def _timestamp(moment: datetime) -> str:
+    return moment.strftime("%Y-%m-%d %H:%M:%S")
+
+
+def synthetic_row(itemtype: str, item_id: int) -> Dict[str, Any]:
+    """Build the stored row of an item, with raw dropdown IDs.
+
+    date_mod grows with the ID, so sorting by either gives the same order.
+    Solved and closed rows (status 5 and 6) have a solvedate 1-48 hours
+    after their date.
+
+    Args:
+        itemtype: Type of the item
+        item_id: ID of the item
+
+    Returns:
+        Flat item dictionary
+    """
+    plugin = _PLUGIN_ITEMTYPE.match(itemtype)
+    if plugin:
+        return {
+            "id": item_id,
+            "items_id": item_id,
+            "itemtype": plugin.group(1),
+            "fingerprint": f"fp-{item_id:06d}",
+        }
+
+    created = _EPOCH + timedelta(minutes=37 * item_id)
+    return {
+        "id": item_id,
+        "name": f"{itemtype.lower()}-{item_id:05d}",
+        "entities_id": item_id % 3 + 1,
+        "locations_id": item_id % 20 + 1,
+        "status": item_id % 6 + 1,
+        "itilcategories_id": item_id % 12 + 1,
+        "urgency": item_id % 5 + 1,
+        "users_id_recipient": item_id % 50 + 1,
+        "date": _timestamp(created),
+        "date_mod": _timestamp(created + timedelta(minutes=item_id % 30)),
+        "solvedate": (
+            _timestamp(created + timedelta(hours=item_id % 48 + 1))
+            if item_id % 6 + 1 >= 5
+            else None
+        ),
+    }
+
+
+class Dataset:
+    """Synthetic rows per itemtype, shared by all request threads."""
+
+    def __init__(self, size: int):
+        """Initialize an empty dataset.
+
+        Args:
+            size: Rows created for each itemtype on first use
+        """
+        self.size = size
+        self._tables: Dict[str, Dict[int, Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+
+    def _table(self, itemtype: str) -> Dict[int, Dict[str, Any]]:
+        """Rows of an itemtype by ID (caller holds the lock)."""
+        table = self._tables.get(itemtype)
+        if table is None:
+            table = {i: synthetic_row(itemtype, i) for i in range(1, self.size + 1)}
+            self._tables[itemtype] = table
+        return table
+
+    def get(self, itemtype: str, item_id: int) -> Optional[Dict[str, Any]]:
+        """Get one row (None if missing)."""
+        with self._lock:
+            return self._table(itemtype).get(item_id)
+
+    def rows(self, itemtype: str) -> List[Dict[str, Any]]:
+        """Snapshot of every row, in ID order."""
+        with self._lock:
+            return [*self._table(itemtype).values()]
+
+    def add(self, itemtype: str, fields: Dict[str, Any]) -> int:
+        """Insert a row and return its new ID."""
+        with self._lock:
+            table = self._table(itemtype)
+            item_id = max(table, default=0) + 1
+            table[item_id] = {
+                **synthetic_row(itemtype, item_id),
+                **fields,
+                "id": item_id,
+                "date_mod": _timestamp(datetime.now()),
+            }
+            return item_id
+
+    def update(self, itemtype: str, fields: Dict[str, Any]) -> bool:
+        """Change the fields of an existing row (fields must hold its id)."""
+        with self._lock:
+            row = self._table(itemtype).get(_as_int(fields.get("id")))
+            if row is None:
+                return False
+            row.update(fields, id=row["id"], date_mod=_timestamp(datetime.now()))
+            return True
+
+    def delete(self, itemtype: str, item_id: Any) -> bool:
+        """Remove a row."""
+        with self._lock:
+            return self._table(itemtype).pop(_as_int(item_id), None) is not None
+
+
+def _as_int(value: Any) -> Optional[int]:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _nested_params(query: Dict[str, str], prefix: str) -> List[Dict[str, Any]]:
+    """Rebuild prefix[0][field]=... parameters into a list of dictionaries."""
+    root: Dict[str, Any] = {}
+    for key, value in query.items():
+        if not key.startswith(prefix + "["):
+            continue
+        node = root
+        path = _BRACKETS.findall(key[len(prefix) :])
+        for segment in path[:-1]:
+            node = node.setdefault(segment, {})
+        node[path[-1]] = value
+
+    def to_list(node: Dict[str, Any]) -> List[Dict[str, Any]]:
+        items = []
+        for _, item in sorted(node.items(), key=lambda pair: _as_int(pair[0]) or 0):
+            if isinstance(item.get("criteria"), dict):
+                item["criteria"] = to_list(item["criteria"])
+            items.append(item)
+        return items
+
+    return to_list(root)
+
+
+def _matches(row: Dict[str, Any], criteria: List[Dict[str, Any]], options: Dict[int, str]) -> bool:
+    """Evaluate search criteria left to right, as GLPI chains their links."""
+    result = True
+    for i, item in enumerate(criteria):
+        if "itemtype" in item:
+            # Meta criteria on linked itemtypes aren't modelled
+            continue
+        if "criteria" in item:
+            matched = _matches(row, item["criteria"], options)
+        else:
+            value = row.get(options.get(_as_int(item.get("field")) or 0, ""), "")
+            matched = _compare(value, item.get("searchtype", "contains"), item.get("value", ""))
+
+        link = item.get("link", "AND") if i else "AND"
+        if link.endswith("NOT"):
+            matched = not matched
+        result = (result or matched) if link.startswith("OR") else (result and matched)
+    return result
+
+
+def _compare(value: Any, searchtype: str, expected: str) -> bool:
+    text = "" if value is None else str(value)
+    if searchtype == "equals":
+        return text == expected
+    if searchtype == "notequals":
+        return text != expected
+    if searchtype in ("lessthan", "morethan"):
+        left: Any = _as_int(text)
+        right: Any = _as_int(expected)
+        if left is None or right is None:
+            left, right = text, expected
+        return left < right if searchtype == "lessthan" else left > right
+    return expected.lower() in text.lower()
+
+
+def _range(query: Dict[str, str], default_limit: int) -> Tuple[int, int]:
+    """Parse range=start-end into (start, end)."""
+    start, _, end = query.get("range", f"0-{default_limit - 1}").partition("-")
+    first = _as_int(start) or 0
+    last = _as_int(end)
+    return first, last if last is not None else first + default_limit - 1
+
+
+class FakeGLPIHandler(BaseHTTPRequestHandler):
+    """Request handler; server attributes hold the data, delays and failure knobs."""
+
+    protocol_version = "HTTP/1.1"
+    # Send headers and body in one segment; otherwise delayed ACKs add ~40ms
+    wbufsize = -1
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        """Keep benchmark output quiet."""
+
+    def _send_json(self, status: int, body: Any, headers: Optional[Dict[str, str]] = None):
+        payload = b"" if status == 304 else json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=UTF-8")
+        self.send_header("Content-Length", str(len(payload)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _count(self, name: str):
+        with self.server.lock:
+            self.server.counters[name] += 1
+
+    def _read_body(self) -> Any:
+        length = int(self.headers.get("Content-Length") or 0)
+        if not length:
+            return {}
+        try:
+            return json.loads(self.rfile.read(length))
+        except ValueError:
+            return {}
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def do_PUT(self):
+        self._dispatch("PUT")
+
+    def do_DELETE(self):
+        self._dispatch("DELETE")
+
+    def _dispatch(self, method: str):
+        url = urlparse(self.path)
+        query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        parts = [part for part in url.path.split("/") if part]
+        if parts and parts[0].endswith(".php"):
+            parts = parts[1:]
+        body = self._read_body() if method != "GET" else {}
+
+        if parts == ["initSession"]:
+            self._count("initSession")
+            return self._send_json(200, {"session_token": SESSION_TOKEN})
+
+        if self.headers.get("Session-Token") != SESSION_TOKEN:
+            return self._send_json(401, ["ERROR_SESSION_TOKEN_INVALID", "session_token inválido"])
+
+        if parts == ["killSession"]:
+            self._count("killSession")
+            return self._send_json(200, {})
+
+        server = self.server
+        with server.lock:
+            server.in_flight += 1
+            overloaded = server.max_in_flight and server.in_flight > server.max_in_flight
+        try:
+            if overloaded or random.random() < server.error_rate:
+                self._count("injected_errors")
+                time.sleep(server.base_latency)
+                status = 503 if overloaded else server.error_status
+                return self._send_json(status, ["ERROR", "Falha injetada pelo servidor falso"])
+            return self._route(method, parts, query, body)
+        finally:
+            with server.lock:
+                server.in_flight -= 1
+
+    def _route(self, method: str, parts: List[str], query: Dict[str, str], body: Any):
+        if method == "GET" and len(parts) == 2 and parts[0] == "search":
+            self._count("search")
+            return self._search(parts[1], query)
+        if method == "GET" and len(parts) == 2 and parts[1].isdigit():
+            self._count("item")
+            return self._get_item(parts[0], int(parts[1]), query)
+        if method == "GET" and len(parts) == 3 and parts[1].isdigit():
+            self._count("linked")
+            return self._list_linked(parts[0], int(parts[1]), parts[2])
+        if method == "GET" and len(parts) == 1:
+            self._count("collection")
+            return self._list(parts[0], query)
+        if method != "GET" and parts:
+            self._count(method)
+            return self._write(method, parts[0], body)
+
+        return self._send_json(400, ["ERROR_RESOURCE_NOT_FOUND_NOR_COMMONDBTM", "rota inválida"])
+
+    def _expand_dropdowns(self, rows: List[Dict[str, Any]], query: Dict[str, str]):
+        """Replace dropdown IDs by names, as GLPI does unless expand_dropdowns=false."""
+        if query.get("expand_dropdowns") == "false":
+            return rows
+
+        dataset = self.server.dataset
+        expanded = []
+        for row in rows:
+            row = dict(row)
+            for field, itemtype in DROPDOWN_FIELDS.items():
+                if isinstance(row.get(field), int):
+                    target = dataset.get(itemtype, row[field])
+                    row[field] = target["name"] if target else ""
+            expanded.append(row)
+        time.sleep(self.server.expand_latency * len(rows))
+        return expanded
+
+    def _get_item(self, itemtype: str, item_id: int, query: Dict[str, str]):
+        row = self.server.dataset.get(itemtype, item_id)
+        if row is None:
+            time.sleep(self.server.base_latency)
+            return self._send_json(404, ["ERROR_ITEM_NOT_FOUND", "Item não encontrado"])
+
+        etag = f'"{item_id}-{row.get("date_mod")}"'
+        if self.headers.get("If-None-Match") == etag:
+            time.sleep(self.server.base_latency)
+            return self._send_json(304, None, {"ETag": etag})
+
+        if _PLUGIN_ITEMTYPE.match(itemtype):
+            document = dict(row)
+        else:
+            document = {**(self.server.fixture or synthetic_item(item_id)), **row}
+        (document,) = self._expand_dropdowns([document], query)
+
+        expansions = [name for name in EXPANSION_KEYS if query.get(f"with_{name}") == "true"]
+        body = {key: value for key, value in document.items() if not key.startswith("_")}
+        for name in expansions:
+            if f"_{name}" in document:
+                body[f"_{name}"] = document[f"_{name}"]
+
+        time.sleep(self.server.base_latency + self.server.join_latency * len(expansions))
+        return self._send_json(200, body, {"ETag": etag})
+
+    def _list(self, itemtype: str, query: Dict[str, str]):
+        rows = self.server.dataset.rows(itemtype)
+        for key, value in query.items():
+            match = re.fullmatch(r"searchText\[(\w+)\]", key)
+            if match:
+                rows = [row for row in rows if _compare(row.get(match.group(1)), "contains", value)]
+
+        sort = query.get("sort")
+        descending = query.get("order", "ASC").upper() == "DESC"
+        if sort and sort != "id":
+            rows.sort(key=lambda row: str(row.get(sort) or ""), reverse=descending)
+        elif descending:
+            rows.reverse()
+
+        total = len(rows)
+        start, end = _range(query, 50)
+        if total and start >= total:
+            time.sleep(self.server.base_latency)
+            return self._send_json(
+                400, ["ERROR_RANGE_EXCEED_TOTAL", "Range fora do total de itens"]
+            )
+
+        page = self._expand_dropdowns(rows[start : end + 1], query)
+        time.sleep(self.server.base_latency + self.server.item_latency * len(page))
+        status = 206 if start + len(page) < total else 200
+        last = start + max(len(page) - 1, 0)
+        return self._send_json(status, page, {"Content-Range": f"{start}-{last}/{total}"})
+
+    def _list_linked(self, itemtype: str, item_id: int, sub_itemtype: str):
+        """Sub-resource such as Ticket/:id/Item_Ticket: two linked Computers."""
+        if self.server.dataset.get(itemtype, item_id) is None:
+            time.sleep(self.server.base_latency)
+            return self._send_json(404, ["ERROR_ITEM_NOT_FOUND", "Item não encontrado"])
+
+        rows = []
+        if sub_itemtype.startswith("Item_") or sub_itemtype.endswith("_Item"):
+            size = max(self.server.dataset.size, 1)
+            rows = [
+                {
+                    "id": item_id * 2 + n,
+                    "itemtype": "Computer",
+                    "items_id": (item_id * 7 + n) % size + 1,
+                    f"{itemtype.lower()}s_id": item_id,
+                }
+                for n in range(2)
+            ]
+
+        time.sleep(self.server.base_latency + self.server.item_latency * len(rows))
+        last = max(len(rows) - 1, 0)
+        return self._send_json(200, rows, {"Content-Range": f"0-{last}/{len(rows)}"})
+
+    def _search(self, itemtype: str, query: Dict[str, str]):
+        options = PLUGIN_SEARCH_OPTIONS if _PLUGIN_ITEMTYPE.match(itemtype) else SEARCH_OPTIONS
+        criteria = _nested_params(query, "criteria")
+        rows = self.server.dataset.rows(itemtype)
+        rows = [row for row in rows if _matches(row, criteria, options)]
+
+        # Like GLPI: default columns, then criteria fields, then forcedisplay
+        columns = [1, 2]
+        columns += [_as_int(c.get("field")) for c in criteria if "field" in c]
+        columns += [_as_int(v) for k, v in sorted(query.items()) if k.startswith("forcedisplay[")]
+        columns = [c for c in dict.fromkeys(columns) if c in options]
+
+        total = len(rows)
+        start, end = _range(query, 20)
+        page = [{str(c): row.get(options[c]) for c in columns} for row in rows[start : end + 1]]
+        time.sleep(self.server.base_latency + self.server.item_latency * len(page))
+        status = 206 if start + len(page) < total else 200
+        return self._send_json(
+            status,
+            {
+                "totalcount": total,
+                "count": len(page),
+                "sort": [1],
+                "order": ["ASC"],
+                "data": page,
+            },
+            {"Content-Range": f"{start}-{start + max(len(page) - 1, 0)}/{total}"},
+        )
+
+    def _write(self, method: str, itemtype: str, body: Any):
+        inputs = body.get("input") if isinstance(body, dict) else None
+        single = isinstance(inputs, dict)
+        items = [inputs] if single else inputs
+        if not isinstance(items, list):
+            time.sleep(self.server.base_latency)
+            return self._send_json(400, ["ERROR_BAD_ARRAY", "input ausente"])
+
+        dataset = self.server.dataset
+        answers = []
+        failed = False
+        for item in items:
+            if method == "POST":
+                answers.append({"id": dataset.add(itemtype, item), "message": ""})
+                continue
+            item_id = item.get("id") if isinstance(item, dict) else None
+            if method == "PUT":
+                ok = dataset.update(itemtype, item)
+            else:
+                ok = dataset.delete(itemtype, item_id)
+            answers.append({str(item_id): ok, "message": "" if ok else "Item não encontrado"})
+            failed = failed or not ok
+
+        time.sleep(self.server.base_latency + self.server.item_latency * len(items))
+        status = 207 if failed else 201 if method == "POST" else 200
+        return self._send_json(status, answers[0] if single else answers)
+
+
+def make_server(
+    port: int = 0,
+    fixture: Optional[Dict[str, Any]] = None,
+    base_latency: float = 0.002,
+    join_latency: float = 0.004,
+    items: int = 1000,
+    item_latency: float = 0.00002,
+    error_rate: float = 0.0,
+    error_status: int = 503,
+    max_in_flight: int = 0,
+    expand_latency: float = 0.00001,
+) -> Tuple[ThreadingHTTPServer, str]:
+    """Start the fake server in a background thread.
+
+    The keyword arguments become server attributes of the same name and may
+    be changed while it runs; server.counters counts requests per route
+    (initSession, item, collection, search, POST, PUT, DELETE) and injected
+    errors (injected_errors).
+
+    Args:
+        port: TCP port (0 picks a free one)
+        fixture: Recorded item document served for every ID (default: synthetic)
+        base_latency: Seconds added to every API request
+        join_latency: Seconds added per requested expansion
+        items: Synthetic rows per itemtype
+        item_latency: Seconds added per row listed, searched or written
+        error_rate: Share of API requests answered with error_status
+        error_status: HTTP status of injected errors
+        max_in_flight: Answer 503 above this many concurrent requests (0 = no limit)
+        expand_latency: Seconds added per row whose dropdown IDs are expanded
+
+    Returns:
+        Tuple of (server, API base URL); call server.shutdown() when done
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", port), FakeGLPIHandler)
+    server.daemon_threads = True
+    server.fixture = fixture
+    server.base_latency = base_latency
+    server.join_latency = join_latency
+    server.item_latency = item_latency
+    server.error_rate = error_rate
+    server.error_status = error_status
+    server.max_in_flight = max_in_flight
+    server.expand_latency = expand_latency
+    server.dataset = Dataset(items)
+    server.counters = Counter()
+    server.in_flight = 0
+    server.lock = threading.Lock()
+
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    url = f"http://127.0.0.1:{server.server_address[1]}/apirest.php"
+    return server, url
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--fixture", help="Recorded item JSON served for every ID")
+    parser.add_argument("--items", type=int, default=1000, help="Synthetic rows per itemtype")
+    parser.add_argument("--base-latency", type=float, default=0.002)
+    parser.add_argument("--join-latency", type=float, default=0.004)
+    parser.add_argument("--item-latency", type=float, default=0.00002)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--error-status", type=int, default=503)
+    parser.add_argument("--max-in-flight", type=int, default=0)
+    parser.add_argument("--expand-latency", type=float, default=0.00001)
+    args = parser.parse_args()
+
+    fixture = None
+    if args.fixture:
+        with open(args.fixture, "r", encoding="utf-8") as f:
+            fixture = json.load(f)
+
+    server, url = make_server(
+        args.port,
+        fixture,
+        args.base_latency,
+        args.join_latency,
+        items=args.items,
+        item_latency=args.item_latency,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        max_in_flight=args.max_in_flight,
+        expand_latency=args.expand_latency,
+    )
+    print(f"Fake GLPI em {url} (Ctrl+C para sair)")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
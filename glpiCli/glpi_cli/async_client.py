@@ -0,0 +1,246 @@
+# -*- coding: utf-8 -*-
+"""asyncio interface to the GLPI API for high fan-out automation.
+
+AsyncGLPIClient exposes the GLPIClient methods as coroutines. Calls run on a
+dedicated thread pool over the same pooled requests.Session, so both clients
+share one implementation (retries, session renewal, response cache) and
+stay in step. A semaphore caps the number of requests in flight.
+
+Example:
+    async with AsyncGLPIClient(Config(), concurrency=32) as glpi:
+        tickets = await asyncio.gather(*(glpi.get_item("Ticket", i) for i in ids))
+"""
+import asyncio
+import functools
+import itertools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .client import GLPIClient
+from .config import Config
+from .errors import GLPIError
+
+DEFAULT_CONCURRENCY = 16
+
+
+class AsyncGLPIClient:
+    """Coroutine-based GLPI client with a concurrency limit."""
+
+    def __init__(self, config: Config, concurrency: int = DEFAULT_CONCURRENCY, **client_options):
+        """Initialize async GLPI client.
+
+        Args:
+            config: Configuration with URL and tokens
+            concurrency: Max requests in flight (the connection pool is sized to match)
+            **client_options: Extra GLPIClient keyword arguments (e.g., response_cache)
+        """
+        client_options.setdefault("pool_size", max(config.pool_size, concurrency))
+        self.client = GLPIClient(config, **client_options)
+        self.concurrency = concurrency
+        self._executor = ThreadPoolExecutor(
+            max_workers=concurrency, thread_name_prefix="glpi-async"
+        )
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    async def __aenter__(self) -> "AsyncGLPIClient":
+        await self.init_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+
+    async def _call(self, func, *args, **kwargs):
+        """Run a blocking client method on the pool, within the concurrency limit."""
+        # Created lazily so it binds to the running loop
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+
+        async with self._semaphore:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._executor, functools.partial(func, *args, **kwargs)
+            )
+
+    @property
+    def session_token(self) -> Optional[str]:
+        """Current GLPI session token."""
+        return self.client.session_token
+
+    async def init_session(self):
+        """Initialize GLPI session (see GLPIClient.init_session)."""
+        await self._call(self.client.init_session)
+
+    async def kill_session(self, force: bool = False):
+        """Kill current GLPI session (see GLPIClient.kill_session)."""
+        await self._call(self.client.kill_session, force)
+
+    async def aclose(self):
+        """Kill the session and release connections, even if cancelled.
+
+        The session is killed in a shielded task so cancelling the caller
+        doesn't leave it open on the server; connections are released only
+        once that task is done.
+        """
+        kill = asyncio.ensure_future(self._call(self.client.kill_session))
+        try:
+            await asyncio.shield(kill)
+        except GLPIError:
+            pass
+        finally:
+            if kill.done():
+                self._release(kill)
+            else:
+                kill.add_done_callback(self._release)
+
+    def _release(self, kill: "asyncio.Future"):
+        """Shut down the pool and close the HTTP session after kill_session."""
+        if not kill.cancelled():
+            # Retrieved so a failure after cancellation isn't logged as unhandled
+            kill.exception()
+        self._executor.shutdown(wait=False)
+        self.client.close()
+
+    async def get_item(self, itemtype: str, item_id: int, **kwargs) -> Dict[str, Any]:
+        """Get a single item (see GLPIClient.get_item)."""
+        return await self._call(self.client.get_item, itemtype, item_id, **kwargs)
+
+    async def get_items(
+        self, itemtype: str, item_ids: Iterable[int], **kwargs
+    ) -> List[Tuple[int, Optional[Dict[str, Any]], Optional[GLPIError]]]:
+        """Fetch many items concurrently, collecting per-item failures.
+
+        Args:
+            itemtype: Type of item
+            item_ids: IDs to fetch
+            **kwargs: Additional get_item arguments
+
+        Returns:
+            List of (item_id, item or None, GLPIError or None) in input order
+        """
+
+        async def fetch(item_id: int):
+            try:
+                return item_id, await self.get_item(itemtype, item_id, **kwargs), None
+            except GLPIError as e:
+                return item_id, None, e
+
+        return await asyncio.gather(*(fetch(item_id) for item_id in item_ids))
+
+    async def list_items(
+        self, itemtype: str, range_start: int = 0, range_limit: int = 50, **params
+    ) -> List[Dict[str, Any]]:
+        """List one range window (see GLPIClient.list_items)."""
+        return await self._call(
+            self.client.list_items, itemtype, range_start, range_limit, **params
+        )
+
+    async def iter_items(
+        self, itemtype: str, page_size: int = 50, **params
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Iterate over every item of an itemtype.
+
+        Runs GLPIClient.iter_items on the pool: after the first page reveals
+        the total, up to 2 * concurrency pages are fetched ahead; items are
+        yielded in server order.
+
+        Args:
+            itemtype: Type of items
+            page_size: Number of items requested per range window
+            **params: Additional query parameters
+
+        Yields:
+            Items in server order
+        """
+        items = self.client.iter_items(
+            itemtype, page_size, concurrency=self.concurrency, **params
+        )
+        async for item in self._iter_pages(items, page_size):
+            yield item
+
+    async def search_items(
+        self, itemtype: str, criteria: Optional[List[Dict]] = None, **kwargs
+    ) -> List[Dict[str, Any]]:
+        """Search items (see GLPIClient.search_items)."""
+        return await self._call(self.client.search_items, itemtype, criteria, **kwargs)
+
+    async def add_items(self, itemtype: str, items: Iterable[Dict[str, Any]], **kwargs) -> List:
+        """Create items in batches (see GLPIClient.add_items).
+
+        Returns:
+            List of (input item, new ID or None, GLPIError or None) in input order
+        """
+        return await self._call(lambda: [*self.client.add_items(itemtype, items, **kwargs)])
+
+    async def update_items(
+        self, itemtype: str, items: Iterable[Dict[str, Any]], **kwargs
+    ) -> List:
+        """Update items in batches (see GLPIClient.update_items)."""
+        return await self._call(lambda: [*self.client.update_items(itemtype, items, **kwargs)])
+
+    async def delete_items(
+        self, itemtype: str, items: Iterable[Dict[str, Any]], **kwargs
+    ) -> List:
+        """Delete items in batches (see GLPIClient.delete_items)."""
+        return await self._call(lambda: [*self.client.delete_items(itemtype, items, **kwargs)])
+
+    async def get_fingerprint(self, itemtype: str, item_id: int) -> Dict[str, Any]:
+        """Get fingerprint data of an item (see GLPIClient.get_fingerprint)."""
+        return await self._call(self.client.get_fingerprint, itemtype, item_id)
+
+    async def list_fingerprints(
+        self, itemtype: str, range_start: int = 0, range_limit: int = 50, **params
+    ) -> List[Dict[str, Any]]:
+        """List one range window of fingerprints (see GLPIClient.list_fingerprints)."""
+        return await self._call(
+            self.client.list_fingerprints, itemtype, range_start, range_limit, **params
+        )
+
+    async def iter_fingerprints(
+        self, itemtype: str, page_size: int = 50, **params
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Iterate over every fingerprint record of an item type."""
+        items = self.client.iter_fingerprints(
+            itemtype, page_size, concurrency=self.concurrency, **params
+        )
+        async for item in self._iter_pages(items, page_size):
+            yield item
+
+    async def search_fingerprint(
+        self, itemtype: str, fingerprint_value: str
+    ) -> List[Dict[str, Any]]:
+        """Search by fingerprint value (see GLPIClient.search_fingerprint)."""
+        return await self._call(self.client.search_fingerprint, itemtype, fingerprint_value)
+
+    async def _iter_pages(
+        self, items: Iterator[Dict[str, Any]], page_size: int
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Drive a GLPIClient item iterator from the pool, one page per hop.
+
+        The sync iterator does the range walking and read-ahead, so both
+        clients share one pagination implementation.
+        """
+        lock = threading.Lock()
+
+        def next_page() -> List[Dict[str, Any]]:
+            with lock:
+                return list(itertools.islice(items, max(page_size, 1)))
+
+        def close():
+            # Waits for a page still being fetched if the consumer was cancelled
+            with lock:
+                items.close()
+
+        try:
+            while True:
+                page = await self._call(next_page)
+                if not page:
+                    return
+                for item in page:
+                    yield item
+        finally:
+            try:
+                self._executor.submit(close)
+            except RuntimeError:
+                # Pool already shut down by aclose(); the client is closed too
+                pass
@@ -0,0 +1,238 @@
+# -*- coding: utf-8 -*-
+"""Local response cache for GLPI item lookups.
+
+Responses are stored zlib-compressed in a SQLite file under the GLPI CLI
+cache directory, keyed by GLPI URL, user token, itemtype, ID and query
+parameters, so several servers and users can share the file. Entries younger
+than the TTL are served directly; older ones are revalidated against the
+server (ETag or date_mod) before being reused; the default TTL of 0 always
+revalidates. Writes through GLPIClient drop the entries of the items they
+touch. The file is kept under a size budget by evicting least recently used
+entries.
+"""
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Iterable, NamedTuple, Optional
+
+from . import fast_json
+from .config import DEFAULT_CACHE_MAX_MB, DEFAULT_CACHE_TTL
+from .session_cache import default_cache_dir
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    itemtype TEXT NOT NULL,
+    item_id INTEGER NOT NULL,
+    date_mod TEXT,
+    etag TEXT,
+    body BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    stored_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_responses_accessed_at ON responses (accessed_at);
+CREATE INDEX IF NOT EXISTS idx_responses_item ON responses (itemtype, item_id);
+"""
+
+
+class CacheEntry(NamedTuple):
+    """Cached response for one item."""
+
+    data: Dict[str, Any]
+    date_mod: Optional[str]
+    etag: Optional[str]
+    fresh: bool
+
+
+class ResponseCache:
+    """SQLite-backed, size-bounded LRU cache of item responses."""
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        ttl: int = DEFAULT_CACHE_TTL,
+        max_bytes: int = DEFAULT_CACHE_MAX_MB * 1024 * 1024,
+    ):
+        """Initialize response cache.
+
+        Args:
+            path: SQLite file (default: <cache dir>/responses.sqlite)
+            ttl: Seconds an entry is served without revalidation (0: always revalidate)
+            max_bytes: Compressed size budget before LRU eviction
+        """
+        self.path = path or default_cache_dir() / "responses.sqlite"
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(
+        url: str, user_token: str, itemtype: str, item_id: int, params: Dict[str, Any]
+    ) -> str:
+        """Build the cache key for an item request.
+
+        The URL and user token are part of the key so one server's or user's
+        responses (and their ETags) are never served to another.
+
+        Args:
+            url: GLPI API URL
+            user_token: User token the response was fetched with
+            itemtype: Type of item
+            item_id: ID of the item
+            params: Query parameters sent with the request
+
+        Returns:
+            Hex digest of URL, user token, itemtype, ID and sorted parameters
+        """
+        raw = json.dumps(
+            [url.rstrip("/"), user_token, itemtype, item_id, sorted(params.items())], default=str
+        )
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _connection(self) -> sqlite3.Connection:
+        """Open the database on first use."""
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+            self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            self._conn.executescript(_SCHEMA)
+        return self._conn
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """Look up an entry and mark it as recently used.
+
+        Args:
+            key: Cache key from make_key()
+
+        Returns:
+            CacheEntry or None if not cached
+        """
+        with self._lock:
+            conn = self._connection()
+            row = conn.execute(
+                "SELECT body, date_mod, etag, stored_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            body, date_mod, etag, stored_at = row
+            conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (time.time(), key))
+            conn.commit()
+
+        data = fast_json.loads(zlib.decompress(body))
+        fresh = time.time() - stored_at < self.ttl
+        return CacheEntry(data, date_mod, etag, fresh)
+
+    def put(
+        self,
+        key: str,
+        itemtype: str,
+        item_id: int,
+        data: Dict[str, Any],
+        etag: Optional[str] = None,
+    ):
+        """Store a response and evict old entries if over budget.
+
+        Args:
+            key: Cache key from make_key()
+            itemtype: Type of item
+            item_id: ID of the item
+            data: Decoded response
+            etag: ETag header returned with the response, if any
+        """
+        body = zlib.compress(fast_json.dumps(data).encode("utf-8"))
+        date_mod = data.get("date_mod") if isinstance(data, dict) else None
+        now = time.time()
+
+        with self._lock:
+            conn = self._connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, itemtype, item_id, date_mod, etag, body, size, stored_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, itemtype, item_id, date_mod, etag, body, len(body), now, now),
+            )
+            self._evict(conn)
+            conn.commit()
+
+    def touch(self, key: str):
+        """Restart the TTL of an entry after successful revalidation.
+
+        Args:
+            key: Cache key from make_key()
+        """
+        with self._lock:
+            conn = self._connection()
+            now = time.time()
+            conn.execute(
+                "UPDATE responses SET stored_at = ?, accessed_at = ? WHERE key = ?",
+                (now, now, key),
+            )
+            conn.commit()
+
+    def invalidate(self, itemtype: str, item_ids: Iterable[int]):
+        """Drop every cached response of the given items.
+
+        Entries of all servers, users and query parameters are dropped, since
+        the key can't be rebuilt for the ones this caller didn't fetch.
+
+        Args:
+            itemtype: Type of item
+            item_ids: IDs of the items that changed
+        """
+        rows = [(itemtype, item_id) for item_id in item_ids]
+        if not rows:
+            return
+        with self._lock:
+            conn = self._connection()
+            conn.executemany("DELETE FROM responses WHERE itemtype = ? AND item_id = ?", rows)
+            conn.commit()
+
+    def _evict(self, conn: sqlite3.Connection):
+        """Delete least recently used entries until under max_bytes."""
+        (total,) = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()
+        if total <= self.max_bytes:
+            return
+
+        excess = total - self.max_bytes
+        freed = 0
+        stale_keys = []
+        rows = conn.execute("SELECT key, size FROM responses ORDER BY accessed_at").fetchall()
+        for key, size in rows:
+            stale_keys.append((key,))
+            freed += size
+            if freed >= excess:
+                break
+        conn.executemany("DELETE FROM responses WHERE key = ?", stale_keys)
+
+    def stats(self) -> Dict[str, Any]:
+        """Get entry count and size of the cache.
+
+        Returns:
+            Dictionary with path, entries and bytes
+        """
+        with self._lock:
+            (entries, size) = self._connection().execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+        return {"path": str(self.path), "entries": entries, "bytes": size}
+
+    def clear(self):
+        """Delete every cached response."""
+        with self._lock:
+            conn = self._connection()
+            conn.execute("DELETE FROM responses")
+            conn.commit()
+            conn.execute("VACUUM")
+
+    def close(self):
+        """Close the database."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
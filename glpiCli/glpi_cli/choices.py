@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+"""Choices and defaults of command options implemented by heavier modules.
+
+Kept apart from snapshot.py, stats.py, fingerprint_index.py and mirror.py so
+the CLI can build its options without importing them (and concurrent.futures,
+gzip, hashlib, sqlite3) at startup.
+"""
+
+# Page compressions of glpi snapshot
+COMPRESSIONS = ("gzip", "zstd", "none")
+
+# Exported by glpi snapshot when --types isn't given: the asset itemtypes of
+# utils.KNOWN_ITEMTYPES
+SNAPSHOT_ITEMTYPES = (
+    "Computer",
+    "Monitor",
+    "Printer",
+    "NetworkEquipment",
+    "Peripheral",
+    "Phone",
+    "Software",
+    "SoftwareLicense",
+    "SoftwareVersion",
+)
+
+# Aggregation engines of glpi stats
+STATS_ENGINES = ("auto", "python", "pandas")
+
+# Metrics of glpi stats (the keys of stats.METRICS)
+STATS_METRICS = ("count", "backlog", "solved", "mttr", "max_ttr", "mean_age")
+
+# Plugin Fields column holding the fingerprint value (glpi fingerprint-index)
+DEFAULT_FINGERPRINT_FIELD = "fingerprint"
+
+# Indexed columns glpi mirror query can sort by
+MIRROR_ORDER_COLUMNS = ("id", "name", "status", "date_mod")
@@ -1,30 +1,78 @@
 # -*- coding: utf-8 -*-
 """GLPI CLI - Command-line interface for GLPI REST API."""
 import click
+import contextlib
+import functools
+import os
+import shlex
 import sys
-from .config import Config
-from .client import GLPIClient
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, List, Optional
+from .choices import (
+    COMPRESSIONS,
+    DEFAULT_FINGERPRINT_FIELD,
+    MIRROR_ORDER_COLUMNS,
+    SNAPSHOT_ITEMTYPES,
+    STATS_ENGINES,
+    STATS_METRICS,
+)
+from .config import DEFAULT_BATCH_SIZE, DROPDOWN_MODES, Config
 from .errors import GLPIError
-from .utils import normalize_itemtype, get_available_itemtypes
+from .expansions import CRAWL_EXPANSIONS, EXPANSION_PROFILES, expansion_params
+from .search import criterion, meta_criterion, parse_criterion
+from .utils import (
+    normalize_itemtype,
+    get_available_itemtypes,
+    parse_ids,
+    parse_ndjson,
+    project_fields,
+)
 from .formatters import (
     format_json,
+    format_ndjson,
     format_table,
     format_single_item,
+    stream_table,
+    write_delimited,
+    write_ndjson,
     print_error,
     print_success,
     print_info,
 )
 
+# requests (client), rich (formatters) and yaml (config) are imported inside the
+# functions that use them, so --help, completions and `glpi info` start quickly
+if TYPE_CHECKING:
+    from .client import GLPIClient, PageStats
+    from .dropdowns import DropdownCache
 
-def get_client() -> GLPIClient:
-    """Initialize and validate GLPI client.
 
-    Returns:
-        Configured GLPIClient instance
+# Warm client and dropdown tables reused by every command run inside glpi shell
+# or glpi serve; None in a one-shot invocation
+_shared_client: Optional["GLPIClient"] = None
+_shared_dropdowns: Optional["DropdownCache"] = None
 
-    Raises:
-        GLPIError: If configuration is invalid
+# Connection pool of the shared client, sized for the parallel commands
+WARM_POOL_SIZE = 32
+
+# Commands that can't be forwarded to, or nested inside, glpi shell/serve
+IN_PROCESS_ONLY = ("shell", "serve")
+
+
+def new_client(pool_size: int) -> "GLPIClient":
+    """Validate the configuration and build a GLPI client.
+
+    Args:
+        pool_size: Minimum connection pool size
+
+    Returns:
+        GLPIClient with the session and response caches the options ask for
     """
+    from .cache import ResponseCache
+    from .client import GLPIClient
+    from .session_cache import SessionCache
+
     config = Config()
     is_valid, error_msg = config.validate()
 
@@ -33,12 +81,263 @@ def get_client() -> GLPIClient:
         print_info("Configure as vari�veis de ambiente ou crie ~/.config/glpi/config.yml")
         sys.exit(1)
 
-    return GLPIClient(config)
+    options = click.get_current_context().find_root().obj or {}
+
+    use_session_cache = options.get("session_cache")
+    if use_session_cache is None:
+        use_session_cache = config.session_cache
+    session_cache = SessionCache(ttl=config.session_ttl) if use_session_cache else None
+
+    response_cache = None
+    if config.response_cache:
+        response_cache = ResponseCache(
+            ttl=config.cache_ttl, max_bytes=config.cache_max_mb * 1024 * 1024
+        )
+
+    return GLPIClient(
+        config,
+        pool_size=max(config.pool_size, pool_size),
+        session_cache=session_cache,
+        response_cache=response_cache,
+    )
+
+
+def get_client(concurrency: int = 1) -> "GLPIClient":
+    """Initialize and validate GLPI client.
+
+    Inside glpi shell/serve the warm shared client is returned instead; it
+    stays open when the command ends.
+
+    Args:
+        concurrency: Parallel requests the command will issue; the connection
+            pool is grown to at least this size
+
+    Returns:
+        Configured GLPIClient instance
+
+    Raises:
+        GLPIError: If configuration is invalid
+    """
+    from .metrics import MetricsRegistry
+
+    ctx = click.get_current_context().find_root()
+    options = ctx.obj or {}
+    shared = _shared_client is not None
+    client = _shared_client if shared else new_client(concurrency)
+    show_pool_stats = options.get("pool_stats", False)
+
+    metrics = None
+    if options.get("trace") or options.get("trace_file"):
+        metrics = MetricsRegistry(options.get("trace_file"))
+        client.hooks.append(metrics)
+
+    def _close():
+        if metrics is not None:
+            client.hooks.remove(metrics)
+            if options.get("trace"):
+                click.echo(metrics.format_summary(), err=True)
+        if show_pool_stats:
+            stats = client.pool_stats()
+            click.echo(
+                f"Pool: {stats['requests']} requisições, "
+                f"{stats['new_connections']} conexões novas, "
+                f"{stats['reused_connections']} reutilizadas",
+                err=True,
+            )
+        if not shared:
+            client.close()
+
+    ctx.call_on_close(_close)
+    return client
+
+
+def report_page_stats(stats: "PageStats") -> None:
+    """Print pagination throughput to stderr.
+
+    Args:
+        stats: Finished PageStats of a paginated walk
+    """
+    click.echo(
+        f"{stats.items} itens em {stats.pages} páginas, {stats.elapsed:.2f}s "
+        f"({stats.pages_per_second:.1f} páginas/s, {stats.items_per_second:.1f} itens/s)",
+        err=True,
+    )
+
+
+def split_csv(ctx: click.Context, param: click.Parameter, value: Optional[str]):
+    """Click callback turning 'a,b, c' into ['a', 'b', 'c'] (None if unset)."""
+    if not value:
+        return None
+    return [part.strip() for part in value.split(",") if part.strip()]
+
+
+def split_int_csv(ctx: click.Context, param: click.Parameter, value: Optional[str]):
+    """Click callback turning '1,2,12' into [1, 2, 12] (None if unset)."""
+    parts = split_csv(ctx, param, value)
+    if parts is None:
+        return None
+    try:
+        return [int(part) for part in parts]
+    except ValueError:
+        raise click.BadParameter(f"esperado números separados por vírgula: {value}")
+
+
+def expansion_options(func):
+    """Add --profile, --with and --fields options to a get command."""
+    func = click.option(
+        "--fields",
+        callback=split_csv,
+        help="Manter só estes campos, separados por vírgula (ex.: id,name,status)",
+    )(func)
+    func = click.option(
+        "--with",
+        "expand",
+        callback=split_csv,
+        help="Expansões extras, separadas por vírgula (ex.: logs,documents)",
+    )(func)
+    func = click.option(
+        "--profile",
+        type=click.Choice(sorted(EXPANSION_PROFILES)),
+        default="full",
+        help="Perfil de expansões: minimal, assets ou full (padrão: full)",
+    )(func)
+    return func
+
+
+def dropdowns_option(func):
+    """Add the --dropdowns option to a command that fetches items."""
+    return click.option(
+        "--dropdowns",
+        type=click.Choice(DROPDOWN_MODES),
+        default=None,
+        help="Nomes dos dropdowns: resolvidos pelo servidor, pelo cache local "
+        "ou IDs crus (padrão: GLPI_DROPDOWNS ou server)",
+    )(func)
+
+
+def dropdown_resolver(client: "GLPIClient", mode: Optional[str]):
+    """Query parameters and item transform for a --dropdowns mode.
+
+    Args:
+        client: GLPI client of the command
+        mode: Value of --dropdowns (None = config default)
+
+    Returns:
+        Tuple of (extra query parameters, function applied to each item or None)
+
+    Raises:
+        GLPIError: If the configured mode is unknown
+    """
+    mode = mode or client.config.dropdowns
+    if mode not in DROPDOWN_MODES:
+        raise GLPIError(f"GLPI_DROPDOWNS inválido: {mode} (use {', '.join(DROPDOWN_MODES)})")
+    if mode == "server":
+        return {}, None
+    if mode == "raw":
+        return {"expand_dropdowns": "false"}, None
+
+    from .dropdowns import DropdownCache
+
+    global _shared_dropdowns
+    if _shared_client is not None:
+        # Keep the tables in memory for the next commands of the shell/daemon
+        if _shared_dropdowns is None:
+            _shared_dropdowns = DropdownCache(ttl=client.config.dropdown_ttl, url=client.base_url)
+        cache = _shared_dropdowns
+    else:
+        cache = DropdownCache(ttl=client.config.dropdown_ttl, url=client.base_url)
+        click.get_current_context().call_on_close(cache.close)
+    return {"expand_dropdowns": "false"}, functools.partial(cache.resolve, client)
+
+
+OUTPUT_FORMATS = ["table", "json", "ndjson", "csv", "tsv"]
+
+
+def output_option(func):
+    """Add the --format option to a listing command."""
+    return click.option(
+        "--format",
+        "output_format",
+        type=click.Choice(OUTPUT_FORMATS),
+        default=None,
+        help="Formato de saída; ndjson/csv/tsv são escritos linha a linha (padrão: table)",
+    )(func)
+
+
+def echo_json(data) -> None:
+    """Print data as JSON, on a single line when the global --compact is set.
+
+    Args:
+        data: JSON-serializable value
+    """
+    options = click.get_current_context().find_root().obj or {}
+    click.echo(format_json(data, compact=options.get("compact", False)))
+
+
+def emit_rows(rows, output_format: Optional[str], as_json: bool, stream: bool) -> None:
+    """Write a listing in the requested format.
+
+    ndjson, csv and tsv are written as rows arrive; table is streamed with
+    --stream and rendered as a full rich table otherwise; json always builds
+    the whole array.
+
+    Args:
+        rows: Iterable of items (list or GLPIClient.iter_* generator)
+        output_format: Value of --format (None = derive from --json/--stream)
+        as_json: Value of --json
+        stream: Value of --stream
+    """
+    if output_format is None:
+        output_format = "json" if as_json else "ndjson" if stream else "table"
+
+    if output_format == "ndjson":
+        write_ndjson(rows)
+    elif output_format in ("csv", "tsv"):
+        write_delimited(rows, delimiter="," if output_format == "csv" else "\t")
+    elif output_format == "json":
+        echo_json([*rows])
+    elif stream:
+        stream_table(rows)
+    else:
+        format_table([*rows])
 
 
 @click.group()
 @click.version_option(version="1.0.0")
-def cli():
+@click.option(
+    "--pool-stats",
+    is_flag=True,
+    help="Mostrar conexões HTTP novas/reutilizadas ao final (stderr)",
+)
+@click.option(
+    "--session-cache/--no-session-cache",
+    default=None,
+    help="Reutilizar o Session-Token entre execuções (padrão: GLPI_SESSION_CACHE)",
+)
+@click.option(
+    "--trace",
+    is_flag=True,
+    help="Mostrar tempos p50/p95/máx por endpoint ao final (stderr)",
+)
+@click.option(
+    "--trace-file",
+    type=click.File("a"),
+    help="Anexar um evento JSON por requisição a este arquivo (JSON lines)",
+)
+@click.option(
+    "--compact",
+    is_flag=True,
+    help="Saída JSON em uma linha, sem indentação (mais rápida para respostas grandes)",
+)
+@click.pass_context
+def cli(
+    ctx: click.Context,
+    pool_stats: bool,
+    session_cache: Optional[bool],
+    trace: bool,
+    trace_file,
+    compact: bool,
+):
     """GLPI CLI - Ferramenta de debug para GLPI REST API.
 
     \b
@@ -48,7 +347,12 @@ def cli():
       glpi search entity
       glpi info
     """
-    pass
+    ctx.ensure_object(dict)
+    ctx.obj["pool_stats"] = pool_stats
+    ctx.obj["session_cache"] = session_cache
+    ctx.obj["trace"] = trace
+    ctx.obj["trace_file"] = trace_file
+    ctx.obj["compact"] = compact
 
 
 @cli.command()
@@ -56,7 +360,32 @@ def cli():
 @click.option("--limit", default=50, help="N�mero m�ximo de itens (padr�o: 50)")
 @click.option("--start", default=0, help="�ndice inicial para pagina��o (padr�o: 0)")
 @click.option("--json", "as_json", is_flag=True, help="Sa�da em formato JSON")
-def list(itemtype: str, limit: int, start: int, as_json: bool):
+@click.option(
+    "--all", "fetch_all", is_flag=True, help="Percorrer todas as páginas (ignora --limit/--start)"
+)
+@click.option("--page-size", default=50, help="Itens por página com --all (padrão: 50)")
+@click.option(
+    "--stream", is_flag=True, help="Emitir NDJSON linha a linha, sem acumular em memória"
+)
+@click.option(
+    "--concurrency",
+    default=4,
+    help="Páginas buscadas em paralelo com --all (padrão: 4)",
+)
+@dropdowns_option
+@output_option
+def list(
+    itemtype: str,
+    limit: int,
+    start: int,
+    as_json: bool,
+    fetch_all: bool,
+    page_size: int,
+    stream: bool,
+    concurrency: int,
+    dropdowns: Optional[str],
+    output_format: Optional[str],
+):
     """Listar items de um tipo espec�fico.
 
     \b
@@ -64,18 +393,33 @@ def list(itemtype: str, limit: int, start: int, as_json: bool):
       glpi list ticket
       glpi list computer --limit 100
       glpi list entity --json
+      glpi list ticket --all --stream > tickets.ndjson
+      glpi list computer --all --format csv > computers.csv
+      glpi list ticket --all --stream --format table
+      glpi list ticket --all --dropdowns local --format ndjson
     """
+    from .client import PageStats
+
     itemtype = normalize_itemtype(itemtype)
-    client = get_client()
+    client = get_client(concurrency if fetch_all else 1)
+    stats = PageStats()
 
     try:
         client.init_session()
-        items = client.list_items(itemtype, range_start=start, range_limit=limit)
-
-        if as_json:
-            click.echo(format_json(items))
+        params, resolve = dropdown_resolver(client, dropdowns)
+        if fetch_all:
+            items = client.iter_items(
+                itemtype, page_size=page_size, concurrency=concurrency, stats=stats, **params
+            )
         else:
-            format_table(items)
+            items = client.list_items(itemtype, range_start=start, range_limit=limit, **params)
+        if resolve:
+            items = map(resolve, items)
+
+        emit_rows(items, output_format, as_json, stream)
+
+        if fetch_all:
+            report_page_stats(stats)
 
     except GLPIError as e:
         print_error(str(e))
@@ -88,7 +432,19 @@ def list(itemtype: str, limit: int, start: int, as_json: bool):
 @click.argument("itemtype")
 @click.argument("item_id", type=int)
 @click.option("--json", "as_json", is_flag=True, help="Sa�da em formato JSON")
-def get(itemtype: str, item_id: int, as_json: bool):
+@click.option("--no-cache", is_flag=True, help="Ignorar o cache local de respostas")
+@dropdowns_option
+@expansion_options
+def get(
+    itemtype: str,
+    item_id: int,
+    as_json: bool,
+    no_cache: bool,
+    dropdowns: Optional[str],
+    profile: str,
+    expand: Optional[List[str]],
+    fields: Optional[List[str]],
+):
     """Obter um item espec�fico por ID.
 
     \b
@@ -96,16 +452,30 @@ def get(itemtype: str, item_id: int, as_json: bool):
       glpi get ticket 123
       glpi get computer 42
       glpi get entity 5 --json
+      glpi get computer 42 --no-cache
+      glpi get computer 42 --profile minimal --fields id,name,states_id
+      glpi get computer 42 --profile assets --with documents
     """
     itemtype = normalize_itemtype(itemtype)
     client = get_client()
 
     try:
         client.init_session()
-        item = client.get_item(itemtype, item_id)
+        params, resolve = dropdown_resolver(client, dropdowns)
+        item = client.get_item(
+            itemtype,
+            item_id,
+            use_cache=not no_cache,
+            profile=profile,
+            expand=expand,
+            fields=fields,
+            **params,
+        )
+        if resolve:
+            item = resolve(item)
 
         if as_json:
-            click.echo(format_json(item))
+            echo_json(item)
         else:
             format_single_item(item)
 
@@ -116,13 +486,484 @@ def get(itemtype: str, item_id: int, as_json: bool):
         client.kill_session()
 
 
+@cli.command("get-many")
+@click.argument("itemtype")
+@click.argument("item_ids", nargs=-1, type=int)
+@click.option(
+    "--ids-from",
+    type=click.File("r"),
+    help="Arquivo com IDs (um por linha ou separados por vírgula); '-' para stdin",
+)
+@click.option("--workers", default=8, help="Requisições em paralelo (padrão: 8)")
+@click.option(
+    "--order",
+    type=click.Choice(["input", "completion"]),
+    default="input",
+    help="Ordem da saída: a dos IDs de entrada ou a de conclusão (padrão: input)",
+)
+@click.option("--no-cache", is_flag=True, help="Ignorar o cache local de respostas")
+@dropdowns_option
+@expansion_options
+def get_many(
+    itemtype: str,
+    item_ids: tuple,
+    ids_from,
+    workers: int,
+    order: str,
+    no_cache: bool,
+    dropdowns: Optional[str],
+    profile: str,
+    expand: Optional[List[str]],
+    fields: Optional[List[str]],
+):
+    """Obter vários items por ID em paralelo, com saída NDJSON.
+
+    Usa uma única sessão para todos os items. Falhas individuais não
+    interrompem a execução: são listadas no stderr ao final.
+
+    \b
+    Exemplos:
+      glpi get-many computer 1 2 3
+      glpi get-many computer --ids-from ids.txt --workers 16
+      cut -d, -f1 export.csv | glpi get-many ticket --ids-from - --order completion
+      glpi get-many computer 1 2 3 --profile minimal --fields id,name
+    """
+    itemtype = normalize_itemtype(itemtype)
+
+    try:
+        expansion_params(profile, expand)
+    except GLPIError as e:
+        print_error(str(e))
+        sys.exit(2)
+
+    ids = [*item_ids]
+    if ids_from is not None:
+        try:
+            ids.extend(parse_ids(ids_from))
+        except ValueError as e:
+            print_error(str(e))
+            sys.exit(2)
+
+    if not ids:
+        print_error("Nenhum ID informado")
+        sys.exit(2)
+
+    client = get_client(workers)
+    failures = []
+
+    try:
+        client.init_session()
+        params, resolve = dropdown_resolver(client, dropdowns)
+        results = client.get_items(
+            itemtype,
+            ids,
+            workers=workers,
+            ordered=order == "input",
+            use_cache=not no_cache,
+            profile=profile,
+            expand=expand,
+            fields=fields,
+            **params,
+        )
+        for item_id, item, error in results:
+            if error is None:
+                click.echo(format_ndjson(resolve(item) if resolve else item))
+            else:
+                failures.append((item_id, error))
+
+    except GLPIError as e:
+        print_error(str(e))
+        sys.exit(1)
+    finally:
+        client.kill_session()
+
+    if failures:
+        for item_id, error in failures:
+            code = f"{error.glpi_error} ({error.status_code}): " if error.glpi_error else ""
+            click.echo(f"{itemtype} {item_id}: {code}{error.message}", err=True)
+        click.echo(f"{len(failures)} de {len(ids)} items falharam", err=True)
+        sys.exit(1)
+
+
+@cli.command()
+@click.argument("itemtype")
+@click.argument("item_id", type=int)
+@click.option("--depth", default=1, help="Saltos de ligação a seguir (padrão: 1)")
+@click.option("--workers", default=8, help="Requisições em paralelo por camada (padrão: 8)")
+@click.option(
+    "--with",
+    "expand",
+    callback=split_csv,
+    help=f"Expansões consultadas em cada item (padrão: {','.join(CRAWL_EXPANSIONS)})",
+)
+@click.option(
+    "--follow",
+    callback=split_csv,
+    help="Seguir só ligações para estes tipos, separados por vírgula (ex.: computer,monitor)",
+)
+@click.option("--max-nodes", default=500, help="Máximo de items no grafo (padrão: 500)")
+@click.option("--fields", callback=split_csv, help="Manter só estes campos de cada item")
+@click.option("--no-cache", is_flag=True, help="Ignorar o cache local de respostas")
+def crawl(
+    itemtype: str,
+    item_id: int,
+    depth: int,
+    workers: int,
+    expand: Optional[List[str]],
+    follow: Optional[List[str]],
+    max_nodes: int,
+    fields: Optional[List[str]],
+    no_cache: bool,
+):
+    """Percorrer os items ligados a um item e gerar um grafo JSON.
+
+    Segue as ligações das expansões (tickets, conexões, portas de rede,
+    contratos, documentos...) e os items vinculados a tickets, problemas e
+    mudanças, camada por camada, buscando cada camada em paralelo. Cada item
+    é buscado uma única vez, e o cache local de respostas é reaproveitado.
+
+    \b
+    Exemplos:
+      glpi crawl ticket 123 --depth 2
+      glpi crawl computer 42 --follow ticket,networkport --fields id,name,status
+      glpi --compact crawl ticket 123 --depth 3 --max-nodes 2000 > grafo.json
+    """
+    from .crawl import crawl as crawl_items
+
+    itemtype = normalize_itemtype(itemtype)
+
+    try:
+        expansion_params("minimal", expand)
+    except GLPIError as e:
+        print_error(str(e))
+        sys.exit(2)
+
+    client = get_client(workers)
+    started = time.monotonic()
+
+    try:
+        client.init_session()
+        graph = crawl_items(
+            client,
+            itemtype,
+            item_id,
+            depth=depth,
+            workers=workers,
+            expand=expand,
+            follow=[normalize_itemtype(name) for name in follow] if follow else None,
+            max_nodes=max_nodes,
+            use_cache=not no_cache,
+            fields=fields,
+        )
+    except GLPIError as e:
+        print_error(str(e))
+        sys.exit(1)
+    finally:
+        client.kill_session()
+
+    echo_json(graph)
+    failed = sum(1 for node in graph["nodes"] if "error" in node)
+    click.echo(
+        f"{len(graph['nodes'])} items, {len(graph['edges'])} ligações, "
+        f"{failed} falhas em {time.monotonic() - started:.2f}s"
+        + (f" (limite de {max_nodes} items atingido)" if graph["truncated"] else ""),
+        err=True,
+    )
+
+
+@cli.command()
+@click.option(
+    "--types",
+    "itemtypes",
+    callback=split_csv,
+    help="Tipos separados por vírgula, ou 'all' para todos os conhecidos "
+    f"(padrão: {','.join(SNAPSHOT_ITEMTYPES)})",
+)
+@click.option(
+    "--out",
+    "out_dir",
+    type=click.Path(file_okay=False, path_type=Path),
+    required=True,
+    help="Diretório dos arquivos NDJSON e do manifest.json",
+)
+@click.option(
+    "--compress",
+    "compression",
+    type=click.Choice(COMPRESSIONS),
+    default="gzip",
+    help="Compressão dos arquivos (padrão: gzip; zstd requer o pacote zstandard)",
+)
+@click.option("--page-size", default=500, help="Itens por página (padrão: 500)")
+@click.option(
+    "--concurrency",
+    default=8,
+    help="Páginas buscadas em paralelo, somando todos os tipos (padrão: 8)",
+)
+@click.option(
+    "--restart", is_flag=True, help="Ignorar a exportação anterior no diretório e recomeçar"
+)
+@dropdowns_option
+def snapshot(
+    itemtypes: Optional[List[str]],
+    out_dir: Path,
+    compression: str,
+    page_size: int,
+    concurrency: int,
+    restart: bool,
+    dropdowns: Optional[str],
+):
+    """Exportar vários tipos de item em paralelo para NDJSON comprimido.
+
+    Todos os tipos são paginados ao mesmo tempo, dentro de um único limite
+    de requisições simultâneas; cada página é gravada assim que chega, em
+    ordem de ID. O manifest.json guarda contagens e SHA-256 dos arquivos, e
+    uma exportação interrompida continua da última página gravada ao rodar o
+    mesmo comando de novo.
+
+    \b
+    Exemplos:
+      glpi snapshot --out auditoria/
+      glpi snapshot --types computer,monitor,software --out auditoria/ --compress zstd
+      glpi snapshot --types all --out auditoria/ --concurrency 16
+    """
+    from .snapshot import Snapshot
+
+    if not itemtypes:
+        itemtypes = [*SNAPSHOT_ITEMTYPES]
+    elif itemtypes == ["all"]:
+        itemtypes = get_available_itemtypes()
+    else:
+        itemtypes = [normalize_itemtype(name) for name in itemtypes]
+
+    client = get_client(concurrency)
+    started = time.monotonic()
+
+    def report(itemtype: str, entry: dict):
+        if entry.get("error"):
+            click.echo(
+                f"{itemtype}: falhou após {entry['items']} itens: {entry['error']}", err=True
+            )
+        else:
+            click.echo(
+                f"{itemtype}: {entry['items']} itens -> {entry['file']} "
+                f"({entry['bytes'] / 1024:.0f} KiB)",
+                err=True,
+            )
+
+    try:
+        params, resolve = dropdown_resolver(client, dropdowns)
+        store = Snapshot(
+            out_dir,
+            client.base_url,
+            compression,
+            page_size,
+            dropdowns=dropdowns or client.config.dropdowns,
+            restart=restart,
+        )
+        for itemtype in itemtypes:
+            entry = store.manifest["itemtypes"].get(itemtype)
+            if entry and entry["complete"]:
+                click.echo(f"{itemtype}: já exportado ({entry['items']} itens)", err=True)
+            elif entry and entry["items"]:
+                click.echo(f"{itemtype}: continuando do item {entry['items']}", err=True)
+
+        client.init_session()
+        manifest = store.run(client, itemtypes, concurrency, params, resolve, report)
+    except GLPIError as e:
+        print_error(str(e))
+        sys.exit(1)
+    finally:
+        client.kill_session()
+
+    entries = [manifest["itemtypes"][itemtype] for itemtype in itemtypes]
+    failed = sum(1 for entry in entries if entry.get("error"))
+    click.echo(
+        f"{sum(entry['items'] for entry in entries)} itens de {len(entries)} tipos, "
+        f"{failed} falhas em {time.monotonic() - started:.2f}s; manifesto em {store.path}",
+        err=True,
+    )
+    if failed:
+        sys.exit(1)
+
+
+def bulk_options(func):
+    """Add the input and batching options shared by add/update/delete."""
+    func = click.option(
+        "--workers", default=4, help="Lotes enviados em paralelo (padrão: 4)"
+    )(func)
+    func = click.option(
+        "--batch-size", default=DEFAULT_BATCH_SIZE, help="Itens por requisição (padrão: 100)"
+    )(func)
+    func = click.option(
+        "--from",
+        "source",
+        type=click.File("r"),
+        default="-",
+        help="Arquivo NDJSON, um objeto por linha (padrão: stdin)",
+    )(func)
+    return func
+
+
+def run_bulk_write(itemtype: str, source, workers: int, write) -> None:
+    """Read NDJSON input, run a bulk write and report per-item results.
+
+    Every item gets an NDJSON result line on stdout ({id, ok, message}) in
+    input order; the number of failures goes to stderr and sets exit code 1.
+
+    Args:
+        itemtype: Normalized itemtype
+        source: Open NDJSON file
+        workers: Parallel batches (sizes the connection pool)
+        write: Callable (client, items) returning GLPIClient write results
+    """
+    try:
+        items = parse_ndjson(source)
+    except ValueError as e:
+        print_error(str(e))
+        sys.exit(2)
+
+    if not items:
+        print_error("Nenhum item informado")
+        sys.exit(2)
+
+    client = get_client(workers)
+    failures = 0
+
+    try:
+        client.init_session()
+        for _, item_id, error in write(client, items):
+            failures += error is not None
+            result = {"id": item_id, "ok": error is None}
+            if error is not None:
+                result["message"] = error.message
+            click.echo(format_ndjson(result))
+
+    except GLPIError as e:
+        print_error(str(e))
+        sys.exit(1)
+    finally:
+        client.kill_session()
+
+    if failures:
+        click.echo(f"{failures} de {len(items)} items de {itemtype} falharam", err=True)
+        sys.exit(1)
+
+
+@cli.command()
+@click.argument("itemtype")
+@bulk_options
+def add(itemtype: str, source, batch_size: int, workers: int):
+    """Criar items em lote a partir de NDJSON (um objeto de campos por linha).
+
+    \b
+    Exemplos:
+      glpi add computer < computers.ndjson
+      glpi add ticket --from tickets.ndjson --batch-size 200
+    """
+    itemtype = normalize_itemtype(itemtype)
+    run_bulk_write(
+        itemtype,
+        source,
+        workers,
+        lambda client, items: client.add_items(itemtype, items, batch_size, workers),
+    )
+
+
+@cli.command()
+@click.argument("itemtype")
+@bulk_options
+def update(itemtype: str, source, batch_size: int, workers: int):
+    """Atualizar items em lote a partir de NDJSON (id + campos a alterar por linha).
+
+    \b
+    Exemplos:
+      glpi update ticket < changes.ndjson
+      glpi mirror query ticket --status 2 --fields id \\
+        | jq -c '.users_id_assign = 7' | glpi update ticket --workers 8
+    """
+    itemtype = normalize_itemtype(itemtype)
+    run_bulk_write(
+        itemtype,
+        source,
+        workers,
+        lambda client, items: client.update_items(itemtype, items, batch_size, workers),
+    )
+
+
+@cli.command()
+@click.argument("itemtype")
+@bulk_options
+@click.option("--purge", is_flag=True, help="Apagar definitivamente em vez de mover para a lixeira")
+@click.option("--no-history", is_flag=True, help="Não registrar a exclusão no histórico")
+def delete(itemtype: str, source, batch_size: int, workers: int, purge: bool, no_history: bool):
+    """Excluir items em lote (NDJSON com id, ou um ID por linha).
+
+    \b
+    Exemplos:
+      glpi delete computer < ids.txt
+      glpi delete ticket --from old.ndjson --purge
+    """
+    itemtype = normalize_itemtype(itemtype)
+    run_bulk_write(
+        itemtype,
+        source,
+        workers,
+        lambda client, items: client.delete_items(
+            itemtype, items, batch_size, workers, force_purge=purge, history=not no_history
+        ),
+    )
+
+
 @cli.command()
 @click.argument("itemtype")
 @click.option("--field", default=1, help="Campo para busca (padr�o: 1 = name)")
-@click.option("--value", required=True, help="Valor a buscar")
+@click.option("--value", help="Valor a buscar")
 @click.option("--searchtype", default="contains", help="Tipo de busca (padr�o: contains)")
+@click.option(
+    "-c",
+    "--criterion",
+    "criteria",
+    multiple=True,
+    help="Critério extra [LINK:]CAMPO:TIPO:VALOR; LINK = AND, OR, AND_NOT, OR_NOT (repetível)",
+)
+@click.option(
+    "--meta",
+    "metacriteria",
+    multiple=True,
+    help="Critério em tipo vinculado ITEMTYPE:[LINK:]CAMPO:TIPO:VALOR (repetível)",
+)
+@click.option(
+    "--display",
+    callback=split_int_csv,
+    help="IDs de campos a retornar, separados por vírgula (padrão: 1,2)",
+)
 @click.option("--json", "as_json", is_flag=True, help="Sa�da em formato JSON")
-def search(itemtype: str, field: int, value: str, searchtype: str, as_json: bool):
+@click.option("--all", "fetch_all", is_flag=True, help="Percorrer todas as páginas de resultados")
+@click.option("--page-size", default=100, help="Linhas por página com --all (padrão: 100)")
+@click.option(
+    "--stream", is_flag=True, help="Emitir NDJSON linha a linha, sem acumular em memória"
+)
+@click.option(
+    "--concurrency",
+    default=4,
+    help="Páginas buscadas em paralelo com --all (padrão: 4)",
+)
+@output_option
+def search(
+    itemtype: str,
+    field: int,
+    value: Optional[str],
+    searchtype: str,
+    criteria: tuple,
+    metacriteria: tuple,
+    display: Optional[List[int]],
+    as_json: bool,
+    fetch_all: bool,
+    page_size: int,
+    stream: bool,
+    concurrency: int,
+    output_format: Optional[str],
+):
     """Buscar items com crit�rios.
 
     \b
@@ -130,20 +971,179 @@ def search(itemtype: str, field: int, value: str, searchtype: str, as_json: bool
       glpi search ticket --value "servidor"
       glpi search computer --field 1 --value "srv-web"
       glpi search entity --value "TI" --json
+      glpi search ticket -c 12:equals:2 -c OR:12:equals:3 --display 1,2,12 --all
+      glpi search ticket -c 1:contains:vpn -c AND_NOT:12:equals:6
+      glpi search ticket --meta Computer:1:contains:srv-web --all --format csv
     """
+    from .client import PageStats
+
     itemtype = normalize_itemtype(itemtype)
-    client = get_client()
 
-    criteria = [{"field": field, "searchtype": searchtype, "value": value}]
+    try:
+        search_criteria = []
+        if value is not None:
+            search_criteria.append(criterion(field, value, searchtype))
+        search_criteria.extend(parse_criterion(text) for text in criteria)
+
+        search_metacriteria = []
+        for text in metacriteria:
+            meta_itemtype, _, rest = text.partition(":")
+            parsed = parse_criterion(rest)
+            search_metacriteria.append(
+                meta_criterion(
+                    normalize_itemtype(meta_itemtype),
+                    parsed["field"],
+                    parsed["value"],
+                    parsed["searchtype"],
+                    parsed["link"],
+                )
+            )
+    except GLPIError as e:
+        print_error(str(e))
+        sys.exit(1)
+
+    client = get_client(concurrency if fetch_all else 1)
+    stats = PageStats()
 
     try:
         client.init_session()
-        items = client.search_items(itemtype, criteria=criteria)
-
-        if as_json:
-            click.echo(format_json(items))
+        if fetch_all:
+            rows = client.iter_search(
+                itemtype,
+                criteria=search_criteria,
+                forcedisplay=display,
+                metacriteria=search_metacriteria,
+                page_size=page_size,
+                concurrency=concurrency,
+                stats=stats,
+            )
         else:
-            format_table(items)
+            rows = client.search_items(
+                itemtype,
+                criteria=search_criteria,
+                forcedisplay=display,
+                metacriteria=search_metacriteria,
+            )
+
+        emit_rows(rows, output_format, as_json, stream)
+
+        if fetch_all:
+            report_page_stats(stats)
+
+    except GLPIError as e:
+        print_error(str(e))
+        sys.exit(1)
+    finally:
+        client.kill_session()
+
+
+@cli.command()
+@click.argument("itemtype")
+@click.option(
+    "--group-by",
+    callback=split_csv,
+    help="Campos de agrupamento, por nome ou número, separados por vírgula "
+    "(ex.: status,itilcategories_id)",
+)
+@click.option(
+    "--metrics",
+    callback=split_csv,
+    default="count",
+    help=f"Métricas separadas por vírgula: {', '.join(STATS_METRICS)} (padrão: count; "
+    "tempos em horas)",
+)
+@click.option(
+    "--status",
+    "statuses",
+    callback=split_csv,
+    help="Só estes status, separados por vírgula (1-6, notold ou old)",
+)
+@click.option("--since", help="Abertos a partir desta data (AAAA-MM-DD)")
+@click.option("--until", help="Abertos antes desta data (AAAA-MM-DD)")
+@click.option(
+    "-c",
+    "--criterion",
+    "criteria",
+    multiple=True,
+    help="Critério extra [LINK:]CAMPO:TIPO:VALOR, como em glpi search (repetível)",
+)
+@click.option("--page-size", default=500, help="Linhas por página (padrão: 500)")
+@click.option("--concurrency", default=4, help="Páginas buscadas em paralelo (padrão: 4)")
+@click.option(
+    "--engine",
+    type=click.Choice(STATS_ENGINES),
+    default="auto",
+    help="Agregação linha a linha (python) ou vetorizada por bloco (pandas); "
+    "auto usa pandas se pandas >= 2.0 estiver instalado",
+)
+@click.option("--json", "as_json", is_flag=True, help="Saída em formato JSON")
+@output_option
+def stats(
+    itemtype: str,
+    group_by: Optional[List[str]],
+    metrics: List[str],
+    statuses: Optional[List[str]],
+    since: Optional[str],
+    until: Optional[str],
+    criteria: tuple,
+    page_size: int,
+    concurrency: int,
+    engine: str,
+    as_json: bool,
+    output_format: Optional[str],
+):
+    """Contar e medir chamados por grupo, numa passada só.
+
+    Os filtros viram critérios de busca (o GLPI filtra) e só as colunas
+    necessárias são pedidas; as linhas são agregadas à medida que as
+    páginas chegam, sem guardar os chamados em memória.
+
+    \b
+    Métricas:
+      count     chamados no grupo
+      backlog   chamados não solucionados nem fechados
+      solved    chamados com data de solução
+      mttr      tempo médio até a solução (horas)
+      max_ttr   maior tempo até a solução (horas)
+      mean_age  idade média dos chamados em aberto (horas)
+
+    \b
+    Exemplos:
+      glpi stats ticket --group-by status,itilcategories_id --metrics count,mttr
+      glpi stats ticket --group-by itilcategories_id --status old --since 2024-01-01
+      glpi stats ticket --group-by groups_id_assign --status notold --metrics backlog,mean_age
+      glpi stats problem --metrics count,solved,max_ttr --json
+    """
+    from .client import PageStats
+    from .stats import aggregate, field_id, filter_criteria, required_fields
+
+    itemtype = normalize_itemtype(itemtype)
+
+    try:
+        group_fields = [field_id(name) for name in group_by or []]
+        fields = required_fields(group_fields, metrics)
+        search_criteria = filter_criteria(statuses, since, until)
+        search_criteria.extend(parse_criterion(text) for text in criteria)
+    except GLPIError as e:
+        print_error(str(e))
+        sys.exit(1)
+
+    client = get_client(concurrency)
+    page_stats = PageStats()
+
+    try:
+        client.init_session()
+        rows = client.iter_search(
+            itemtype,
+            criteria=search_criteria,
+            forcedisplay=fields,
+            page_size=page_size,
+            concurrency=concurrency,
+            stats=page_stats,
+        )
+        aggregation = aggregate(rows, group_fields, engine)
+        emit_rows(aggregation.results(metrics, group_by or []), output_format, as_json, False)
+        report_page_stats(page_stats)
 
     except GLPIError as e:
         print_error(str(e))
@@ -172,7 +1172,7 @@ def fingerprint(itemtype: str, item_id: int, as_json: bool):
         data = client.get_fingerprint(itemtype, item_id)
 
         if as_json:
-            click.echo(format_json(data))
+            echo_json(data)
         else:
             format_single_item(data)
 
@@ -188,25 +1188,57 @@ def fingerprint(itemtype: str, item_id: int, as_json: bool):
 @click.option("--limit", default=50, help="Número máximo de itens (padrão: 50)")
 @click.option("--start", default=0, help="Índice inicial para paginação (padrão: 0)")
 @click.option("--json", "as_json", is_flag=True, help="Saída em formato JSON")
-def fingerprints(itemtype: str, limit: int, start: int, as_json: bool):
+@click.option(
+    "--all", "fetch_all", is_flag=True, help="Percorrer todas as páginas (ignora --limit/--start)"
+)
+@click.option("--page-size", default=50, help="Itens por página com --all (padrão: 50)")
+@click.option(
+    "--stream", is_flag=True, help="Emitir NDJSON linha a linha, sem acumular em memória"
+)
+@click.option(
+    "--concurrency",
+    default=4,
+    help="Páginas buscadas em paralelo com --all (padrão: 4)",
+)
+@output_option
+def fingerprints(
+    itemtype: str,
+    limit: int,
+    start: int,
+    as_json: bool,
+    fetch_all: bool,
+    page_size: int,
+    stream: bool,
+    concurrency: int,
+    output_format: Optional[str],
+):
     """Listar todos os dados de fingerprint (Plugin Fields) de um tipo de item.
 
     \b
     Exemplos:
       glpi fingerprints problem
       glpi fingerprints ticket --limit 100 --json
+      glpi fingerprints problem --all --stream
     """
+    from .client import PageStats
+
     itemtype = normalize_itemtype(itemtype)
-    client = get_client()
+    client = get_client(concurrency if fetch_all else 1)
+    stats = PageStats()
 
     try:
         client.init_session()
-        items = client.list_fingerprints(itemtype, range_start=start, range_limit=limit)
-
-        if as_json:
-            click.echo(format_json(items))
+        if fetch_all:
+            items = client.iter_fingerprints(
+                itemtype, page_size=page_size, concurrency=concurrency, stats=stats
+            )
         else:
-            format_table(items)
+            items = client.list_fingerprints(itemtype, range_start=start, range_limit=limit)
+
+        emit_rows(items, output_format, as_json, stream)
+
+        if fetch_all:
+            report_page_stats(stats)
 
     except GLPIError as e:
         print_error(str(e))
@@ -235,7 +1267,7 @@ def fingerprint_search(itemtype: str, value: str, as_json: bool):
         items = client.search_fingerprint(itemtype, value)
 
         if as_json:
-            click.echo(format_json(items))
+            echo_json(items)
         else:
             format_table(items)
 
@@ -246,6 +1278,400 @@ def fingerprint_search(itemtype: str, value: str, as_json: bool):
         client.kill_session()
 
 
+@cli.group("fingerprint-index")
+def fingerprint_index():
+    """Índice local de fingerprints para consultas sem acessar a API.
+
+    \b
+    Exemplos:
+      glpi fingerprint-index build problem
+      glpi fingerprint-index sync problem
+      glpi fingerprint-index query problem abc123xyz
+      cat alerts.txt | glpi fingerprint-index query problem -
+    """
+
+
+@fingerprint_index.command("build")
+@click.argument("itemtype")
+@click.option(
+    "--field",
+    default=DEFAULT_FINGERPRINT_FIELD,
+    help=f"Campo do registro com o valor do fingerprint (padrão: {DEFAULT_FINGERPRINT_FIELD})",
+)
+@click.option("--page-size", default=200, help="Registros por página (padrão: 200)")
+@click.option("--concurrency", default=4, help="Páginas buscadas em paralelo (padrão: 4)")
+def fingerprint_index_build(itemtype: str, field: str, page_size: int, concurrency: int):
+    """Baixar todos os fingerprints de um tipo de item e recriar o índice."""
+    from .fingerprint_index import FingerprintIndex
+
+    itemtype = normalize_itemtype(itemtype)
+    client = get_client(concurrency)
+    index = FingerprintIndex(url=client.base_url)
+
+    try:
+        client.init_session()
+        count = index.build(client, itemtype, field, page_size, concurrency)
+        print_success(f"{count} fingerprints de {itemtype} indexados em {index.path}")
+    except GLPIError as e:
+        print_error(str(e))
+        sys.exit(1)
+    finally:
+        index.close()
+        client.kill_session()
+
+
+@fingerprint_index.command("sync")
+@click.argument("itemtype")
+@click.option("--page-size", default=200, help="Registros por página (padrão: 200)")
+def fingerprint_index_sync(itemtype: str, page_size: int):
+    """Atualizar o índice com os registros modificados desde o último sync."""
+    from .fingerprint_index import FingerprintIndex
+
+    itemtype = normalize_itemtype(itemtype)
+    client = get_client()
+    index = FingerprintIndex(url=client.base_url)
+
+    try:
+        client.init_session()
+        count = index.sync(client, itemtype, page_size)
+        state = index.state(itemtype)
+        print_success(
+            f"{count} fingerprints atualizados ({state['records']} no índice, "
+            f"date_mod até {state['watermark']})"
+        )
+    except GLPIError as e:
+        print_error(str(e))
+        sys.exit(1)
+    finally:
+        index.close()
+        client.kill_session()
+
+
+@fingerprint_index.command("query")
+@click.argument("itemtype")
+@click.argument("values", nargs=-1, required=True)
+@click.option("--json", "as_json", is_flag=True, help="Saída em formato JSON")
+def fingerprint_index_query(itemtype: str, values: tuple, as_json: bool):
+    """Consultar valores de fingerprint no índice local ('-' lê um valor por linha do stdin).
+
+    Saída NDJSON: uma linha por valor consultado, com os registros encontrados.
+    Código de saída 1 se algum valor não for encontrado.
+    """
+    from .fingerprint_index import FingerprintIndex
+
+    itemtype = normalize_itemtype(itemtype)
+    index = FingerprintIndex(url=Config().url)
+
+    try:
+        if index.state(itemtype) is None:
+            print_error(f"Índice de {itemtype} ainda não foi criado (use build)")
+            sys.exit(1)
+
+        if values == ("-",):
+            values = (line.strip() for line in sys.stdin if line.strip())
+
+        results = index.lookup_many(itemtype, values)
+        missing = 0
+        if as_json:
+            results = [*results]
+            missing = sum(1 for result in results if not result["matches"])
+            echo_json(results)
+        else:
+            for result in results:
+                missing += not result["matches"]
+                click.echo(format_ndjson(result))
+    finally:
+        index.close()
+
+    if missing:
+        sys.exit(1)
+
+
+@fingerprint_index.command("status")
+@click.argument("itemtype")
+def fingerprint_index_status(itemtype: str):
+    """Mostrar tamanho e data do último sync do índice."""
+    from .fingerprint_index import FingerprintIndex
+
+    itemtype = normalize_itemtype(itemtype)
+    index = FingerprintIndex(url=Config().url)
+    state = index.state(itemtype)
+    index.close()
+
+    if state is None:
+        print_info(f"Índice de {itemtype} ainda não foi criado")
+        return
+
+    click.echo(f"Arquivo: {index.path}")
+    click.echo(f"Campo: {state['field']}")
+    click.echo(f"Registros: {state['records']}")
+    click.echo(f"date_mod mais recente: {state['watermark']}")
+
+
+class DefaultCommandGroup(click.Group):
+    """Click group that runs a default subcommand when none is named.
+
+    'glpi mirror ticket' is dispatched as 'glpi mirror sync ticket'.
+    """
+
+    default_command = "sync"
+
+    def parse_args(self, ctx: click.Context, args: List[str]) -> List[str]:
+        if args and args[0] not in self.commands and not args[0].startswith("-"):
+            args = [self.default_command, *args]
+        return super().parse_args(ctx, args)
+
+
+def mirror_db_option(func):
+    """Add the --db option to a mirror command."""
+    return click.option(
+        "--db",
+        "db_path",
+        type=click.Path(dir_okay=False, path_type=Path),
+        default=None,
+        help="Arquivo SQLite do espelho (padrão: mirror.sqlite no cache do servidor)",
+    )(func)
+
+
+@cli.group(cls=DefaultCommandGroup)
+def mirror():
+    """Espelho local em SQLite para relatórios sem acessar a API.
+
+    \b
+    Exemplos:
+      glpi mirror ticket --db mirror.sqlite
+      glpi mirror query ticket --db mirror.sqlite --status 2 --format csv
+      glpi mirror status --db mirror.sqlite
+    """
+
+
+@mirror.command("sync")
+@click.argument("itemtype")
+@mirror_db_option
+@click.option("--full", is_flag=True, help="Recarregar todos os itens (remove os apagados)")
+@click.option("--page-size", default=200, help="Itens por página (padrão: 200)")
+@click.option(
+    "--concurrency", default=4, help="Páginas buscadas em paralelo na carga completa (padrão: 4)"
+)
+def mirror_sync(
+    itemtype: str, db_path: Optional[Path], full: bool, page_size: int, concurrency: int
+):
+    """Carregar um tipo de item no espelho ou trazer só o que mudou desde o último sync."""
+    from .mirror import Mirror
+
+    itemtype = normalize_itemtype(itemtype)
+    client = get_client(concurrency)
+    store = Mirror(db_path, url=client.base_url)
+
+    try:
+        client.init_session()
+        count, was_full = store.sync(client, itemtype, page_size, concurrency, full)
+        state = store.state(itemtype)[0]
+        kind = "carga completa" if was_full else "incremental"
+        print_success(
+            f"{count} itens de {itemtype} gravados ({kind}; {state['items']} no espelho, "
+            f"date_mod até {state['watermark']})"
+        )
+    except GLPIError as e:
+        print_error(str(e))
+        sys.exit(1)
+    finally:
+        store.close()
+        client.kill_session()
+
+
+@mirror.command("query")
+@click.argument("itemtype")
+@mirror_db_option
+@click.option("--id", "item_ids", type=int, multiple=True, help="ID do item (repetível)")
+@click.option("--name", help="Trecho do nome")
+@click.option(
+    "--status",
+    help="Status exato: número para chamados/problemas/mudanças, nome do estado para ativos",
+)
+@click.option("--since", help="Modificados a partir de (YYYY-MM-DD[ HH:MM:SS])")
+@click.option(
+    "--order-by",
+    type=click.Choice(MIRROR_ORDER_COLUMNS),
+    default="id",
+    help="Coluna de ordenação (padrão: id)",
+)
+@click.option("--desc", is_flag=True, help="Ordem decrescente")
+@click.option("--limit", type=int, default=None, help="Número máximo de itens")
+@click.option(
+    "--fields",
+    callback=split_csv,
+    help="Manter só estes campos, separados por vírgula (ex.: id,name,status)",
+)
+@click.option("--json", "as_json", is_flag=True, help="Saída em formato JSON")
+@output_option
+def mirror_query(
+    itemtype: str,
+    db_path: Optional[Path],
+    item_ids: tuple,
+    name: Optional[str],
+    status: Optional[str],
+    since: Optional[str],
+    order_by: str,
+    desc: bool,
+    limit: Optional[int],
+    fields: Optional[List[str]],
+    as_json: bool,
+    output_format: Optional[str],
+):
+    """Consultar o espelho local (não acessa a API).
+
+    \b
+    Exemplos:
+      glpi mirror query ticket --status 2
+      glpi mirror query computer --status "Em uso"
+      glpi mirror query computer --name srv --fields id,name,date_mod
+      glpi mirror query ticket --since 2024-01-01 --order-by date_mod --desc --format csv
+    """
+    from .mirror import Mirror
+
+    itemtype = normalize_itemtype(itemtype)
+    store = Mirror(db_path, url=Config().url)
+
+    try:
+        if not store.state(itemtype):
+            print_error(f"{itemtype} ainda não foi espelhado (use glpi mirror {itemtype})")
+            sys.exit(1)
+
+        rows = store.query(
+            itemtype,
+            item_ids=[*item_ids],
+            name=name,
+            status=status,
+            modified_since=since,
+            order_by=order_by,
+            descending=desc,
+            limit=limit,
+        )
+        if fields:
+            rows = (project_fields(row, fields) for row in rows)
+        emit_rows(rows, output_format, as_json, stream=True)
+    finally:
+        store.close()
+
+
+@mirror.command("status")
+@mirror_db_option
+def mirror_status(db_path: Optional[Path]):
+    """Mostrar os tipos espelhados, quantidade de itens e último sync."""
+    from .mirror import Mirror
+
+    store = Mirror(db_path, url=Config().url)
+    states = store.state()
+    store.close()
+
+    if not states:
+        print_info(f"Nenhum tipo espelhado em {store.path}")
+        return
+
+    click.echo(f"Arquivo: {store.path}")
+    for state in states:
+        synced_at = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(state["synced_at"]))
+        click.echo(
+            f"{state['itemtype']}: {state['items']} itens, date_mod até {state['watermark']}, "
+            f"sync em {synced_at}"
+        )
+
+
+@cli.group()
+def cache():
+    """Gerenciar o cache local de respostas (glpi get) e de dropdowns."""
+
+
+@cache.command("stats")
+def cache_stats():
+    """Mostrar tamanho e número de entradas do cache."""
+    from .cache import ResponseCache
+
+    config = Config()
+    response_cache = ResponseCache(ttl=config.cache_ttl)
+    stats = response_cache.stats()
+    response_cache.close()
+
+    click.echo(f"Arquivo: {stats['path']}")
+    click.echo(f"Entradas: {stats['entries']}")
+    click.echo(f"Tamanho: {stats['bytes'] / 1024:.1f} KiB (limite: {config.cache_max_mb} MiB)")
+    click.echo(f"TTL: {config.cache_ttl}s")
+
+
+@cache.command("clear")
+def cache_clear():
+    """Apagar todas as respostas em cache."""
+    from .cache import ResponseCache
+
+    response_cache = ResponseCache()
+    response_cache.clear()
+    response_cache.close()
+    print_success("Cache limpo")
+
+
+@cache.command("dropdowns")
+@click.option("--clear", "clear_tables", is_flag=True, help="Apagar as tabelas de dropdowns")
+@click.option("--json", "as_json", is_flag=True, help="Saída em formato JSON")
+def cache_dropdowns(clear_tables: bool, as_json: bool):
+    """Mostrar as tabelas de dropdowns usadas por --dropdowns local."""
+    from .dropdowns import DropdownCache
+
+    config = Config()
+    dropdown_cache = DropdownCache(ttl=config.dropdown_ttl, url=config.url)
+    try:
+        if clear_tables:
+            dropdown_cache.clear()
+            if _shared_dropdowns is not None:
+                _shared_dropdowns.clear()
+            print_success("Tabelas de dropdowns apagadas")
+            return
+
+        rows = [
+            {
+                "itemtype": state["itemtype"],
+                "entries": state["entries"],
+                "age_s": round(time.time() - state["loaded_at"]),
+                "fresh": state["fresh"],
+            }
+            for state in dropdown_cache.state()
+        ]
+    finally:
+        dropdown_cache.close()
+
+    if as_json:
+        echo_json(rows)
+    elif rows:
+        format_table(rows)
+    else:
+        print_info("Nenhuma tabela de dropdowns em cache")
+    if not as_json:
+        click.echo(f"TTL: {config.dropdown_ttl}s")
+
+
+@cli.command()
+def logout():
+    """Encerrar a sessão em cache (--session-cache) no servidor e apagá-la.
+
+    \b
+    Exemplos:
+      glpi --session-cache logout
+    """
+    client = get_client()
+
+    if not client.session_cache:
+        print_info("Cache de sessão desativado, nada a encerrar")
+        return
+
+    try:
+        client.init_session()
+        client.kill_session(force=True)
+        print_success("Sessão encerrada")
+    except GLPIError as e:
+        print_error(str(e))
+        sys.exit(1)
+
+
 @cli.command()
 def info():
     """Mostrar informa��es de configura��o e ItemTypes dispon�veis."""
@@ -274,8 +1700,199 @@ def info():
     click.echo(f"\nTotal: {len(itemtypes)} itemtypes")
 
 
+def command_name(argv: List[str]) -> Optional[str]:
+    """Subcommand of a glpi command line, skipping the global options.
+
+    Examples:
+        >>> command_name(["--trace-file", "t.jsonl", "--compact", "list", "ticket"])
+        'list'
+
+    Args:
+        argv: Arguments after `glpi`
+
+    Returns:
+        Subcommand name, or None if there is none (--help, --version)
+    """
+    args = iter(argv)
+    for arg in args:
+        if arg == "--trace-file":
+            next(args, None)
+        elif not arg.startswith("-"):
+            return arg
+    return None
+
+
+def run_command(argv: List[str]) -> int:
+    """Run a glpi command line in this process (glpi shell/serve).
+
+    Args:
+        argv: Arguments after `glpi`
+
+    Returns:
+        Exit code
+    """
+    if command_name(argv) in IN_PROCESS_ONLY:
+        print_error(f"glpi {command_name(argv)} não pode ser aberto dentro de glpi shell/serve")
+        return 2
+    try:
+        cli.main(args=argv, prog_name="glpi")
+    except SystemExit as e:
+        if e.code is None or isinstance(e.code, int):
+            return e.code or 0
+        click.echo(e.code, err=True)
+        return 1
+    return 0
+
+
+@contextlib.contextmanager
+def warm_client(pool_size: int):
+    """Open the client shared by the commands of glpi shell/serve.
+
+    The session is opened once and killed on exit (kept alive instead with
+    --session-cache, like any other command).
+
+    Args:
+        pool_size: Minimum connection pool size
+
+    Yields:
+        Logged-in GLPIClient
+    """
+    global _shared_client, _shared_dropdowns
+    client = new_client(pool_size)
+    client.keep_session = True
+    try:
+        client.init_session()
+    except GLPIError as e:
+        client.close()
+        print_error(str(e))
+        sys.exit(1)
+
+    _shared_client = client
+    try:
+        yield client
+    finally:
+        _shared_client = None
+        if _shared_dropdowns is not None:
+            _shared_dropdowns.close()
+            _shared_dropdowns = None
+        client.keep_session = False
+        try:
+            client.kill_session()
+        except GLPIError as e:
+            print_error(str(e))
+        client.close()
+
+
+def pool_size_option(func):
+    """Add the --pool-size option to glpi shell/serve."""
+    return click.option(
+        "--pool-size",
+        default=WARM_POOL_SIZE,
+        help=f"Conexões HTTP mantidas abertas (padrão: {WARM_POOL_SIZE})",
+    )(func)
+
+
+@cli.command()
+@pool_size_option
+def shell(pool_size: int):
+    """Console interativo com sessão, conexões e cache mantidos entre comandos.
+
+    Cada linha é um comando glpi sem o prefixo; exit, quit ou Ctrl+D saem.
+
+    \b
+    Exemplos:
+      glpi shell
+      glpi> list ticket --limit 10
+      glpi> get computer 42 --profile assets
+    """
+    try:
+        # Line editing and history for input()
+        import readline  # noqa: F401
+    except ImportError:
+        pass
+
+    with warm_client(pool_size):
+        while True:
+            try:
+                line = input("glpi> ")
+            except EOFError:
+                click.echo()
+                break
+            except KeyboardInterrupt:
+                click.echo()
+                continue
+
+            try:
+                argv = shlex.split(line)
+            except ValueError as e:
+                print_error(str(e))
+                continue
+            if not argv:
+                continue
+            if argv[0] in ("exit", "quit"):
+                break
+            run_command(argv)
+
+
+@cli.command()
+@click.option(
+    "--socket",
+    "socket_path",
+    is_flag=False,
+    flag_value="",
+    default="",
+    help="Socket Unix a criar (padrão: ~/.cache/glpi/daemon.sock)",
+)
+@pool_size_option
+def serve(socket_path: str, pool_size: int):
+    """Daemon local que executa os comandos encaminhados via GLPI_SOCKET.
+
+    Mantém sessão, conexões HTTP, cache de respostas e tabelas de dropdowns
+    em memória; com GLPI_SOCKET apontando para o socket, cada `glpi ...`
+    só repassa os argumentos e a saída. Atende um comando por vez.
+
+    \b
+    Exemplos:
+      glpi serve --socket &
+      export GLPI_SOCKET=~/.cache/glpi/daemon.sock
+      glpi list ticket --limit 10
+    """
+    from .daemon import default_socket_path, serve as serve_socket
+
+    path = Path(socket_path).expanduser() if socket_path else default_socket_path()
+    with warm_client(pool_size):
+        try:
+            serve_socket(
+                path,
+                run_command,
+                ready=lambda: print_info(f"Escutando em {path} (Ctrl+C para encerrar)"),
+            )
+        except GLPIError as e:
+            print_error(str(e))
+            sys.exit(1)
+
+
 def main():
-    """Entry point for CLI."""
+    """Entry point for CLI.
+
+    With GLPI_SOCKET set, the command runs on the `glpi serve` daemon
+    listening there, or in this process if none answers.
+    """
+    socket_path = os.getenv("GLPI_SOCKET")
+    argv = sys.argv[1:]
+    if (
+        socket_path
+        and command_name(argv) not in IN_PROCESS_ONLY
+        and "_GLPI_COMPLETE" not in os.environ
+    ):
+        from .daemon import forward
+
+        try:
+            code = forward(Path(socket_path).expanduser(), argv)
+        except KeyboardInterrupt:
+            sys.exit(130)
+        if code is not None:
+            sys.exit(code)
     cli()
 
 
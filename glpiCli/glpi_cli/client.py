@@ -1,23 +1,423 @@
 # -*- coding: utf-8 -*-
 """GLPI API client with session management."""
+import functools
+import threading
+import time
+from collections import deque
+from itertools import count, islice
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 import requests
-from typing import Optional, Dict, Any, List
-from .config import Config
-from .errors import GLPIError, raise_glpi_error
+from requests.adapters import HTTPAdapter
+from typing import Optional, Dict, Any, Callable, Iterable, Iterator, List, Tuple
+from .config import DEFAULT_BATCH_SIZE, Config
+from .cache import ResponseCache
+from .errors import GLPIError, raise_glpi_error, translate_error
+from . import fast_json
+from .expansions import expansion_params
+from .metrics import endpoint_of
+from .search import build_search_params, criterion
+from .session_cache import SessionCache
+from .throttle import AdaptiveConcurrency, TokenBucket, backoff_delay
+from .utils import parse_content_range, project_fields
+
+# Overload and transient gateway errors that are safe to retry on idempotent GETs
+RETRY_STATUS_CODES = (429, 502, 503, 504)
+
+# Longest Retry-After the client honours, in seconds
+MAX_RETRY_AFTER = 60
+
+# Methods that can be repeated safely after a lost response
+IDEMPOTENT_METHODS = ("GET", "PUT")
+
+# GLPI error code reported for an item a bulk write rejected
+WRITE_ERROR_CODES = {
+    "POST": "ERROR_GLPI_ADD",
+    "PUT": "ERROR_GLPI_UPDATE",
+    "DELETE": "ERROR_GLPI_DELETE",
+}
+
+# Per-item outcome of a bulk write: (input item, ID or None, GLPIError or None)
+WriteResult = Tuple[Dict[str, Any], Optional[int], Optional[GLPIError]]
+
+# Fetches one range window: (range_start, range_limit) -> (items, total or None)
+PageFetcher = Callable[[int, int], Tuple[List[Dict[str, Any]], Optional[int]]]
+
+
+class PageStats:
+    """Throughput counters for a paginated walk."""
+
+    def __init__(self):
+        """Start the clock with zero pages and items."""
+        self.pages = 0
+        self.items = 0
+        self.started = time.monotonic()
+        self.finished: Optional[float] = None
+
+    def record_page(self, item_count: int):
+        """Count one fetched page.
+
+        Args:
+            item_count: Number of items in the page
+        """
+        self.pages += 1
+        self.items += item_count
+
+    def finish(self):
+        """Stop the clock."""
+        if self.finished is None:
+            self.finished = time.monotonic()
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds spent so far (or in total, once finished)."""
+        end = self.finished if self.finished is not None else time.monotonic()
+        return end - self.started
+
+    @property
+    def pages_per_second(self) -> float:
+        """Page throughput."""
+        return self.pages / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def items_per_second(self) -> float:
+        """Item throughput."""
+        return self.items / self.elapsed if self.elapsed > 0 else 0.0
 
 
 class GLPIClient:
     """Client for GLPI REST API with automatic session management."""
 
-    def __init__(self, config: Config):
+    def __init__(
+        self,
+        config: Config,
+        pool_size: Optional[int] = None,
+        max_retries: Optional[int] = None,
+        timeout: Optional[float] = None,
+        session_cache: Optional[SessionCache] = None,
+        response_cache: Optional[ResponseCache] = None,
+        rate_limit: Optional[float] = None,
+        adaptive: Optional[bool] = None,
+    ):
         """Initialize GLPI client.
 
         Args:
             config: Configuration with URL and tokens
+            pool_size: Max keep-alive connections kept per host, also the
+                maximum number of requests in flight (default from config)
+            max_retries: Retries for connection errors, timeouts and 429/502/503/504
+                (default from config)
+            timeout: Request timeout in seconds (default from config)
+            session_cache: Reuse session tokens across processes through this cache
+            response_cache: Serve repeated get_item calls from this local cache
+            rate_limit: Max requests per second across all threads, 0 = unlimited
+                (default from config)
+            adaptive: Shrink concurrency on errors and latency spikes (default from config)
         """
         self.config = config
         self.session_token: Optional[str] = None
         self.base_url = config.url.rstrip("/")
+        self.session_cache = session_cache
+        self.response_cache = response_cache
+        # Long-lived clients (glpi shell/serve) keep their session across commands
+        self.keep_session = False
+        # Called with one event dict per HTTP attempt and per decoded body (see metrics.py)
+        self.hooks: List[Callable[[Dict[str, Any]], None]] = []
+        self._session_key = SessionCache.make_key(
+            self.base_url, config.app_token or "", config.user_token or ""
+        )
+        self._session_lock = threading.Lock()
+        self.timeout = timeout if timeout is not None else config.timeout
+        self.max_retries = max(max_retries if max_retries is not None else config.max_retries, 0)
+        pool_size = pool_size if pool_size is not None else config.pool_size
+        self.http = self._build_http_session(pool_size)
+        self.rate_limiter = TokenBucket(rate_limit if rate_limit is not None else config.rate_limit)
+        self.concurrency = AdaptiveConcurrency(
+            pool_size, enabled=adaptive if adaptive is not None else config.adaptive
+        )
+
+    @staticmethod
+    def _build_http_session(pool_size: int) -> requests.Session:
+        """Build a persistent HTTP session with a keep-alive connection pool.
+
+        Retries are done by _send so every attempt goes through the rate
+        limiter and feeds the adaptive concurrency limit.
+
+        Args:
+            pool_size: Max connections kept alive per host
+
+        Returns:
+            Configured requests.Session
+        """
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=0)
+
+        session = requests.Session()
+        session.headers["Connection"] = "keep-alive"
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def _get(
+        self, url: str, headers: Dict[str, str], params: Optional[Dict[str, Any]] = None
+    ) -> requests.Response:
+        """Send a GET request through the pooled HTTP session.
+
+        Args:
+            url: Full request URL
+            headers: Request headers
+            params: Query parameters
+
+        Returns:
+            HTTP response
+        """
+        return self._request("GET", url, headers, params)
+
+    def _request(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        params: Optional[Dict[str, Any]] = None,
+        body: Optional[Any] = None,
+    ) -> requests.Response:
+        """Send a request, logging in again once if the session has expired.
+
+        Args:
+            method: HTTP method
+            url: Full request URL
+            headers: Request headers
+            params: Query parameters
+            body: JSON request body
+
+        Returns:
+            HTTP response
+        """
+        response = self._send(method, url, headers, params, body)
+
+        # A cached or long-lived session may have expired server-side: log in again once
+        stale_token = headers.get("Session-Token")
+        if stale_token and self._is_session_expired(response):
+            headers = {**headers, "Session-Token": self._renew_session(stale_token)}
+            response = self._send(method, url, headers, params, body)
+
+        return response
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        params: Optional[Dict[str, Any]] = None,
+        body: Optional[Any] = None,
+    ) -> requests.Response:
+        """Send a request within the rate and concurrency limits, retrying transient failures.
+
+        For GET and PUT, connection errors, timeouts and 429/502/503/504
+        answers are retried up to max_retries times after a jittered
+        exponential delay (or the server's Retry-After). POST and DELETE may
+        already have been applied when a response is lost, so they are only
+        retried when the server refused them (429) or the connection was never
+        established. Each failure also halves the concurrency limit.
+
+        Args:
+            method: HTTP method
+            url: Full request URL
+            headers: Request headers
+            params: Query parameters
+            body: JSON request body
+
+        Returns:
+            HTTP response (the last one if every attempt was rejected)
+
+        Raises:
+            requests.RequestException: If the last attempt failed without a response
+        """
+        idempotent = method in IDEMPOTENT_METHODS
+        retry_errors = (requests.ConnectionError, requests.Timeout)
+        if not idempotent:
+            retry_errors = (requests.ConnectTimeout,)
+
+        # The attempt numbered max_retries always returns or raises
+        for attempt in count():
+            self.rate_limiter.acquire()
+            self.concurrency.acquire()
+            started = time.monotonic()
+            try:
+                response = self.http.request(
+                    method, url, headers=headers, params=params, json=body, timeout=self.timeout
+                )
+            except (requests.ConnectionError, requests.Timeout) as e:
+                self._emit_request(method, url, attempt, started, error=e)
+                self.concurrency.release(congested=True)
+                if attempt == self.max_retries or not isinstance(e, retry_errors):
+                    raise
+                time.sleep(backoff_delay(attempt))
+                continue
+
+            self._emit_request(method, url, attempt, started, response=response)
+            congested = response.status_code in RETRY_STATUS_CODES
+            self.concurrency.release(time.monotonic() - started, congested)
+            retryable = congested and (idempotent or response.status_code == 429)
+            if not retryable or attempt == self.max_retries:
+                return response
+
+            delay = self._retry_after(response)
+            time.sleep(delay if delay is not None else backoff_delay(attempt))
+
+    def _emit_request(
+        self,
+        method: str,
+        url: str,
+        attempt: int,
+        started: float,
+        response: Optional[requests.Response] = None,
+        error: Optional[Exception] = None,
+    ):
+        """Report one HTTP attempt to the hooks.
+
+        Args:
+            method: HTTP method
+            url: Full request URL (without query string)
+            attempt: Zero-based attempt number (> 0 means a retry)
+            started: time.monotonic() when the attempt was sent
+            response: HTTP response, if one arrived
+            error: Exception raised instead of a response
+        """
+        if not self.hooks:
+            return
+
+        event = {
+            "event": "request",
+            "ts": time.time(),
+            "endpoint": endpoint_of(method, url[len(self.base_url) :]),
+            "attempt": attempt,
+            "elapsed": time.monotonic() - started,
+            "status": response.status_code if response is not None else None,
+            "ttfb": response.elapsed.total_seconds() if response is not None else None,
+            "bytes": len(response.content) if response is not None else 0,
+            "error": type(error).__name__ if error is not None else None,
+        }
+        for hook in self.hooks:
+            hook(event)
+
+    @staticmethod
+    def _error_data(response: requests.Response) -> Any:
+        """Decode the body of a failed request for raise_glpi_error.
+
+        Args:
+            response: HTTP response
+
+        Returns:
+            Decoded body, or {} if it is empty or not JSON (e.g., a proxy's HTML page)
+        """
+        try:
+            return response.json() if response.text else {}
+        except ValueError:
+            return {}
+
+    def _json(self, response: requests.Response) -> Any:
+        """Decode a JSON response body with the fast_json backend, reporting the time to the hooks.
+
+        Args:
+            response: HTTP response
+
+        Returns:
+            Decoded body
+        """
+        if not self.hooks:
+            return fast_json.loads(response.content)
+
+        path = response.url.split("?", 1)[0][len(self.base_url) :]
+        started = time.monotonic()
+        data = fast_json.loads(response.content)
+        event = {
+            "event": "decode",
+            "ts": time.time(),
+            "endpoint": endpoint_of(response.request.method, path),
+            "elapsed": time.monotonic() - started,
+        }
+        for hook in self.hooks:
+            hook(event)
+        return data
+
+    @staticmethod
+    def _retry_after(response: requests.Response) -> Optional[float]:
+        """Read a Retry-After header given in seconds.
+
+        Args:
+            response: HTTP response
+
+        Returns:
+            Seconds to wait (capped at MAX_RETRY_AFTER) or None
+        """
+        try:
+            return min(max(float(response.headers["Retry-After"]), 0), MAX_RETRY_AFTER)
+        except (KeyError, ValueError):
+            return None
+
+    @staticmethod
+    def _is_session_expired(response: requests.Response) -> bool:
+        """Check whether GLPI rejected the request's Session-Token.
+
+        Args:
+            response: HTTP response
+
+        Returns:
+            True for ERROR_SESSION_TOKEN_INVALID
+        """
+        if response.status_code != 401:
+            return False
+
+        try:
+            raise_glpi_error(self._error_data(response), response.status_code)
+        except GLPIError as e:
+            return e.glpi_error == "ERROR_SESSION_TOKEN_INVALID"
+        except ValueError:
+            return False
+        return False
+
+    def _renew_session(self, stale_token: str) -> str:
+        """Replace an expired session token, once across all threads.
+
+        Args:
+            stale_token: Token the server rejected
+
+        Returns:
+            Current valid session token
+        """
+        with self._session_lock:
+            # Another thread may have already logged in again
+            if self.session_token == stale_token:
+                if self.session_cache:
+                    self.session_cache.clear(self._session_key)
+                self._open_session()
+            return self.session_token
+
+    def pool_stats(self) -> Dict[str, int]:
+        """Get connection pool usage for the GLPI host.
+
+        Returns:
+            Dictionary with requests sent, new connections opened and reused connections
+        """
+        total_requests = 0
+        new_connections = 0
+
+        pools = self.http.get_adapter(self.base_url).poolmanager.pools
+        for key in pools.keys():
+            pool = pools[key]
+            total_requests += pool.num_requests
+            new_connections += pool.num_connections
+
+        return {
+            "requests": total_requests,
+            "new_connections": new_connections,
+            "reused_connections": max(total_requests - new_connections, 0),
+        }
+
+    def close(self):
+        """Close pooled HTTP connections and the response cache."""
+        self.http.close()
+        if self.response_cache:
+            self.response_cache.close()
 
     def _get_headers(self, include_session: bool = False) -> Dict[str, str]:
         """Build request headers.
@@ -41,6 +441,27 @@ def _get_headers(self, include_session: bool = False) -> Dict[str, str]:
     def init_session(self):
         """Initialize GLPI session and store session token.
 
+        With a session cache, a cached token still within its TTL is reused
+        instead of logging in again. With keep_session an open session is
+        kept as is.
+
+        Raises:
+            GLPIError: If session initialization fails
+        """
+        if self.keep_session and self.session_token:
+            return
+
+        if self.session_cache:
+            cached_token = self.session_cache.load(self._session_key)
+            if cached_token:
+                self.session_token = cached_token
+                return
+
+        self._open_session()
+
+    def _open_session(self):
+        """Log in through initSession and store the new session token.
+
         Raises:
             GLPIError: If session initialization fails
         """
@@ -52,37 +473,51 @@ def init_session(self):
         }
 
         try:
-            response = requests.get(url, headers=headers, timeout=10)
+            response = self._get(url, headers)
 
             if response.status_code == 200:
-                data = response.json()
+                data = self._json(response)
                 self.session_token = data.get("session_token")
                 if not self.session_token:
                     raise GLPIError("Session token n\u00e3o retornado pela API")
+                if self.session_cache:
+                    self.session_cache.store(self._session_key, self.session_token)
             else:
-                error_data = response.json() if response.text else {}
+                error_data = self._error_data(response)
                 raise_glpi_error(error_data, response.status_code)
 
         except requests.RequestException as e:
             raise GLPIError(f"Erro de conex\u00e3o: {str(e)}")
 
-    def kill_session(self):
+    def kill_session(self, force: bool = False):
         """Kill current GLPI session.
 
+        With a session cache the server-side session is kept alive for the
+        next invocation unless force is set; so is it with keep_session.
+
+        Args:
+            force: Kill the session and drop it from the cache
+
         Raises:
             GLPIError: If session termination fails
         """
-        if not self.session_token:
+        if not self.session_token or (self.keep_session and not force):
             return
 
+        if self.session_cache:
+            if not force:
+                self.session_token = None
+                return
+            self.session_cache.clear(self._session_key)
+
         url = f"{self.base_url}/killSession"
         headers = self._get_headers(include_session=True)
 
         try:
-            response = requests.get(url, headers=headers, timeout=10)
+            response = self._get(url, headers)
 
             if response.status_code != 200:
-                error_data = response.json() if response.text else {}
+                error_data = self._error_data(response)
                 raise_glpi_error(error_data, response.status_code)
 
         except requests.RequestException as e:
@@ -91,55 +526,164 @@ def kill_session(self):
         finally:
             self.session_token = None
 
-    def get_item(self, itemtype: str, item_id: int, **params) -> Dict[str, Any]:
+    def get_item(
+        self,
+        itemtype: str,
+        item_id: int,
+        use_cache: bool = True,
+        profile: str = "full",
+        expand: Optional[Iterable[str]] = None,
+        fields: Optional[Iterable[str]] = None,
+        **params,
+    ) -> Dict[str, Any]:
         """Get a single item from GLPI.
 
+        With a response cache, entries within the TTL are returned without a
+        request; older entries (all of them with the default TTL of 0) are
+        revalidated (ETag or date_mod) first.
+
         Args:
             itemtype: Type of item (e.g., 'Ticket', 'Computer')
             item_id: ID of the item
+            use_cache: Consult the response cache (if configured)
+            profile: Expansion profile name from EXPANSION_PROFILES
+            expand: Extra expansions on top of the profile (e.g., ['logs'])
+            fields: Keep only these top-level keys in the result
             **params: Additional query parameters
 
         Returns:
             Item data as dictionary
 
         Raises:
-            GLPIError: If request fails
+            GLPIError: If request fails or profile/expansion is unknown
         """
         url = f"{self.base_url}/{itemtype}/{item_id}"
         headers = self._get_headers(include_session=True)
 
-        # Add all parameters to get full JSON response
         query_params = {
             "expand_dropdowns": "true",
             "get_hateoas": "false",
-            "with_devices": "true",
-            "with_disks": "true",
-            "with_softwares": "true",
-            "with_connections": "true",
-            "with_networkports": "true",
-            "with_infocoms": "true",
-            "with_contracts": "true",
-            "with_documents": "true",
-            "with_tickets": "true",
-            "with_problems": "true",
-            "with_changes": "true",
-            "with_notes": "true",
-            "with_logs": "false",
+            **expansion_params(profile, expand),
             **params,
         }
 
-        try:
-            response = requests.get(url, headers=headers, params=query_params, timeout=10)
+        cache = self.response_cache if use_cache else None
+        cache_key = None
+        if cache:
+            cache_key = cache.make_key(
+                self.base_url, self.config.user_token or "", itemtype, item_id, query_params
+            )
+            entry = cache.get(cache_key)
+            if entry and entry.fresh:
+                return project_fields(entry.data, fields)
+            if entry and entry.etag:
+                headers["If-None-Match"] = entry.etag
+            elif entry and entry.date_mod:
+                if self._get_date_mod(itemtype, item_id) == entry.date_mod:
+                    cache.touch(cache_key)
+                    return project_fields(entry.data, fields)
 
-            if response.status_code == 200:
-                return response.json()
+        try:
+            response = self._get(url, headers, query_params)
+
+            if response.status_code == 304 and cache:
+                cache.touch(cache_key)
+                return project_fields(entry.data, fields)
+            elif response.status_code == 200:
+                data = self._json(response)
+                if cache:
+                    cache.put(cache_key, itemtype, item_id, data, response.headers.get("ETag"))
+                return project_fields(data, fields)
             else:
-                error_data = response.json() if response.text else {}
+                error_data = self._error_data(response)
                 raise_glpi_error(error_data, response.status_code)
 
         except requests.RequestException as e:
             raise GLPIError(f"Erro de conex\u00e3o: {str(e)}")
 
+    def get_items(
+        self,
+        itemtype: str,
+        item_ids: Iterable[int],
+        workers: int = 8,
+        ordered: bool = True,
+        **params,
+    ) -> Iterator[Tuple[int, Optional[Dict[str, Any]], Optional[GLPIError]]]:
+        """Fetch many items concurrently with the current session.
+
+        At most 2 * workers requests are queued at a time, so item_ids may be
+        a lazy iterable of any size. A failing item doesn't stop the others.
+
+        Args:
+            itemtype: Type of item (e.g., 'Ticket', 'Computer')
+            item_ids: IDs to fetch
+            workers: Max parallel requests
+            ordered: Yield in input order (True) or as requests complete (False)
+            **params: Additional get_item arguments
+
+        Yields:
+            Tuples of (item_id, item or None, GLPIError or None)
+        """
+        ids = iter(item_ids)
+        pending: "deque[Tuple[int, Future]]" = deque()
+
+        def fetch(item_id: int) -> Tuple[Optional[Dict[str, Any]], Optional[GLPIError]]:
+            try:
+                return self.get_item(itemtype, item_id, **params), None
+            except GLPIError as e:
+                return None, e
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+
+            def submit_next():
+                item_id = next(ids, None)
+                if item_id is not None:
+                    pending.append((item_id, executor.submit(fetch, item_id)))
+
+            try:
+                for _ in range(workers * 2):
+                    submit_next()
+
+                while pending:
+                    if ordered:
+                        done_item = pending.popleft()
+                    else:
+                        futures = [future for _, future in pending]
+                        done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                        done_item = next(p for p in pending if p[1] in done)
+                        pending.remove(done_item)
+
+                    submit_next()
+                    item_id, future = done_item
+                    item, error = future.result()
+                    yield item_id, item, error
+            finally:
+                for _, future in pending:
+                    future.cancel()
+
+    def _get_date_mod(self, itemtype: str, item_id: int) -> Optional[str]:
+        """Fetch only the plain item (no expansions) to read its date_mod.
+
+        Args:
+            itemtype: Type of item
+            item_id: ID of the item
+
+        Returns:
+            date_mod value, or None if unavailable
+        """
+        url = f"{self.base_url}/{itemtype}/{item_id}"
+        headers = self._get_headers(include_session=True)
+        query_params = {"expand_dropdowns": "false", "get_hateoas": "false"}
+
+        try:
+            response = self._get(url, headers, query_params)
+            if response.status_code == 200:
+                data = self._json(response)
+                return data.get("date_mod") if isinstance(data, dict) else None
+        except (requests.RequestException, ValueError):
+            pass
+        return None
+
     def list_items(
         self, itemtype: str, range_start: int = 0, range_limit: int = 50, **params
     ) -> List[Dict[str, Any]]:
@@ -157,7 +701,77 @@ def list_items(
         Raises:
             GLPIError: If request fails
         """
-        url = f"{self.base_url}/{itemtype}"
+        items, _ = self._fetch_page(itemtype, range_start, range_limit, params)
+        return items
+
+    def list_page(
+        self, itemtype: str, range_start: int = 0, range_limit: int = 50, **params
+    ) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        """List one range window together with the collection size.
+
+        Args:
+            itemtype: Type of items (e.g., 'Ticket', 'Computer')
+            range_start: Start index for pagination
+            range_limit: Number of items to retrieve
+            **params: Additional query parameters
+
+        Returns:
+            Tuple of (items, total count from Content-Range or None)
+
+        Raises:
+            GLPIError: If request fails
+        """
+        return self._fetch_page(itemtype, range_start, range_limit, params)
+
+    def iter_items(
+        self,
+        itemtype: str,
+        page_size: int = 50,
+        concurrency: int = 1,
+        stats: Optional[PageStats] = None,
+        **params,
+    ) -> Iterator[Dict[str, Any]]:
+        """Iterate over every item of an itemtype, one range window at a time.
+
+        Iteration stops once the Content-Range total is reached. With
+        concurrency > 1 the remaining windows are prefetched in parallel after
+        the first page reveals the total; items are still yielded in order and
+        at most 2 * concurrency pages are held in memory.
+
+        Args:
+            itemtype: Type of items (e.g., 'Ticket', 'Computer')
+            page_size: Number of items requested per range window
+            concurrency: Max range windows fetched in parallel
+            stats: Optional PageStats updated as pages arrive
+            **params: Additional query parameters
+
+        Yields:
+            Items in server order
+
+        Raises:
+            GLPIError: If a request fails
+        """
+        fetch = functools.partial(self._fetch_page, itemtype, params=params)
+        return self._iter_pages(fetch, page_size, concurrency, stats)
+
+    def _fetch_page(
+        self, path: str, range_start: int, range_limit: int, params: Dict[str, Any]
+    ) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        """Fetch one range window of a collection endpoint.
+
+        Args:
+            path: Endpoint path relative to the API URL (e.g., 'Ticket')
+            range_start: Start index for pagination
+            range_limit: Number of items to retrieve
+            params: Additional query parameters
+
+        Returns:
+            Tuple of (items, total count from Content-Range or None)
+
+        Raises:
+            GLPIError: If request fails
+        """
+        url = f"{self.base_url}/{path}"
         headers = self._get_headers(include_session=True)
 
         query_params = {
@@ -168,31 +782,393 @@ def list_items(
         }
 
         try:
-            response = requests.get(url, headers=headers, params=query_params, timeout=10)
+            response = self._get(url, headers, query_params)
 
-            if response.status_code == 200:
-                data = response.json()
+            # 206 = partial content (more pages available)
+            if response.status_code in (200, 206):
+                data = self._json(response)
                 # GLPI returns list directly for range queries
-                return data if isinstance(data, list) else [data]
-            elif response.status_code == 206:
-                # Partial content (pagination)
-                return response.json()
+                items = data if isinstance(data, list) else [data]
+                content_range = parse_content_range(response.headers.get("Content-Range"))
+                total = content_range[2] if content_range else None
+                return items, total
             else:
-                error_data = response.json() if response.text else {}
+                error_data = self._error_data(response)
                 raise_glpi_error(error_data, response.status_code)
 
         except requests.RequestException as e:
             raise GLPIError(f"Erro de conex\u00e3o: {str(e)}")
 
-    def search_items(self, itemtype: str, criteria: Optional[List[Dict]] = None) -> List[Dict[str, Any]]:
+    def _iter_pages(
+        self,
+        fetch: PageFetcher,
+        page_size: int,
+        concurrency: int = 1,
+        stats: Optional[PageStats] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Walk all range windows of a paginated endpoint.
+
+        Args:
+            fetch: Callable (range_start, range_limit) -> (items, total or None)
+            page_size: Number of items requested per range window
+            concurrency: Max range windows fetched in parallel
+            stats: Optional PageStats updated as pages arrive
+
+        Yields:
+            Items in server order
+        """
+        stats = stats if stats is not None else PageStats()
+        range_start = 0
+
+        try:
+            while True:
+                try:
+                    items, total = fetch(range_start, page_size)
+                except GLPIError as e:
+                    # Without Content-Range the end is only found by overshooting
+                    if e.glpi_error == "ERROR_RANGE_EXCEED_TOTAL" and range_start > 0:
+                        return
+                    raise
+
+                stats.record_page(len(items))
+                yield from items
+                range_start += len(items)
+
+                if not items:
+                    return
+                if total is not None and range_start >= total:
+                    return
+                if total is None and len(items) < page_size:
+                    return
+
+                if concurrency > 1 and total is not None:
+                    # The server may cap the window size, so step by what it returned
+                    yield from self._prefetch_pages(
+                        fetch, range_start, total, len(items), concurrency, stats
+                    )
+                    return
+        finally:
+            stats.finish()
+
+    def _prefetch_pages(
+        self,
+        fetch: PageFetcher,
+        range_start: int,
+        total: int,
+        step: int,
+        concurrency: int,
+        stats: PageStats,
+    ) -> Iterator[Dict[str, Any]]:
+        """Fetch the remaining range windows on a bounded thread pool.
+
+        Args:
+            fetch: Callable (range_start, range_limit) -> (items, total or None)
+            range_start: First index not yet fetched
+            total: Collection size reported by the server
+            step: Window size
+            concurrency: Max windows in flight
+            stats: PageStats updated as pages are yielded
+
+        Yields:
+            Items in server order
+        """
+        starts = iter(range(range_start, total, step))
+        pending: "deque[Future]" = deque()
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+
+            def submit_next():
+                start = next(starts, None)
+                if start is not None:
+                    pending.append(executor.submit(fetch, start, step))
+
+            try:
+                # Keep a small read-ahead window so memory stays bounded
+                for _ in range(concurrency * 2):
+                    submit_next()
+
+                while pending:
+                    items, _ = pending.popleft().result()
+                    submit_next()
+                    stats.record_page(len(items))
+                    yield from items
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    def add_items(
+        self,
+        itemtype: str,
+        items: Iterable[Dict[str, Any]],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        workers: int = 4,
+    ) -> Iterator[WriteResult]:
+        """Create items in batches (POST with an input array).
+
+        Args:
+            itemtype: Type of items (e.g., 'Ticket')
+            items: Field dictionaries of the new items (may be a lazy iterable)
+            batch_size: Items per request
+            workers: Max batches sent in parallel
+
+        Yields:
+            Tuples of (input item, new ID or None, GLPIError or None) in input order
+        """
+        return self._write_items("POST", itemtype, items, batch_size, workers)
+
+    def update_items(
+        self,
+        itemtype: str,
+        items: Iterable[Dict[str, Any]],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        workers: int = 4,
+    ) -> Iterator[WriteResult]:
+        """Update items in batches (PUT with an input array).
+
+        Args:
+            itemtype: Type of items (e.g., 'Ticket')
+            items: Dictionaries with the item id and the fields to change
+            batch_size: Items per request
+            workers: Max batches sent in parallel
+
+        Yields:
+            Tuples of (input item, item ID, GLPIError or None) in input order
+        """
+        return self._write_items("PUT", itemtype, items, batch_size, workers)
+
+    def delete_items(
+        self,
+        itemtype: str,
+        items: Iterable[Dict[str, Any]],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        workers: int = 4,
+        force_purge: bool = False,
+        history: bool = True,
+    ) -> Iterator[WriteResult]:
+        """Delete items in batches (DELETE with an input array).
+
+        Args:
+            itemtype: Type of items (e.g., 'Ticket')
+            items: Dictionaries with the id of each item to delete
+            batch_size: Items per request
+            workers: Max batches sent in parallel
+            force_purge: Purge instead of moving to the trash
+            history: Record the deletion in the item history
+
+        Yields:
+            Tuples of (input item, item ID, GLPIError or None) in input order
+        """
+        params = {
+            "force_purge": "true" if force_purge else "false",
+            "history": "true" if history else "false",
+        }
+        return self._write_items("DELETE", itemtype, items, batch_size, workers, params)
+
+    def _write_items(
+        self,
+        method: str,
+        itemtype: str,
+        items: Iterable[Dict[str, Any]],
+        batch_size: int,
+        workers: int,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Iterator[WriteResult]:
+        """Send items in chunks on a thread pool, yielding per-item results in order.
+
+        At most 2 * workers chunks are queued at a time, so items may be a
+        lazy iterable of any size. A failing chunk doesn't stop the others.
+        Updated and deleted items are dropped from the response cache.
+        """
+        source = iter(items)
+        pending: "deque[Future]" = deque()
+
+        def write(chunk: List[Dict[str, Any]]) -> List[WriteResult]:
+            try:
+                return self._write_batch(method, itemtype, chunk, params)
+            finally:
+                # Even a failed or timed-out write may have changed some items
+                if self.response_cache and method != "POST":
+                    ids = {str(item.get("id")) for item in chunk}
+                    self.response_cache.invalidate(itemtype, [int(i) for i in ids if i.isdigit()])
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+
+            def submit_next():
+                chunk = [*islice(source, batch_size)]
+                if chunk:
+                    pending.append(executor.submit(write, chunk))
+
+            try:
+                for _ in range(workers * 2):
+                    submit_next()
+
+                while pending:
+                    results = pending.popleft().result()
+                    submit_next()
+                    yield from results
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    def _write_batch(
+        self,
+        method: str,
+        itemtype: str,
+        chunk: List[Dict[str, Any]],
+        params: Optional[Dict[str, Any]] = None,
+    ) -> List[WriteResult]:
+        """Send one chunk and match GLPI's per-item answers to the input.
+
+        GLPI answers an input array with one entry per item, in order:
+        {"id": <new id or false>, "message": ...} for POST and
+        {"<id>": true|false, "message": ...} for PUT and DELETE.
+
+        Returns:
+            List of (input item, ID or None, GLPIError or None)
+        """
+        url = f"{self.base_url}/{itemtype}"
+        headers = self._get_headers(include_session=True)
+        error_code = WRITE_ERROR_CODES[method]
+
+        try:
+            response = self._request(method, url, headers, params, {"input": chunk})
+            # 207 = multi-status: some items failed
+            if response.status_code not in (200, 201, 204, 207):
+                error_data = self._error_data(response)
+                raise_glpi_error(error_data, response.status_code)
+            answers = self._json(response) if response.content else []
+        except requests.RequestException as e:
+            error = GLPIError(f"Erro de conex\u00e3o: {str(e)}")
+            return [(item, item.get("id"), error) for item in chunk]
+        except GLPIError as e:
+            return [(item, item.get("id"), e) for item in chunk]
+        except ValueError:
+            # A login page, proxy error or PHP notice instead of GLPI's answers:
+            # nothing says which items were written
+            error = GLPIError(
+                f"Resposta inv\u00e1lida do servidor (HTTP {response.status_code})",
+                status_code=response.status_code,
+            )
+            return [(item, item.get("id"), error) for item in chunk]
+
+        if not isinstance(answers, list):
+            answers = [answers]
+
+        results = []
+        for i, item in enumerate(chunk):
+            answer = answers[i] if i < len(answers) and isinstance(answers[i], dict) else None
+            if answer is None:
+                # 204, an empty body (or an older GLPI) gives no per-item detail: the
+                # request as a whole succeeded
+                results.append((item, item.get("id"), None))
+                continue
+
+            message = answer.get("message") or ""
+            if "id" in answer:
+                item_id, ok = answer["id"] or None, bool(answer["id"])
+            else:
+                key = next((k for k in answer if k != "message"), None)
+                item_id = int(key) if key and key.isdigit() else item.get("id")
+                ok = bool(answer.get(key))
+
+            error = None
+            if not ok:
+                error = GLPIError(
+                    message or translate_error(error_code, response.status_code),
+                    error_code,
+                    response.status_code,
+                )
+            results.append((item, item_id, error))
+        return results
+
+    def search_items(
+        self,
+        itemtype: str,
+        criteria: Optional[List[Dict]] = None,
+        forcedisplay: Optional[Iterable[int]] = None,
+        metacriteria: Optional[List[Dict]] = None,
+        range_start: int = 0,
+        range_limit: Optional[int] = None,
+        **params,
+    ) -> List[Dict[str, Any]]:
         """Search items in GLPI with criteria.
 
         Args:
             itemtype: Type of items to search
-            criteria: Search criteria (field, searchtype, value)
+            criteria: Search criteria (link, field, searchtype, value); see search.criterion
+            forcedisplay: Search option IDs to return (default: 1 and 2, name and ID)
+            metacriteria: Criteria on linked itemtypes; see search.meta_criterion
+            range_start: Start index for pagination
+            range_limit: Number of rows to retrieve (default: server default, 50 rows)
+            **params: Additional query parameters (e.g., sort, order)
+
+        Returns:
+            List of matching rows, keyed by search option ID
+
+        Raises:
+            GLPIError: If request fails
+        """
+        query = {**build_search_params(criteria, forcedisplay, metacriteria), **params}
+        if range_limit is None:
+            rows, _ = self._fetch_search_page(itemtype, query)
+        else:
+            rows, _ = self._fetch_search_page(itemtype, query, range_start, range_limit)
+        return rows
+
+    def iter_search(
+        self,
+        itemtype: str,
+        criteria: Optional[List[Dict]] = None,
+        forcedisplay: Optional[Iterable[int]] = None,
+        metacriteria: Optional[List[Dict]] = None,
+        page_size: int = 100,
+        concurrency: int = 1,
+        stats: Optional[PageStats] = None,
+        **params,
+    ) -> Iterator[Dict[str, Any]]:
+        """Iterate over every row matching a search.
+
+        The first page reveals totalcount; with concurrency > 1 the remaining
+        range windows are then fetched on a thread pool, and rows are still
+        yielded in server order.
+
+        Args:
+            itemtype: Type of items to search
+            criteria: Search criteria; see search_items
+            forcedisplay: Search option IDs to return
+            metacriteria: Criteria on linked itemtypes
+            page_size: Number of rows requested per range window
+            concurrency: Max range windows fetched in parallel
+            stats: Optional PageStats updated as pages arrive
+            **params: Additional query parameters (e.g., sort, order)
+
+        Yields:
+            Matching rows in server order
+
+        Raises:
+            GLPIError: If a request fails
+        """
+        query = {**build_search_params(criteria, forcedisplay, metacriteria), **params}
+        fetch = functools.partial(self._fetch_search_page, itemtype, query)
+        return self._iter_pages(fetch, page_size, concurrency, stats)
+
+    def _fetch_search_page(
+        self,
+        itemtype: str,
+        params: Dict[str, Any],
+        range_start: Optional[int] = None,
+        range_limit: Optional[int] = None,
+    ) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        """Fetch one range window of /search/:itemtype.
+
+        Args:
+            itemtype: Type of items to search
+            params: Search query parameters (see search.build_search_params)
+            range_start: Start index for pagination (None: server default)
+            range_limit: Number of rows to retrieve
 
         Returns:
-            List of matching items
+            Tuple of (rows, totalcount or None)
 
         Raises:
             GLPIError: If request fails
@@ -200,22 +1176,19 @@ def search_items(self, itemtype: str, criteria: Optional[List[Dict]] = None) ->
         url = f"{self.base_url}/search/{itemtype}"
         headers = self._get_headers(include_session=True)
 
-        params = {"forcedisplay[0]": 1, "forcedisplay[1]": 2}  # Force display ID and name
-
-        if criteria:
-            for i, criterion in enumerate(criteria):
-                params[f"criteria[{i}][field]"] = criterion.get("field", 1)
-                params[f"criteria[{i}][searchtype]"] = criterion.get("searchtype", "contains")
-                params[f"criteria[{i}][value]"] = criterion.get("value", "")
+        query_params = dict(params)
+        if range_start is not None and range_limit is not None:
+            query_params["range"] = f"{range_start}-{range_start + range_limit - 1}"
 
         try:
-            response = requests.get(url, headers=headers, params=params, timeout=10)
+            response = self._get(url, headers, query_params)
 
-            if response.status_code == 200:
-                data = response.json()
-                return data.get("data", [])
+            # 206 = partial content (more rows than the requested range)
+            if response.status_code in (200, 206):
+                data = self._json(response)
+                return data.get("data", []), data.get("totalcount")
             else:
-                error_data = response.json() if response.text else {}
+                error_data = self._error_data(response)
                 raise_glpi_error(error_data, response.status_code)
 
         except requests.RequestException as e:
@@ -246,22 +1219,22 @@ def get_fingerprint(self, itemtype: str, item_id: int) -> Dict[str, Any]:
         }
 
         try:
-            response = requests.get(url, headers=headers, params=params, timeout=10)
+            response = self._get(url, headers, params)
 
             if response.status_code == 200:
-                data = response.json()
+                data = self._json(response)
                 # Return first result if it's a list, otherwise return the item
                 if isinstance(data, list) and len(data) > 0:
                     return data[0]
                 return data
             elif response.status_code == 206:
                 # Partial content (pagination)
-                data = response.json()
+                data = self._json(response)
                 if isinstance(data, list) and len(data) > 0:
                     return data[0]
                 return data
             else:
-                error_data = response.json() if response.text else {}
+                error_data = self._error_data(response)
                 raise_glpi_error(error_data, response.status_code)
 
         except requests.RequestException as e:
@@ -286,32 +1259,35 @@ def list_fingerprints(
         """
         # Construct the plugin field item type
         plugin_itemtype = f"PluginFields{itemtype}fingerprint"
-        url = f"{self.base_url}/{plugin_itemtype}"
-        headers = self._get_headers(include_session=True)
-
-        query_params = {
-            "expand_dropdowns": "true",
-            "get_hateoas": "false",
-            "range": f"{range_start}-{range_start + range_limit - 1}",
-            **params,
-        }
+        items, _ = self._fetch_page(plugin_itemtype, range_start, range_limit, params)
+        return items
+
+    def iter_fingerprints(
+        self,
+        itemtype: str,
+        page_size: int = 50,
+        concurrency: int = 1,
+        stats: Optional[PageStats] = None,
+        **params,
+    ) -> Iterator[Dict[str, Any]]:
+        """Iterate over every fingerprint record of an item type.
 
-        try:
-            response = requests.get(url, headers=headers, params=query_params, timeout=10)
+        Args:
+            itemtype: Type of items (e.g., 'Problem', 'Ticket')
+            page_size: Number of records requested per range window
+            concurrency: Max range windows fetched in parallel
+            stats: Optional PageStats updated as pages arrive
+            **params: Additional query parameters
 
-            if response.status_code == 200:
-                data = response.json()
-                # GLPI returns list directly for range queries
-                return data if isinstance(data, list) else [data]
-            elif response.status_code == 206:
-                # Partial content (pagination)
-                return response.json()
-            else:
-                error_data = response.json() if response.text else {}
-                raise_glpi_error(error_data, response.status_code)
+        Yields:
+            Fingerprint records in server order
 
-        except requests.RequestException as e:
-            raise GLPIError(f"Erro de conex\u00e3o: {str(e)}")
+        Raises:
+            GLPIError: If a request fails
+        """
+        plugin_itemtype = f"PluginFields{itemtype}fingerprint"
+        fetch = functools.partial(self._fetch_page, plugin_itemtype, params=params)
+        return self._iter_pages(fetch, page_size, concurrency, stats)
 
     def search_fingerprint(
         self, itemtype: str, fingerprint_value: str
@@ -330,27 +1306,6 @@ def search_fingerprint(
         """
         # Construct the plugin field item type
         plugin_itemtype = f"PluginFields{itemtype}fingerprint"
-        url = f"{self.base_url}/search/{plugin_itemtype}"
-        headers = self._get_headers(include_session=True)
 
         # Search by the fingerprint field (typically field ID 2 for custom field value)
-        params = {
-            "criteria[0][field]": 2,
-            "criteria[0][searchtype]": "equals",
-            "criteria[0][value]": fingerprint_value,
-            "forcedisplay[0]": 1,
-            "forcedisplay[1]": 2,
-        }
-
-        try:
-            response = requests.get(url, headers=headers, params=params, timeout=10)
-
-            if response.status_code == 200:
-                data = response.json()
-                return data.get("data", [])
-            else:
-                error_data = response.json() if response.text else {}
-                raise_glpi_error(error_data, response.status_code)
-
-        except requests.RequestException as e:
-            raise GLPIError(f"Erro de conex\u00e3o: {str(e)}")
+        return self.search_items(plugin_itemtype, [criterion(2, fingerprint_value, "equals")])
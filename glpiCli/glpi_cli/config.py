@@ -2,11 +2,54 @@
 """Configuration management for GLPI CLI.
 
 Loads configuration from environment variables (priority) or config file.
+Invalid tunable values are collected in Config.errors and reported by
+validate() instead of raising from Config().
 """
 import os
 from pathlib import Path
-from typing import Optional
-import yaml
+from typing import Any, Callable, Dict, List, Optional
+
+DEFAULT_TIMEOUT = 10
+DEFAULT_POOL_SIZE = 10
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_SESSION_TTL = 1200  # GLPI's default session lifetime is 1440s
+DEFAULT_CACHE_TTL = 0  # Revalidate every cached response (ETag/date_mod)
+DEFAULT_CACHE_MAX_MB = 100
+DEFAULT_BATCH_SIZE = 100  # Items per POST/PUT/DELETE in bulk writes
+DEFAULT_DROPDOWN_TTL = 3600
+
+# How list/get fill dropdown fields: names from the server, names from the
+# local dropdown cache, or raw IDs
+DROPDOWN_MODES = ("server", "local", "raw")
+
+
+def _parse_bool(value) -> bool:
+    """Parse a boolean from env var or YAML value."""
+    if isinstance(value, bool):
+        return value
+    return str(value).strip().lower() in ("1", "true", "yes", "on")
+
+
+def _parse_count(value) -> int:
+    """Parse a non-negative integer, clamping negative values to 0."""
+    return max(int(value), 0)
+
+
+# Optional tunables: (attribute / config.yml key, env var, parser, default)
+TUNABLES = [
+    ("timeout", "GLPI_TIMEOUT", float, DEFAULT_TIMEOUT),
+    ("pool_size", "GLPI_POOL_SIZE", int, DEFAULT_POOL_SIZE),
+    ("max_retries", "GLPI_MAX_RETRIES", _parse_count, DEFAULT_MAX_RETRIES),
+    ("session_cache", "GLPI_SESSION_CACHE", _parse_bool, False),
+    ("session_ttl", "GLPI_SESSION_TTL", int, DEFAULT_SESSION_TTL),
+    ("response_cache", "GLPI_RESPONSE_CACHE", _parse_bool, True),
+    ("cache_ttl", "GLPI_CACHE_TTL", int, DEFAULT_CACHE_TTL),
+    ("cache_max_mb", "GLPI_CACHE_MAX_MB", int, DEFAULT_CACHE_MAX_MB),
+    ("rate_limit", "GLPI_RATE_LIMIT", float, 0),
+    ("adaptive", "GLPI_ADAPTIVE_CONCURRENCY", _parse_bool, True),
+    ("dropdowns", "GLPI_DROPDOWNS", str, "server"),
+    ("dropdown_ttl", "GLPI_DROPDOWN_TTL", int, DEFAULT_DROPDOWN_TTL),
+]
 
 
 class Config:
@@ -17,47 +60,86 @@ def __init__(self):
         self.url: Optional[str] = None
         self.app_token: Optional[str] = None
         self.user_token: Optional[str] = None
+        self.timeout: float = DEFAULT_TIMEOUT
+        self.pool_size: int = DEFAULT_POOL_SIZE
+        self.max_retries: int = DEFAULT_MAX_RETRIES
+        self.session_cache: bool = False
+        self.session_ttl: int = DEFAULT_SESSION_TTL
+        self.response_cache: bool = True
+        self.cache_ttl: int = DEFAULT_CACHE_TTL
+        self.cache_max_mb: int = DEFAULT_CACHE_MAX_MB
+        self.rate_limit: float = 0
+        self.adaptive: bool = True
+        self.dropdowns: str = "server"
+        self.dropdown_ttl: int = DEFAULT_DROPDOWN_TTL
+        # Invalid values found while loading, reported by validate()
+        self.errors: List[str] = []
         self._load()
 
     def _load(self):
-        """Load configuration with priority: env vars > config file."""
-        # Try environment variables first (highest priority)
+        """Load configuration with priority: env vars > config file > defaults."""
         self.url = os.getenv("GLPI_URL")
         self.app_token = os.getenv("GLPI_APP_TOKEN")
         self.user_token = os.getenv("GLPI_USER_TOKEN")
 
-        # If any value is missing, try config file
-        if not all([self.url, self.app_token, self.user_token]):
-            self._load_from_file()
-
-    def _load_from_file(self):
-        """Load configuration from ~/.config/glpi/config.yml."""
         config_path = Path.home() / ".config" / "glpi" / "config.yml"
+        data = self._load_file(config_path)
+
+        # Only use file values if env var is not set
+        if not self.url:
+            self.url = data.get("url")
+        if not self.app_token:
+            self.app_token = data.get("app_token")
+        if not self.user_token:
+            self.user_token = data.get("user_token")
+
+        for attr, env_var, parse, _ in TUNABLES:
+            if os.getenv(env_var):
+                self._set_tunable(attr, parse, os.environ[env_var], env_var)
+            elif data.get(attr) is not None:
+                self._set_tunable(attr, parse, data[attr], f"{attr} em {config_path}")
 
+    def _load_file(self, config_path: Path) -> Dict[str, Any]:
+        """Read ~/.config/glpi/config.yml.
+
+        Args:
+            config_path: Config file path
+
+        Returns:
+            File contents ({} if the file is missing or unreadable)
+        """
         if not config_path.exists():
-            return
+            return {}
 
         try:
+            import yaml
+
             with open(config_path, "r") as f:
-                data = yaml.safe_load(f)
-
-            # Only use file values if env var is not set
-            if not self.url:
-                self.url = data.get("url")
-            if not self.app_token:
-                self.app_token = data.get("app_token")
-            if not self.user_token:
-                self.user_token = data.get("user_token")
+                data = yaml.safe_load(f) or {}
         except Exception as e:
-            # Silently ignore file errors, env vars might be enough
-            pass
+            self.errors.append(f"{config_path} ilegível: {e}")
+            return {}
+
+        if not isinstance(data, dict):
+            self.errors.append(f"{config_path} deve conter chave: valor")
+            return {}
+        return data
+
+    def _set_tunable(self, attr: str, parse: Callable[[Any], Any], value: Any, source: str):
+        """Parse and set one tunable, recording an error (and keeping the default) if invalid."""
+        try:
+            setattr(self, attr, parse(value))
+        except (TypeError, ValueError):
+            self.errors.append(f"{source} inválido: {value!r}")
 
     def validate(self) -> tuple[bool, Optional[str]]:
-        """Validate that all required config values are present.
+        """Validate that all required config values are present and parsed.
 
         Returns:
             Tuple of (is_valid, error_message)
         """
+        if self.errors:
+            return False, "; ".join(self.errors)
         if not self.url:
             return False, "GLPI_URL n�o configurado"
         if not self.app_token:
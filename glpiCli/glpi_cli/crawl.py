@@ -0,0 +1,215 @@
+# -*- coding: utf-8 -*-
+"""Breadth-first walk over items linked to a GLPI item (glpi crawl).
+
+Links come from the get_item expansions (_tickets, _connections,
+_networkports, ...) and, for tickets, problems and changes, from their
+linked-items sub-resource (Ticket/:id/Item_Ticket), which is where GLPI
+keeps the computers and other assets of an incident. Each depth layer is
+fetched on a thread pool; a seen-set keyed by (itemtype, id) makes every
+item cost at most one request even when several parents point at it, and
+get_item still answers repeated runs from the response cache.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from .errors import GLPIError
+from .expansions import CRAWL_EXPANSIONS
+from .utils import project_fields
+
+if TYPE_CHECKING:
+    from .client import GLPIClient
+
+# Expansion block -> (itemtype of its rows, keys holding the linked ID in
+# order of preference); a None itemtype means the block is keyed by itemtype
+EXPANSION_LINKS = {
+    "_connections": (None, ("id",)),
+    "_networkports": ("NetworkPort", ("netport_id", "id")),
+    # Rows are Contract_Item links: their own id isn't a Contract ID
+    "_contracts": ("Contract", ("contracts_id",)),
+    "_documents": ("Document", ("id",)),
+    "_tickets": ("Ticket", ("id",)),
+    "_problems": ("Problem", ("id",)),
+    "_changes": ("Change", ("id",)),
+}
+
+# ITIL itemtype -> sub-resource listing its linked items (itemtype + items_id)
+LINKED_ITEMS = {
+    "Ticket": "Item_Ticket",
+    "Problem": "Item_Problem",
+    "Change": "Change_Item",
+}
+
+Node = Tuple[str, int]
+
+
+def node_key(itemtype: str, item_id: int) -> str:
+    """Graph identifier of an item.
+
+    Examples:
+        >>> node_key("Ticket", 123)
+        'Ticket/123'
+    """
+    return f"{itemtype}/{item_id}"
+
+
+def _rows(block: Any) -> Iterator[Dict[str, Any]]:
+    """Rows of an expansion block: a list, or a dictionary of rows by ID."""
+    values = block.values() if isinstance(block, dict) else block
+    for row in values or ():
+        if isinstance(row, dict):
+            yield row
+
+
+def _row_id(row: Dict[str, Any], keys: Iterable[str]) -> Optional[int]:
+    for key in keys:
+        value = row.get(key)
+        # GLPI uses 0 for "no item"; names mean expand_dropdowns replaced the ID
+        if isinstance(value, int) and value > 0:
+            return value
+        if isinstance(value, str) and value.isdigit() and int(value) > 0:
+            return int(value)
+    return None
+
+
+def expansion_links(item: Dict[str, Any]) -> Iterator[Tuple[Node, str]]:
+    """Find the items an expanded item points at.
+
+    Examples:
+        >>> item = {"_tickets": [{"id": 7}], "_connections": {"Monitor": [{"id": 3}]}}
+        >>> sorted(expansion_links(item))
+        [(('Monitor', 3), '_connections'), (('Ticket', 7), '_tickets')]
+
+    Args:
+        item: get_item result with expansions
+
+    Yields:
+        Tuples of ((itemtype, id), expansion key)
+    """
+    for key, (itemtype, id_keys) in EXPANSION_LINKS.items():
+        block = item.get(key)
+        if not block:
+            continue
+        if itemtype is None:
+            groups = block.items() if isinstance(block, dict) else ()
+        elif key == "_networkports" and isinstance(block, dict):
+            # Ports are grouped by instantiation type (NetworkPortEthernet, ...)
+            groups = ((itemtype, rows) for rows in block.values())
+        else:
+            groups = [(itemtype, block)]
+
+        for linked_type, rows in groups:
+            for row in _rows(rows):
+                linked_id = _row_id(row, id_keys)
+                if linked_id is not None:
+                    yield (linked_type, linked_id), key
+
+
+def crawl(
+    client: "GLPIClient",
+    itemtype: str,
+    item_id: int,
+    depth: int = 1,
+    workers: int = 8,
+    expand: Optional[Iterable[str]] = None,
+    follow: Optional[Iterable[str]] = None,
+    max_nodes: int = 500,
+    use_cache: bool = True,
+    fields: Optional[Iterable[str]] = None,
+) -> Dict[str, Any]:
+    """Fetch an item and the items linked to it, layer by layer.
+
+    Args:
+        client: GLPI client with an open session
+        itemtype: Type of the starting item
+        item_id: ID of the starting item
+        depth: Link hops to follow from the starting item (0 = only itself)
+        workers: Max parallel requests within a layer
+        expand: Expansions requested per item (default: CRAWL_EXPANSIONS)
+        follow: Only follow links to these itemtypes (default: all)
+        max_nodes: Stop adding items once the graph has this many
+        use_cache: Consult the response cache (if configured)
+        fields: Keep only these top-level keys of each item in the output
+
+    Returns:
+        Graph dictionary with root, depth, nodes (itemtype, id, depth and
+        item or error), edges (from, to, via) and truncated (max_nodes reached)
+
+    Raises:
+        GLPIError: If the starting item can't be fetched
+    """
+    expand = [*(CRAWL_EXPANSIONS if expand is None else expand)]
+    follow_types = set(follow) if follow else None
+    fields = [*fields] if fields else None
+
+    def visit(node: Node, last_layer: bool):
+        """Fetch one item; returns (projected item, links, GLPIError or None)."""
+        node_type, node_id = node
+        try:
+            item = client.get_item(
+                node_type, node_id, use_cache=use_cache, profile="minimal", expand=expand
+            )
+        except GLPIError as e:
+            return None, [], e
+
+        links = [*expansion_links(item)]
+        sub_itemtype = LINKED_ITEMS.get(node_type)
+        # Links of the last layer aren't followed, so skip the extra request
+        if sub_itemtype and not last_layer:
+            try:
+                path = f"{node_type}/{node_id}/{sub_itemtype}"
+                rows = client.list_items(path, 0, max_nodes, expand_dropdowns="false")
+            except GLPIError:
+                # ERROR_RANGE_EXCEED_TOTAL / no rights: no linked items to follow
+                rows = []
+            for row in rows:
+                linked_id = _row_id(row, ("items_id",))
+                if row.get("itemtype") and linked_id is not None:
+                    links.append(((row["itemtype"], linked_id), sub_itemtype))
+        return project_fields(item, fields), links, None
+
+    root = (itemtype, item_id)
+    seen: Set[Node] = {root}
+    layer = [root]
+    nodes: List[Dict[str, Any]] = []
+    edges: List[Dict[str, str]] = []
+    truncated = False
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        for level in range(depth + 1):
+            next_layer: List[Node] = []
+            results = executor.map(visit, layer, [level == depth] * len(layer))
+            for node, (item, links, error) in zip(layer, results):
+                if error is not None and node == root:
+                    raise error
+
+                entry: Dict[str, Any] = {"itemtype": node[0], "id": node[1], "depth": level}
+                if error is None:
+                    entry["item"] = item
+                else:
+                    entry["error"] = error.message
+                nodes.append(entry)
+
+                if level == depth:
+                    continue
+                for linked, via in links:
+                    if follow_types is not None and linked[0] not in follow_types:
+                        continue
+                    if linked not in seen:
+                        if len(seen) >= max_nodes:
+                            truncated = True
+                            continue
+                        seen.add(linked)
+                        next_layer.append(linked)
+                    edges.append({"from": node_key(*node), "to": node_key(*linked), "via": via})
+
+            if not next_layer:
+                break
+            layer = next_layer
+
+    return {
+        "root": node_key(*root),
+        "depth": depth,
+        "nodes": nodes,
+        "edges": edges,
+        "truncated": truncated,
+    }
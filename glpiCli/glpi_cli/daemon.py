@@ -0,0 +1,309 @@
+# -*- coding: utf-8 -*-
+"""Local Unix-socket daemon that runs glpi commands on a warm client (glpi serve).
+
+Every `glpi` invocation pays for Python start-up, imports, a TLS handshake
+and initSession before its first real request. `glpi serve --socket` keeps
+one authenticated GLPIClient, its connection pool and the response cache
+open; with GLPI_SOCKET set, `glpi` forwards its arguments to the daemon and
+only relays the output.
+
+Protocol: newline-delimited JSON over the socket. The client sends
+{"argv", "cwd", "columns"}; the daemon answers with {"out": text} and
+{"err": text} frames, asks for {"stdin": size} each time the command needs
+more standard input (the client replies {"stdin": text} with what it has
+available, up to size bytes, and "" at end of input) and ends with
+{"exit": code}. Commands run one at a time, in the daemon's main thread.
+"""
+import codecs
+import io
+import os
+import shutil
+import signal
+import socket
+import sys
+import time
+import traceback
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, TextIO
+
+from . import fast_json
+from .errors import GLPIError
+from .session_cache import default_cache_dir
+
+# Bytes of standard input asked for per {"stdin"} frame
+STDIN_CHUNK_SIZE = 64 * 1024
+
+
+def default_socket_path() -> Path:
+    """Get the default daemon socket.
+
+    Returns:
+        <cache dir>/daemon.sock
+    """
+    return default_cache_dir() / "daemon.sock"
+
+
+class _Channel:
+    """JSON frames, one per line, over a connected socket."""
+
+    def __init__(self, sock: socket.socket):
+        self._file = sock.makefile("rwb")
+
+    def send(self, frame: Dict[str, Any]):
+        self._file.write(fast_json.dumps(frame).encode("utf-8") + b"\n")
+        self._file.flush()
+
+    def receive(self) -> Optional[Dict[str, Any]]:
+        line = self._file.readline()
+        return fast_json.loads(line) if line else None
+
+    def close(self):
+        self._file.close()
+
+
+class _FrameWriter(io.TextIOBase):
+    """Text stream sending every write as an {"out"} or {"err"} frame."""
+
+    # click and rich only wrap streams lacking these
+    encoding = "utf-8"
+    errors = "strict"
+
+    def __init__(self, channel: _Channel, key: str):
+        self._channel = channel
+        self._key = key
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        # click probes streams with write(b"") to detect binary ones
+        if not isinstance(text, str):
+            raise TypeError(f"write() argument must be str, not {type(text).__name__}")
+        if text:
+            self._channel.send({self._key: text})
+        return len(text)
+
+
+class _RemoteStdin(io.TextIOBase):
+    """Standard input of the forwarding process, fetched a chunk at a time."""
+
+    encoding = "utf-8"
+    errors = "strict"
+
+    def __init__(self, channel: _Channel):
+        self._channel = channel
+        # Text received and not read yet is self._pending[self._pos:]
+        self._pending = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self) -> bool:
+        """Append the next chunk to the pending text; False at end of input."""
+        if self._eof:
+            return False
+        self._channel.send({"stdin": STDIN_CHUNK_SIZE})
+        reply = self._channel.receive() or {}
+        chunk = reply.get("stdin") or ""
+        if not chunk:
+            self._eof = True
+            return False
+        self._pending = self._pending[self._pos :] + chunk
+        self._pos = 0
+        return True
+
+    def _take(self, count: int) -> str:
+        end = min(self._pos + count, len(self._pending))
+        text = self._pending[self._pos : end]
+        self._pos = end
+        return text
+
+    def _available(self) -> int:
+        return len(self._pending) - self._pos
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: Optional[int] = -1) -> str:
+        if size is None or size < 0:
+            chunks = [self._take(self._available())]
+            while self._fill():
+                chunks.append(self._take(self._available()))
+            return "".join(chunks)
+        while self._available() < size and self._fill():
+            pass
+        return self._take(size)
+
+    def readline(self, size: Optional[int] = -1) -> str:
+        limit = size if size is not None and size >= 0 else None
+        while True:
+            newline = self._pending.find("\n", self._pos)
+            if newline >= 0:
+                count = newline + 1 - self._pos
+                break
+            if (limit is not None and self._available() >= limit) or not self._fill():
+                count = self._available()
+                break
+        return self._take(count if limit is None else min(count, limit))
+
+
+def _read_available(stdin: TextIO, decoder: codecs.IncrementalDecoder, size: int) -> str:
+    """Read what standard input has available, up to size bytes.
+
+    Returns as soon as any input arrives, so commands fed by a slow pipe see
+    each line when it's written rather than once size bytes have piled up.
+
+    Returns:
+        Decoded text, or "" at end of input
+    """
+    buffer = getattr(stdin, "buffer", None)
+    if buffer is None or not hasattr(buffer, "read1"):
+        return stdin.read(size)
+    while True:
+        data = buffer.read1(size)
+        text = decoder.decode(data, final=not data)
+        # Only part of a multi-byte character arrived: wait for the rest
+        if text or not data:
+            return text
+
+
+def _handle(conn: socket.socket, run: Callable[[List[str]], int]):
+    """Run one forwarded command with its I/O bound to the connection."""
+    channel = _Channel(conn)
+    try:
+        request = channel.receive()
+        if not isinstance(request, dict) or not isinstance(request.get("argv"), list):
+            return
+        argv = [str(arg) for arg in request["argv"]]
+
+        started = time.monotonic()
+        cwd = os.getcwd()
+        columns = os.environ.get("COLUMNS")
+        streams = sys.stdin, sys.stdout, sys.stderr
+        try:
+            os.chdir(request.get("cwd") or cwd)
+            if request.get("columns"):
+                os.environ["COLUMNS"] = str(request["columns"])
+            sys.stdin = _RemoteStdin(channel)
+            sys.stdout = _FrameWriter(channel, "out")
+            sys.stderr = _FrameWriter(channel, "err")
+            try:
+                code = run(argv)
+            except Exception:
+                sys.stderr.write(traceback.format_exc())
+                code = 1
+        finally:
+            sys.stdin, sys.stdout, sys.stderr = streams
+            os.chdir(cwd)
+            if columns is None:
+                os.environ.pop("COLUMNS", None)
+            else:
+                os.environ["COLUMNS"] = columns
+
+        channel.send({"exit": code})
+        elapsed = (time.monotonic() - started) * 1000
+        print(f"glpi {' '.join(argv)} -> {code} ({elapsed:.0f} ms)", file=sys.stderr)
+    except OSError:
+        # The forwarding process went away (Ctrl+C, closed pipe)
+        pass
+    finally:
+        channel.close()
+
+
+def _claim(path: Path):
+    """Remove a socket left behind by a dead daemon.
+
+    Raises:
+        GLPIError: If another daemon is answering on path
+    """
+    if not path.exists():
+        return
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(str(path))
+    except OSError:
+        path.unlink()
+    else:
+        raise GLPIError(f"Já existe um daemon escutando em {path}")
+    finally:
+        probe.close()
+
+
+def serve(path: Path, run: Callable[[List[str]], int], ready: Optional[Callable[[], None]] = None):
+    """Answer forwarded commands until SIGINT/SIGTERM.
+
+    Args:
+        path: Socket file, created readable only by the owner
+        run: Runs one command line and returns its exit code
+        ready: Called once the socket accepts connections
+
+    Raises:
+        GLPIError: If another daemon already listens on path
+    """
+    path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+    _claim(path)
+
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    umask = os.umask(0o177)
+    try:
+        listener.bind(str(path))
+    finally:
+        os.umask(umask)
+    listener.listen(16)
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+
+    try:
+        if ready:
+            ready()
+        while True:
+            conn, _ = listener.accept()
+            with conn:
+                _handle(conn, run)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        listener.close()
+        path.unlink()
+
+
+def forward(path: Path, argv: List[str]) -> Optional[int]:
+    """Run a command line on the daemon, relaying its output.
+
+    Args:
+        path: Daemon socket
+        argv: Arguments after `glpi`
+
+    Returns:
+        Exit code of the command, or None if no daemon answers on path
+    """
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(str(path))
+    except OSError:
+        sock.close()
+        return None
+
+    with sock:
+        channel = _Channel(sock)
+        decoder = codecs.getincrementaldecoder("utf-8")("replace")
+        channel.send(
+            {
+                "argv": argv,
+                "cwd": os.getcwd(),
+                "columns": shutil.get_terminal_size().columns,
+            }
+        )
+        while True:
+            frame = channel.receive()
+            if frame is None:
+                sys.stderr.write(f"Conexão com o daemon {path} encerrada\n")
+                return 1
+            if "out" in frame:
+                sys.stdout.write(frame["out"])
+            elif "err" in frame:
+                sys.stdout.flush()
+                sys.stderr.write(frame["err"])
+            elif "stdin" in frame:
+                channel.send({"stdin": _read_available(sys.stdin, decoder, frame["stdin"])})
+            elif "exit" in frame:
+                sys.stdout.flush()
+                return frame["exit"]
@@ -0,0 +1,296 @@
+# -*- coding: utf-8 -*-
+"""Client-side resolution of dropdown IDs (glpi list/get --dropdowns local).
+
+With expand_dropdowns=true GLPI looks up the name of every foreign key of
+every row it returns. DropdownCache fetches the rows with raw IDs instead and
+replaces them locally: each dropdown itemtype a listing references (Entity,
+Location, User, Group, ITILCategory, ...) is downloaded once in bulk into
+SQLite and reused by later commands until its TTL expires.
+"""
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional, Set
+
+from .config import DEFAULT_DROPDOWN_TTL
+from .errors import GLPIError
+from .session_cache import server_cache_dir
+
+if TYPE_CHECKING:
+    from .client import GLPIClient
+
+# Foreign key -> dropdown itemtype; suffixed keys (users_id_tech) use their base
+DROPDOWN_ITEMTYPES = {
+    "entities_id": "Entity",
+    "locations_id": "Location",
+    "users_id": "User",
+    "groups_id": "Group",
+    "itilcategories_id": "ITILCategory",
+    "states_id": "State",
+    "requesttypes_id": "RequestType",
+    "manufacturers_id": "Manufacturer",
+    "suppliers_id": "Supplier",
+    "computertypes_id": "ComputerType",
+    "computermodels_id": "ComputerModel",
+    "networkequipmenttypes_id": "NetworkEquipmentType",
+    "networkequipmentmodels_id": "NetworkEquipmentModel",
+    "operatingsystems_id": "OperatingSystem",
+    "solutiontypes_id": "SolutionType",
+    "usercategories_id": "UserCategory",
+    "usertitles_id": "UserTitle",
+}
+
+BATCH_SIZE = 1000
+
+_FOREIGN_KEY = re.compile(r"^([a-z]+s_id)(?:_[a-z]+)?$")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS dropdowns (
+    itemtype TEXT NOT NULL,
+    id INTEGER NOT NULL,
+    name TEXT,
+    PRIMARY KEY (itemtype, id)
+);
+CREATE TABLE IF NOT EXISTS dropdown_state (
+    itemtype TEXT PRIMARY KEY,
+    loaded_at REAL NOT NULL
+);
+"""
+
+
+def dropdown_itemtype(field: str) -> Optional[str]:
+    """Dropdown itemtype a field points at.
+
+    Examples:
+        >>> dropdown_itemtype("users_id_recipient")
+        'User'
+        >>> dropdown_itemtype("itilcategories_id")
+        'ITILCategory'
+        >>> dropdown_itemtype("items_id") is None
+        True
+
+    Args:
+        field: Item key
+
+    Returns:
+        Itemtype from DROPDOWN_ITEMTYPES, or None if the field isn't a known dropdown
+    """
+    match = _FOREIGN_KEY.match(field)
+    return DROPDOWN_ITEMTYPES.get(match.group(1)) if match else None
+
+
+def display_name(itemtype: str, row: Dict[str, Any]) -> str:
+    """Name GLPI shows for a dropdown row.
+
+    Tree dropdowns (Entity, Location, ITILCategory, Group) use their full
+    path; users their real name when set, like expand_dropdowns does.
+
+    Examples:
+        >>> display_name("Location", {"name": "Rack 12", "completename": "SP > Rack 12"})
+        'SP > Rack 12'
+        >>> display_name("User", {"name": "jsilva", "realname": "Silva", "firstname": "João"})
+        'Silva João'
+
+    Args:
+        itemtype: Dropdown itemtype
+        row: Row fetched with expand_dropdowns=false
+
+    Returns:
+        Display name
+    """
+    if itemtype == "User":
+        realname = " ".join(filter(None, (row.get("realname"), row.get("firstname"))))
+        return realname or str(row.get("name") or "")
+    return str(row.get("completename") or row.get("name") or "")
+
+
+class DropdownCache:
+    """SQLite-backed dropdown ID -> name tables with a TTL."""
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        ttl: int = DEFAULT_DROPDOWN_TTL,
+        url: Optional[str] = None,
+    ):
+        """Open (or create) the cache.
+
+        Args:
+            path: SQLite file (default: <server cache dir>/dropdowns.sqlite)
+            ttl: Seconds a downloaded dropdown table is used before reloading it
+            url: GLPI API URL the tables are downloaded from (selects the default file)
+        """
+        self.path = path or server_cache_dir(url) / "dropdowns.sqlite"
+        self.path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+        self.ttl = ttl
+        self.conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self.conn.executescript(_SCHEMA)
+        self._names: Dict[str, Dict[int, str]] = {}
+        # When each table in _names was downloaded (long-lived processes expire them)
+        self._loaded_at: Dict[str, float] = {}
+        # Itemtypes reloaded (or found unreadable) by this process
+        self._reloaded: Set[str] = set()
+        self._lock = threading.RLock()
+
+    def close(self):
+        """Close the database."""
+        self.conn.close()
+
+    def state(self) -> List[Dict[str, Any]]:
+        """Get the cached dropdown tables.
+
+        Returns:
+            List of {itemtype, entries, loaded_at, fresh} dictionaries
+        """
+        rows = self.conn.execute(
+            "SELECT s.itemtype, s.loaded_at, "
+            "(SELECT COUNT(*) FROM dropdowns d WHERE d.itemtype = s.itemtype) "
+            "FROM dropdown_state s ORDER BY s.itemtype"
+        ).fetchall()
+        now = time.time()
+        return [
+            {
+                "itemtype": row[0],
+                "entries": row[2],
+                "loaded_at": row[1],
+                "fresh": now - row[1] < self.ttl,
+            }
+            for row in rows
+        ]
+
+    def clear(self):
+        """Drop every cached table."""
+        with self._lock, self.conn:
+            self.conn.execute("DELETE FROM dropdowns")
+            self.conn.execute("DELETE FROM dropdown_state")
+            self._names.clear()
+            self._loaded_at.clear()
+            self._reloaded.clear()
+
+    def load(
+        self, client: "GLPIClient", itemtype: str, page_size: int = 500, concurrency: int = 4
+    ) -> int:
+        """Download a dropdown table, replacing the cached copy.
+
+        Args:
+            client: GLPI client with an open session
+            itemtype: Dropdown itemtype (e.g., 'Location')
+            page_size: Rows per range window
+            concurrency: Range windows fetched in parallel
+
+        Returns:
+            Number of rows cached
+        """
+        rows = client.iter_items(
+            itemtype, page_size=page_size, concurrency=concurrency, expand_dropdowns="false"
+        )
+        names: Dict[int, str] = {}
+        with self._lock, self.conn:
+            self.conn.execute("DELETE FROM dropdowns WHERE itemtype = ?", (itemtype,))
+            batch = []
+            for row in rows:
+                names[row["id"]] = display_name(itemtype, row)
+                batch.append((itemtype, row["id"], names[row["id"]]))
+                if len(batch) >= BATCH_SIZE:
+                    self._write_batch(batch)
+                    batch = []
+            self._write_batch(batch)
+            self.conn.execute(
+                "INSERT OR REPLACE INTO dropdown_state (itemtype, loaded_at) VALUES (?, ?)",
+                (itemtype, time.time()),
+            )
+            self._names[itemtype] = names
+            self._loaded_at[itemtype] = time.time()
+            self._reloaded.add(itemtype)
+        return len(names)
+
+    def _write_batch(self, batch: List[tuple]):
+        self.conn.executemany(
+            "INSERT INTO dropdowns (itemtype, id, name) VALUES (?, ?, ?)", batch
+        )
+
+    def names(self, client: "GLPIClient", itemtype: str) -> Dict[int, str]:
+        """Get the ID -> name table of a dropdown, loading it if missing or expired.
+
+        An itemtype the user can't read resolves to an empty table (IDs stay raw).
+
+        Args:
+            client: GLPI client with an open session
+            itemtype: Dropdown itemtype
+
+        Returns:
+            Dictionary of ID -> display name
+        """
+        with self._lock:
+            if itemtype in self._names and time.time() - self._loaded_at[itemtype] < self.ttl:
+                return self._names[itemtype]
+
+            row = self.conn.execute(
+                "SELECT loaded_at FROM dropdown_state WHERE itemtype = ?", (itemtype,)
+            ).fetchone()
+            if row is not None and time.time() - row[0] < self.ttl:
+                self._names[itemtype] = dict(
+                    self.conn.execute(
+                        "SELECT id, name FROM dropdowns WHERE itemtype = ?", (itemtype,)
+                    )
+                )
+                self._loaded_at[itemtype] = row[0]
+                return self._names[itemtype]
+
+            try:
+                self.load(client, itemtype)
+            except GLPIError:
+                self._names[itemtype] = {}
+                self._loaded_at[itemtype] = time.time()
+                self._reloaded.add(itemtype)
+            return self._names[itemtype]
+
+    def resolve(self, client: "GLPIClient", item: Dict[str, Any]) -> Dict[str, Any]:
+        """Replace the dropdown IDs of an item by their names.
+
+        An ID missing from a table loaded by an earlier command triggers one
+        reload of that table (it was probably created since); IDs still
+        unknown, and 0 ("none") where the table has no such row, stay as is.
+
+        Args:
+            client: GLPI client with an open session
+            item: Item fetched with expand_dropdowns=false
+
+        Returns:
+            New dictionary with names in place of dropdown IDs
+        """
+        if not isinstance(item, dict):
+            return item
+
+        resolved = dict(item)
+        for field, value in item.items():
+            if not isinstance(value, int) or isinstance(value, bool):
+                continue
+            itemtype = dropdown_itemtype(field)
+            if itemtype is None:
+                continue
+
+            names = self.names(client, itemtype)
+            if value not in names and value > 0 and itemtype not in self._reloaded:
+                with self._lock:
+                    if itemtype not in self._reloaded:
+                        try:
+                            self.load(client, itemtype)
+                        except GLPIError:
+                            self._reloaded.add(itemtype)
+                names = self._names.get(itemtype, names)
+            resolved[field] = names.get(value, value)
+        return resolved
+
+    def resolve_rows(
+        self, client: "GLPIClient", rows: Iterable[Dict[str, Any]]
+    ) -> Iterator[Dict[str, Any]]:
+        """Resolve a stream of items (see resolve).
+
+        Yields:
+            Items with names in place of dropdown IDs
+        """
+        for row in rows:
+            yield self.resolve(client, row)
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""Sub-resources GLPI can embed in item responses, and named sets of them.
+
+Kept apart from client.py so the CLI can build its options without
+importing requests.
+"""
+from typing import Dict, Iterable, Optional
+
+from .errors import GLPIError
+
+# Sub-resources GLPI can embed in GET /:itemtype/:id (sent as with_<name>=true)
+EXPANSIONS = (
+    "devices",
+    "disks",
+    "softwares",
+    "connections",
+    "networkports",
+    "infocoms",
+    "contracts",
+    "documents",
+    "tickets",
+    "problems",
+    "changes",
+    "notes",
+    "logs",
+)
+
+# Named sets of expansions for get_item; "full" is the historical default
+EXPANSION_PROFILES = {
+    "minimal": (),
+    "assets": ("devices", "disks", "softwares", "connections", "networkports"),
+    "full": tuple(name for name in EXPANSIONS if name != "logs"),
+}
+
+# Expansions requested while crawling (glpi crawl): those whose rows point at other items
+CRAWL_EXPANSIONS = (
+    "connections",
+    "networkports",
+    "contracts",
+    "documents",
+    "tickets",
+    "problems",
+    "changes",
+)
+
+
+def expansion_params(
+    profile: str = "full", expand: Optional[Iterable[str]] = None
+) -> Dict[str, str]:
+    """Build with_* query parameters for an expansion profile.
+
+    Args:
+        profile: Profile name from EXPANSION_PROFILES
+        expand: Extra expansions to enable
+
+    Returns:
+        Dictionary of with_<name>=true parameters
+
+    Raises:
+        GLPIError: If the profile or an expansion is unknown
+    """
+    if profile not in EXPANSION_PROFILES:
+        raise GLPIError(
+            f"Perfil de expans\u00e3o desconhecido: {profile} "
+            f"(dispon\u00edveis: {', '.join(EXPANSION_PROFILES)})"
+        )
+
+    names = [*EXPANSION_PROFILES[profile], *(expand or ())]
+    unknown = [name for name in names if name not in EXPANSIONS]
+    if unknown:
+        raise GLPIError(
+            f"Expans\u00e3o desconhecida: {', '.join(unknown)} "
+            f"(dispon\u00edveis: {', '.join(EXPANSIONS)})"
+        )
+
+    return {f"with_{name}": "true" for name in EXPANSIONS if name in names}
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+"""JSON encoding and decoding through the fastest available backend.
+
+orjson is used when installed, then ujson, then the standard library; set
+GLPI_JSON_BACKEND=stdlib|ujson|orjson to force one. All backends produce
+the same text: UTF-8 (no ASCII escaping), compact separators or a 2-space
+indent, and str() for values JSON can't represent.
+"""
+import json
+import os
+from typing import Any, Callable, Dict, List, Tuple, Union
+
+# Backends in order of preference
+BACKENDS = ("orjson", "ujson", "stdlib")
+
+Loads = Callable[[Union[bytes, str]], Any]
+Dumps = Callable[..., str]
+
+
+def _stdlib() -> Tuple[Loads, Dumps]:
+    def dumps(obj: Any, indent: bool = False) -> str:
+        if indent:
+            return json.dumps(obj, indent=2, ensure_ascii=False, default=str)
+        return json.dumps(obj, ensure_ascii=False, default=str, separators=(",", ":"))
+
+    return json.loads, dumps
+
+
+def _orjson() -> Tuple[Loads, Dumps]:
+    import orjson
+
+    _, stdlib_dumps = _stdlib()
+
+    def dumps(obj: Any, indent: bool = False) -> str:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        try:
+            return orjson.dumps(obj, default=str, option=option).decode("utf-8")
+        except orjson.JSONEncodeError:
+            # e.g. integers beyond 64 bits
+            return stdlib_dumps(obj, indent)
+
+    return orjson.loads, dumps
+
+
+def _ujson() -> Tuple[Loads, Dumps]:
+    import ujson
+
+    def dumps(obj: Any, indent: bool = False) -> str:
+        return ujson.dumps(
+            obj,
+            indent=2 if indent else 0,
+            ensure_ascii=False,
+            escape_forward_slashes=False,
+            default=str,
+        )
+
+    return ujson.loads, dumps
+
+
+_LOADERS: Dict[str, Callable[[], Tuple[Loads, Dumps]]] = {
+    "orjson": _orjson,
+    "ujson": _ujson,
+    "stdlib": _stdlib,
+}
+
+
+def load_backend(name: str) -> Tuple[Loads, Dumps]:
+    """Get the (loads, dumps) pair of a backend.
+
+    Args:
+        name: One of BACKENDS
+
+    Returns:
+        Tuple of (loads, dumps)
+
+    Raises:
+        ImportError: If the backend's package isn't installed
+    """
+    return _LOADERS[name]()
+
+
+def available_backends() -> List[str]:
+    """Backends that can be loaded here, in order of preference."""
+    names = []
+    for name in BACKENDS:
+        try:
+            load_backend(name)
+        except ImportError:
+            continue
+        names.append(name)
+    return names
+
+
+def _select() -> Tuple[str, Loads, Dumps]:
+    forced = os.getenv("GLPI_JSON_BACKEND")
+    for name in (forced,) if forced in _LOADERS else BACKENDS:
+        try:
+            return (name, *load_backend(name))
+        except ImportError:
+            continue
+    return ("stdlib", *_stdlib())
+
+
+# loads(bytes | str) -> Any and dumps(obj, indent=False) -> str of the selected backend
+BACKEND, loads, dumps = _select()
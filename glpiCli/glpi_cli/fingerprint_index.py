@@ -0,0 +1,224 @@
+# -*- coding: utf-8 -*-
+"""Local index of Plugin Fields fingerprint records.
+
+Deduplicating alerts with search_fingerprint costs one API round trip per
+lookup. The index downloads every fingerprint record of an item type once
+(list_fingerprints pagination) into SQLite, then keeps it current by
+fetching only records modified since the last sync (date_mod watermark).
+Lookups are answered locally from an indexed column.
+"""
+import sqlite3
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional
+
+from .choices import DEFAULT_FINGERPRINT_FIELD
+from .errors import GLPIError
+from .session_cache import server_cache_dir
+
+if TYPE_CHECKING:
+    from .client import GLPIClient
+
+BATCH_SIZE = 1000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS fingerprints (
+    itemtype TEXT NOT NULL,
+    record_id INTEGER NOT NULL,
+    items_id INTEGER,
+    value TEXT,
+    date_mod TEXT,
+    PRIMARY KEY (itemtype, record_id)
+);
+CREATE INDEX IF NOT EXISTS idx_fingerprints_value ON fingerprints (itemtype, value);
+CREATE TABLE IF NOT EXISTS sync_state (
+    itemtype TEXT PRIMARY KEY,
+    field TEXT NOT NULL,
+    watermark TEXT,
+    synced_at REAL NOT NULL
+);
+"""
+
+
+class FingerprintIndex:
+    """SQLite-backed fingerprint value -> item lookup."""
+
+    def __init__(self, path: Optional[Path] = None, url: Optional[str] = None):
+        """Open (or create) the index.
+
+        Args:
+            path: SQLite file (default: <server cache dir>/fingerprints.sqlite)
+            url: GLPI API URL the records are downloaded from (selects the default file)
+        """
+        self.path = path or server_cache_dir(url) / "fingerprints.sqlite"
+        self.path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+        self.conn = sqlite3.connect(str(self.path))
+        self.conn.executescript(_SCHEMA)
+
+    def close(self):
+        """Close the database."""
+        self.conn.close()
+
+    def state(self, itemtype: str) -> Optional[Dict[str, Any]]:
+        """Get sync metadata of an item type.
+
+        Args:
+            itemtype: Type of items (e.g., 'Problem')
+
+        Returns:
+            Dictionary with field, watermark, synced_at and records, or None if never built
+        """
+        row = self.conn.execute(
+            "SELECT field, watermark, synced_at FROM sync_state WHERE itemtype = ?", (itemtype,)
+        ).fetchone()
+        if row is None:
+            return None
+
+        (records,) = self.conn.execute(
+            "SELECT COUNT(*) FROM fingerprints WHERE itemtype = ?", (itemtype,)
+        ).fetchone()
+        return {"field": row[0], "watermark": row[1], "synced_at": row[2], "records": records}
+
+    def build(
+        self,
+        client: "GLPIClient",
+        itemtype: str,
+        field: str = DEFAULT_FINGERPRINT_FIELD,
+        page_size: int = 200,
+        concurrency: int = 4,
+    ) -> int:
+        """Download every fingerprint record, replacing the current index.
+
+        Args:
+            client: GLPI client with an open session
+            itemtype: Type of items (e.g., 'Problem')
+            field: Record key holding the fingerprint value
+            page_size: Records per range window
+            concurrency: Range windows fetched in parallel
+
+        Returns:
+            Number of records indexed
+        """
+        records = client.iter_fingerprints(
+            itemtype, page_size=page_size, concurrency=concurrency, expand_dropdowns="false"
+        )
+        with self.conn:
+            self.conn.execute("DELETE FROM fingerprints WHERE itemtype = ?", (itemtype,))
+            count, watermark = self._upsert(itemtype, field, records)
+            self._save_state(itemtype, field, watermark)
+        return count
+
+    def sync(self, client: "GLPIClient", itemtype: str, page_size: int = 200) -> int:
+        """Fetch records modified since the last sync, newest first.
+
+        Records deleted on the server are only dropped by a full build().
+
+        Args:
+            client: GLPI client with an open session
+            itemtype: Type of items (e.g., 'Problem')
+            page_size: Records per range window
+
+        Returns:
+            Number of records upserted
+
+        Raises:
+            GLPIError: If the index was never built for this item type
+        """
+        state = self.state(itemtype)
+        if state is None:
+            raise GLPIError(f"Índice de {itemtype} ainda não foi criado (use build)")
+
+        watermark = state["watermark"]
+        records = client.iter_fingerprints(
+            itemtype,
+            page_size=page_size,
+            expand_dropdowns="false",
+            sort="date_mod",
+            order="DESC",
+        )
+
+        def modified_since_watermark() -> Iterator[Dict[str, Any]]:
+            for record in records:
+                # Equal timestamps are re-read: same-second updates may be new
+                if watermark and (record.get("date_mod") or "") < watermark:
+                    return
+                yield record
+
+        with self.conn:
+            count, new_watermark = self._upsert(
+                itemtype, state["field"], modified_since_watermark()
+            )
+            if new_watermark and (not watermark or new_watermark > watermark):
+                watermark = new_watermark
+            self._save_state(itemtype, state["field"], watermark)
+        return count
+
+    def lookup(self, itemtype: str, value: str) -> List[Dict[str, Any]]:
+        """Find records with an exact fingerprint value.
+
+        Args:
+            itemtype: Type of items (e.g., 'Problem')
+            value: Fingerprint value
+
+        Returns:
+            List of {id, items_id, date_mod} dictionaries
+        """
+        rows = self.conn.execute(
+            "SELECT record_id, items_id, date_mod FROM fingerprints "
+            "WHERE itemtype = ? AND value = ?",
+            (itemtype, value),
+        ).fetchall()
+        return [{"id": row[0], "items_id": row[1], "date_mod": row[2]} for row in rows]
+
+    def lookup_many(self, itemtype: str, values: Iterable[str]) -> Iterator[Dict[str, Any]]:
+        """Look up a batch of values.
+
+        Args:
+            itemtype: Type of items
+            values: Fingerprint values (e.g., lines from stdin)
+
+        Yields:
+            {value, matches} dictionaries in input order
+        """
+        for value in values:
+            yield {"value": value, "matches": self.lookup(itemtype, value)}
+
+    def _upsert(self, itemtype: str, field: str, records: Iterable[Dict[str, Any]]):
+        """Insert or replace records in batches.
+
+        Returns:
+            Tuple of (records written, highest date_mod seen)
+        """
+        count = 0
+        watermark = None
+        batch = []
+
+        for record in records:
+            date_mod = record.get("date_mod")
+            if date_mod and (watermark is None or date_mod > watermark):
+                watermark = date_mod
+            batch.append(
+                (itemtype, record.get("id"), record.get("items_id"), record.get(field), date_mod)
+            )
+            if len(batch) >= BATCH_SIZE:
+                count += self._write_batch(batch)
+                batch = []
+
+        if batch:
+            count += self._write_batch(batch)
+        return count, watermark
+
+    def _write_batch(self, batch: List[tuple]) -> int:
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO fingerprints "
+            "(itemtype, record_id, items_id, value, date_mod) VALUES (?, ?, ?, ?, ?)",
+            batch,
+        )
+        return len(batch)
+
+    def _save_state(self, itemtype: str, field: str, watermark: Optional[str]):
+        self.conn.execute(
+            "INSERT OR REPLACE INTO sync_state (itemtype, field, watermark, synced_at) "
+            "VALUES (?, ?, ?, ?)",
+            (itemtype, field, watermark, time.time()),
+        )
@@ -1,22 +1,84 @@
 # -*- coding: utf-8 -*-
-"""Output formatters for GLPI CLI."""
-import json
-from typing import Any, Dict, List
-from rich.console import Console
-from rich.table import Table
-from rich import box
+"""Output formatters for GLPI CLI.
 
+rich is imported inside the functions that render tables with it; status
+messages go through click, so most commands never load rich.
+"""
+import csv
+import itertools
+import sys
+from typing import Any, Dict, Iterable, List, Optional, TextIO
 
-def format_json(data: Any) -> str:
+import click
+
+from . import fast_json
+
+
+def format_json(data: Any, compact: bool = False) -> str:
     """Format data as JSON string.
 
     Args:
         data: Data to format (dict, list, etc.)
+        compact: Single line without indentation (much faster for large dumps)
+
+    Returns:
+        Formatted JSON string, indented unless compact
+    """
+    return fast_json.dumps(data, indent=not compact)
+
+
+def format_ndjson(data: Any) -> str:
+    """Format a single record as one NDJSON line.
+
+    Args:
+        data: Record to format
 
     Returns:
-        Formatted JSON string with indentation
+        Compact JSON string without trailing newline
     """
-    return json.dumps(data, indent=2, ensure_ascii=False)
+    return fast_json.dumps(data)
+
+
+# Fields shown first in tables, when present
+PRIORITY_FIELDS = ["id", "name", "title", "status", "priority", "type", "date", "date_mod"]
+
+
+def select_fields(keys: Iterable[str], max_fields: Optional[int] = 10) -> List[str]:
+    """Pick the columns to display, priority fields first.
+
+    Args:
+        keys: Field names seen in the data (first-seen order is kept)
+        max_fields: Maximum number of fields, or None for all
+
+    Returns:
+        Ordered list of field names
+    """
+    all_keys = list(dict.fromkeys(keys))
+
+    fields = [pf for pf in PRIORITY_FIELDS if pf in all_keys]
+    other_fields = [k for k in all_keys if k not in PRIORITY_FIELDS]
+
+    if max_fields is None:
+        return fields + other_fields
+
+    # Add other fields up to max_fields
+    remaining_slots = max_fields - len(fields)
+    fields.extend(other_fields[:remaining_slots])
+    return fields
+
+
+def _cell(value: Any, width: int = 50) -> str:
+    """Convert a value to a single-line cell, truncated to width."""
+    if value is None:
+        return ""
+    if isinstance(value, (dict, list)):
+        str_value = fast_json.dumps(value)
+    else:
+        str_value = str(value)
+    str_value = str_value.replace("\n", " ")
+    if len(str_value) > width:
+        str_value = str_value[: width - 3] + "..."
+    return str_value
 
 
 def format_table(data: List[Dict[str, Any]], max_fields: int = 10) -> None:
@@ -26,30 +88,20 @@ def format_table(data: List[Dict[str, Any]], max_fields: int = 10) -> None:
         data: List of dictionaries to display
         max_fields: Maximum number of fields to show
     """
+    from rich import box
+    from rich.console import Console
+    from rich.table import Table
+
     console = Console()
 
     if not data:
         console.print("[yellow]Nenhum item encontrado[/yellow]")
         return
 
-    # Get all unique keys from all items
-    all_keys = set()
-    for item in data:
-        all_keys.update(item.keys())
-
-    # Prioritize common fields
-    priority_fields = ["id", "name", "title", "status", "priority", "type", "date", "date_mod"]
-    other_fields = [k for k in all_keys if k not in priority_fields]
-
-    # Build ordered field list
-    fields = []
-    for pf in priority_fields:
-        if pf in all_keys:
-            fields.append(pf)
+    # Get all unique keys from all items, in first-seen order
+    all_keys = dict.fromkeys(key for item in data for key in item)
 
-    # Add other fields up to max_fields
-    remaining_slots = max_fields - len(fields)
-    fields.extend(other_fields[:remaining_slots])
+    fields = select_fields(all_keys, max_fields)
 
     # Create table
     table = Table(box=box.ROUNDED, show_header=True, header_style="bold cyan")
@@ -60,15 +112,7 @@ def format_table(data: List[Dict[str, Any]], max_fields: int = 10) -> None:
 
     # Add rows
     for item in data:
-        row = []
-        for field in fields:
-            value = item.get(field, "")
-            # Convert to string and truncate if too long
-            str_value = str(value) if value is not None else ""
-            if len(str_value) > 50:
-                str_value = str_value[:47] + "..."
-            row.append(str_value)
-        table.add_row(*row)
+        table.add_row(*(_cell(item.get(field, "")) for field in fields))
 
     console.print(table)
 
@@ -78,12 +122,138 @@ def format_table(data: List[Dict[str, Any]], max_fields: int = 10) -> None:
         console.print(f"\n[dim]({hidden} campos ocultados. Use --json para ver todos)[/dim]")
 
 
+def _peek(rows: Iterable[Dict[str, Any]], sample_size: int):
+    """Read the first rows of a stream without losing them.
+
+    Returns:
+        Tuple of (sampled rows, iterator over all rows)
+    """
+    iterator = iter(rows)
+    sample = list(itertools.islice(iterator, sample_size))
+    return sample, itertools.chain(sample, iterator)
+
+
+def stream_table(
+    rows: Iterable[Dict[str, Any]],
+    max_fields: int = 10,
+    sample_size: int = 20,
+    out: Optional[TextIO] = None,
+) -> int:
+    """Print rows as a plain-text table while they arrive.
+
+    Columns and widths are inferred from the first sample_size rows, so the
+    first line is printed without waiting for the whole result.
+
+    Args:
+        rows: Iterable of dictionaries (e.g., GLPIClient.iter_items)
+        max_fields: Maximum number of fields to show
+        sample_size: Rows used to infer columns and widths
+        out: Output stream (default: stdout)
+
+    Returns:
+        Number of rows printed
+    """
+    out = out or sys.stdout
+    sample, rows = _peek(rows, sample_size)
+
+    if not sample:
+        from rich.console import Console
+
+        Console(file=out).print("[yellow]Nenhum item encontrado[/yellow]")
+        return 0
+
+    fields = select_fields((key for item in sample for key in item), max_fields)
+    widths = [
+        max(len(field), *(len(_cell(item.get(field))) for item in sample)) for field in fields
+    ]
+
+    out.write("  ".join(field.upper().ljust(w) for field, w in zip(fields, widths)).rstrip() + "\n")
+    out.write("  ".join("-" * w for w in widths) + "\n")
+
+    count = 0
+    for item in rows:
+        cells = (_cell(item.get(field), w).ljust(w) for field, w in zip(fields, widths))
+        out.write("  ".join(cells).rstrip() + "\n")
+        count += 1
+    out.flush()
+    return count
+
+
+def write_ndjson(rows: Iterable[Any], out: Optional[TextIO] = None) -> int:
+    """Write rows as NDJSON, one line per row as they arrive.
+
+    Args:
+        rows: Iterable of records
+        out: Output stream (default: stdout)
+
+    Returns:
+        Number of rows written
+    """
+    out = out or sys.stdout
+    count = 0
+    for row in rows:
+        out.write(format_ndjson(row) + "\n")
+        count += 1
+    out.flush()
+    return count
+
+
+def write_delimited(
+    rows: Iterable[Dict[str, Any]],
+    delimiter: str = ",",
+    sample_size: int = 20,
+    out: Optional[TextIO] = None,
+) -> int:
+    """Write rows as CSV/TSV as they arrive.
+
+    The header is taken from the first sample_size rows; keys that only
+    appear later are dropped. Nested values are written as JSON.
+
+    Args:
+        rows: Iterable of dictionaries
+        delimiter: Field separator ("," for CSV, "\\t" for TSV)
+        sample_size: Rows used to infer the header
+        out: Output stream (default: stdout)
+
+    Returns:
+        Number of rows written
+    """
+    out = out or sys.stdout
+    sample, rows = _peek(rows, sample_size)
+    if not sample:
+        return 0
+
+    fields = select_fields((key for item in sample for key in item), max_fields=None)
+    writer = csv.DictWriter(
+        out, fieldnames=fields, delimiter=delimiter, extrasaction="ignore", lineterminator="\n"
+    )
+    writer.writeheader()
+
+    count = 0
+    for item in rows:
+        writer.writerow(
+            {
+                key: fast_json.dumps(value)
+                if isinstance(value, (dict, list))
+                else value
+                for key, value in item.items()
+            }
+        )
+        count += 1
+    out.flush()
+    return count
+
+
 def format_single_item(data: Dict[str, Any]) -> None:
     """Format single item as key-value pairs.
 
     Args:
         data: Dictionary with item data
     """
+    from rich import box
+    from rich.console import Console
+    from rich.table import Table
+
     console = Console()
 
     if not data:
@@ -101,7 +271,7 @@ def format_single_item(data: Dict[str, Any]) -> None:
 
         # Format complex values
         if isinstance(value, (dict, list)):
-            value_str = json.dumps(value, indent=2, ensure_ascii=False)
+            value_str = fast_json.dumps(value, indent=True)
         else:
             value_str = str(value)
 
@@ -116,8 +286,7 @@ def print_error(message: str) -> None:
     Args:
         message: Error message to display
     """
-    console = Console()
-    console.print(f"[bold red]\u274c {message}[/bold red]")
+    click.secho(f"\u274c {message}", fg="red", bold=True)
 
 
 def print_success(message: str) -> None:
@@ -126,8 +295,7 @@ def print_success(message: str) -> None:
     Args:
         message: Success message to display
     """
-    console = Console()
-    console.print(f"[bold green]\u2714 {message}[/bold green]")
+    click.secho(f"\u2714 {message}", fg="green", bold=True)
 
 
 def print_info(message: str) -> None:
@@ -136,5 +304,4 @@ def print_info(message: str) -> None:
     Args:
         message: Info message to display
     """
-    console = Console()
-    console.print(f"[bold blue]\u2139 {message}[/bold blue]")
+    click.secho(f"\u2139 {message}", fg="blue", bold=True)
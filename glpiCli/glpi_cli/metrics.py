@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+"""Per-request metrics for GLPIClient (glpi --trace).
+
+GLPIClient calls its hooks with one event dictionary per HTTP attempt
+("request") and per JSON body decoded ("decode"). MetricsRegistry is such a
+hook: it keeps events in memory, optionally appends them to a JSON-lines
+trace file, and summarizes latency percentiles per endpoint.
+
+Request events carry the total time of the attempt ("elapsed") and the time
+until the response headers arrived ("ttfb", which includes DNS, connect and
+TLS when a new connection had to be opened); the difference is the body
+download. requests doesn't expose DNS and TLS phases separately.
+"""
+import json
+import re
+import threading
+from typing import Any, Dict, List, Optional, TextIO
+
+# Numeric path segments are collapsed so /Ticket/1 and /Ticket/2 share an endpoint
+_ID_SEGMENT = re.compile(r"(?<=/)\d+(?=/|$)")
+
+
+def endpoint_of(method: str, path: str) -> str:
+    """Group key of a request.
+
+    Examples:
+        >>> endpoint_of("GET", "Ticket/42/Document_Item")
+        'GET Ticket/:id/Document_Item'
+        >>> endpoint_of("GET", "search/Ticket")
+        'GET search/Ticket'
+
+    Args:
+        method: HTTP method
+        path: URL path relative to the API URL, without query string
+
+    Returns:
+        'METHOD path' with numeric IDs replaced by ':id'
+    """
+    return f"{method} {_ID_SEGMENT.sub(':id', '/' + path.strip('/'))[1:]}"
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile.
+
+    Examples:
+        >>> percentile([1, 2, 3, 4, 5, 6, 7, 8, 9, 10], 95)
+        10
+        >>> percentile([1, 2, 3, 4, 5, 6, 7, 8, 9, 10], 50)
+        5
+
+    Args:
+        values: Non-empty list of numbers
+        pct: Percentile between 0 and 100
+
+    Returns:
+        Value at the percentile
+    """
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+class MetricsRegistry:
+    """Thread-safe in-memory store of request events."""
+
+    def __init__(self, trace_file: Optional[TextIO] = None):
+        """Initialize an empty registry.
+
+        Args:
+            trace_file: Open text file receiving one JSON line per event
+        """
+        self.events: List[Dict[str, Any]] = []
+        self.trace_file = trace_file
+        self._lock = threading.Lock()
+
+    def __call__(self, event: Dict[str, Any]):
+        """Record an event (GLPIClient hook signature)."""
+        with self._lock:
+            self.events.append(event)
+            if self.trace_file is not None:
+                self.trace_file.write(json.dumps(event) + "\n")
+
+    def summary(self) -> List[Dict[str, Any]]:
+        """Aggregate events per endpoint.
+
+        Returns:
+            One dictionary per endpoint, slowest total time first, with
+            requests, retries, errors, bytes, p50/p95/max latency in
+            milliseconds and decode_ms (total JSON decode time)
+        """
+        with self._lock:
+            events = [*self.events]
+
+        groups: Dict[str, Dict[str, Any]] = {}
+        for event in events:
+            group = groups.setdefault(
+                event["endpoint"],
+                {"latencies": [], "retries": 0, "errors": 0, "bytes": 0, "decode": 0.0},
+            )
+            if event["event"] == "decode":
+                group["decode"] += event["elapsed"]
+                continue
+
+            group["latencies"].append(event["elapsed"])
+            group["bytes"] += event.get("bytes") or 0
+            group["retries"] += event["attempt"] > 0
+            status = event.get("status")
+            group["errors"] += status is None or status >= 400
+
+        rows = []
+        for endpoint, group in groups.items():
+            latencies = group["latencies"] or [0.0]
+            rows.append(
+                {
+                    "endpoint": endpoint,
+                    "requests": len(group["latencies"]),
+                    "retries": group["retries"],
+                    "errors": group["errors"],
+                    "bytes": group["bytes"],
+                    "p50_ms": percentile(latencies, 50) * 1000,
+                    "p95_ms": percentile(latencies, 95) * 1000,
+                    "max_ms": max(latencies) * 1000,
+                    "total_ms": sum(latencies) * 1000,
+                    "decode_ms": group["decode"] * 1000,
+                }
+            )
+        rows.sort(key=lambda row: row["total_ms"], reverse=True)
+        return rows
+
+    def format_summary(self) -> str:
+        """Render summary() as a plain-text table.
+
+        Returns:
+            Table text (without trailing newline)
+        """
+        headers = (
+            "ENDPOINT", "REQS", "RETRY", "ERR", "KIB", "P50 MS", "P95 MS", "MAX MS", "DECODE MS"
+        )
+        lines = [
+            (
+                row["endpoint"],
+                str(row["requests"]),
+                str(row["retries"]),
+                str(row["errors"]),
+                f"{row['bytes'] / 1024:.1f}",
+                f"{row['p50_ms']:.1f}",
+                f"{row['p95_ms']:.1f}",
+                f"{row['max_ms']:.1f}",
+                f"{row['decode_ms']:.1f}",
+            )
+            for row in self.summary()
+        ]
+        widths = [max(len(cells[i]) for cells in [headers, *lines]) for i in range(len(headers))]
+
+        def render(cells):
+            first = cells[0].ljust(widths[0])
+            return "  ".join([first, *(c.rjust(w) for c, w in zip(cells[1:], widths[1:]))])
+
+        return "\n".join(render(cells) for cells in [headers, *lines])
@@ -0,0 +1,276 @@
+# -*- coding: utf-8 -*-
+"""Local SQLite mirror of GLPI itemtypes for reporting.
+
+The first sync of an itemtype downloads every item (iter_items pagination);
+later syncs fetch items newest first and stop at the stored date_mod
+watermark, so only rows changed since the previous run cross the network.
+Items are stored as JSON next to indexed id, name, status and date_mod
+columns, and query() answers from SQLite without touching the API.
+
+Items are fetched with expand_dropdowns, so the status column holds the
+number for ITIL objects (Ticket status 2) but the state name for assets
+(Computer states_id "Em uso"), and is filtered on those values.
+"""
+import sqlite3
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from . import fast_json
+from .choices import MIRROR_ORDER_COLUMNS
+from .errors import GLPIError
+from .session_cache import server_cache_dir
+
+if TYPE_CHECKING:
+    from .client import GLPIClient
+
+BATCH_SIZE = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    itemtype TEXT NOT NULL,
+    id INTEGER NOT NULL,
+    name TEXT,
+    status TEXT,
+    date_mod TEXT,
+    data TEXT NOT NULL,
+    PRIMARY KEY (itemtype, id)
+);
+CREATE INDEX IF NOT EXISTS idx_items_name ON items (itemtype, name);
+CREATE INDEX IF NOT EXISTS idx_items_status ON items (itemtype, status);
+CREATE INDEX IF NOT EXISTS idx_items_date_mod ON items (itemtype, date_mod);
+CREATE TABLE IF NOT EXISTS sync_state (
+    itemtype TEXT PRIMARY KEY,
+    watermark TEXT,
+    synced_at REAL NOT NULL
+);
+"""
+
+
+def default_mirror_path(url: Optional[str] = None) -> Path:
+    """Get the default mirror database of a GLPI server.
+
+    Args:
+        url: GLPI API URL
+
+    Returns:
+        <server cache dir>/mirror.sqlite
+    """
+    return server_cache_dir(url) / "mirror.sqlite"
+
+
+def _status(item: Dict[str, Any]) -> Optional[str]:
+    """Status column of an item: ITIL status number, or asset state name (states_id)."""
+    value = item.get("status", item.get("states_id"))
+    return None if value is None else str(value)
+
+
+class Mirror:
+    """SQLite copy of GLPI items kept current by date_mod."""
+
+    def __init__(self, path: Optional[Path] = None, url: Optional[str] = None):
+        """Open (or create) the mirror.
+
+        Args:
+            path: SQLite file (default: <server cache dir>/mirror.sqlite)
+            url: GLPI API URL the items are downloaded from (selects the default file)
+        """
+        self.path = path or default_mirror_path(url)
+        self.path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+        self.conn = sqlite3.connect(str(self.path))
+        self.conn.executescript(_SCHEMA)
+
+    def close(self):
+        """Close the database."""
+        self.conn.close()
+
+    def state(self, itemtype: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Get sync metadata of mirrored itemtypes.
+
+        Args:
+            itemtype: Only this itemtype (default: all)
+
+        Returns:
+            List of {itemtype, watermark, synced_at, items} dictionaries
+        """
+        sql = (
+            "SELECT s.itemtype, s.watermark, s.synced_at, "
+            "(SELECT COUNT(*) FROM items i WHERE i.itemtype = s.itemtype) "
+            "FROM sync_state s"
+        )
+        args: Tuple = ()
+        if itemtype:
+            sql += " WHERE s.itemtype = ?"
+            args = (itemtype,)
+
+        rows = self.conn.execute(sql + " ORDER BY s.itemtype", args).fetchall()
+        return [
+            {"itemtype": row[0], "watermark": row[1], "synced_at": row[2], "items": row[3]}
+            for row in rows
+        ]
+
+    def sync(
+        self,
+        client: "GLPIClient",
+        itemtype: str,
+        page_size: int = 200,
+        concurrency: int = 4,
+        full: bool = False,
+    ) -> Tuple[int, bool]:
+        """Bring the mirror of an itemtype up to date.
+
+        Without a previous sync (or with full=True) every item is downloaded
+        and replaces the local copy. Otherwise items are read newest first
+        and the walk stops at the first one older than the watermark. Items
+        deleted on the server are only dropped by a full sync.
+
+        Args:
+            client: GLPI client with an open session
+            itemtype: Type of items (e.g., 'Ticket')
+            page_size: Items per range window
+            concurrency: Range windows fetched in parallel on a full sync
+            full: Force a full reload
+
+        Returns:
+            Tuple of (items upserted, whether it was a full load)
+        """
+        state = self.state(itemtype)
+        watermark = None if full or not state else state[0]["watermark"]
+        full = full or not state
+
+        if full:
+            items = client.iter_items(itemtype, page_size=page_size, concurrency=concurrency)
+            # Dropping the state too means an interrupted load is redone in full
+            with self.conn:
+                self.conn.execute("DELETE FROM items WHERE itemtype = ?", (itemtype,))
+                self.conn.execute("DELETE FROM sync_state WHERE itemtype = ?", (itemtype,))
+        else:
+            items = self._modified_since(
+                client.iter_items(itemtype, page_size=page_size, sort="date_mod", order="DESC"),
+                watermark,
+            )
+
+        count, new_watermark = self._upsert(itemtype, items)
+        if new_watermark and (not watermark or new_watermark > watermark):
+            watermark = new_watermark
+        with self.conn:
+            self._save_state(itemtype, watermark)
+        return count, full
+
+    @staticmethod
+    def _modified_since(
+        items: Iterable[Dict[str, Any]], watermark: Optional[str]
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield items until the first one older than the watermark."""
+        for item in items:
+            # Equal timestamps are re-read: same-second updates may be new
+            if watermark and (item.get("date_mod") or "") < watermark:
+                return
+            yield item
+
+    def query(
+        self,
+        itemtype: str,
+        item_ids: Optional[List[int]] = None,
+        name: Optional[str] = None,
+        status: Optional[str] = None,
+        modified_since: Optional[str] = None,
+        order_by: str = "id",
+        descending: bool = False,
+        limit: Optional[int] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Read mirrored items matching all given filters.
+
+        Args:
+            itemtype: Type of items (e.g., 'Ticket')
+            item_ids: Only these IDs
+            name: Substring of the name (case-insensitive for ASCII)
+            status: Exact status: number for ITIL objects, state name for assets
+            modified_since: Only items with date_mod >= this value ('YYYY-MM-DD[ HH:MM:SS]')
+            order_by: One of MIRROR_ORDER_COLUMNS
+            descending: Sort in descending order
+            limit: Max items returned
+
+        Yields:
+            Items as stored from the API
+
+        Raises:
+            GLPIError: If order_by is not an indexed column
+        """
+        if order_by not in MIRROR_ORDER_COLUMNS:
+            raise GLPIError(
+                f"Ordenação inválida: {order_by} (use {', '.join(MIRROR_ORDER_COLUMNS)})"
+            )
+
+        clauses = ["itemtype = ?"]
+        args: List[Any] = [itemtype]
+        if item_ids:
+            clauses.append(f"id IN ({', '.join('?' * len(item_ids))})")
+            args.extend(item_ids)
+        if name:
+            clauses.append("name LIKE ?")
+            args.append(f"%{name}%")
+        if status is not None:
+            clauses.append("status = ?")
+            args.append(str(status))
+        if modified_since:
+            clauses.append("date_mod >= ?")
+            args.append(modified_since)
+
+        sql = (
+            f"SELECT data FROM items WHERE {' AND '.join(clauses)} "
+            f"ORDER BY {order_by} {'DESC' if descending else 'ASC'}"
+        )
+        if limit is not None:
+            sql += " LIMIT ?"
+            args.append(limit)
+
+        for (data,) in self.conn.execute(sql, args):
+            yield fast_json.loads(data)
+
+    def _upsert(self, itemtype: str, items: Iterable[Dict[str, Any]]):
+        """Insert or replace items, committing one transaction per batch.
+
+        Returns:
+            Tuple of (items written, highest date_mod seen)
+        """
+        count = 0
+        watermark = None
+        batch = []
+
+        for item in items:
+            date_mod = item.get("date_mod")
+            if date_mod and (watermark is None or date_mod > watermark):
+                watermark = date_mod
+            batch.append(
+                (
+                    itemtype,
+                    item.get("id"),
+                    item.get("name"),
+                    _status(item),
+                    date_mod,
+                    fast_json.dumps(item),
+                )
+            )
+            if len(batch) >= BATCH_SIZE:
+                count += self._write_batch(batch)
+                batch = []
+
+        if batch:
+            count += self._write_batch(batch)
+        return count, watermark
+
+    def _write_batch(self, batch: List[tuple]) -> int:
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO items (itemtype, id, name, status, date_mod, data) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                batch,
+            )
+        return len(batch)
+
+    def _save_state(self, itemtype: str, watermark: Optional[str]):
+        self.conn.execute(
+            "INSERT OR REPLACE INTO sync_state (itemtype, watermark, synced_at) VALUES (?, ?, ?)",
+            (itemtype, watermark, time.time()),
+        )
@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+"""Search criteria builder for GLPI's /search endpoint.
+
+Criteria are plain dictionaries ({link, field, searchtype, value}) that may
+nest groups under a "criteria" key; build_search_params flattens them into
+the criteria[i][...] query parameters GLPI expects.
+
+Examples:
+    >>> build_search_params([criterion(1, "srv"), criterion(12, 2, "equals", link="OR")])
+    ... # doctest: +NORMALIZE_WHITESPACE
+    {'criteria[0][field]': 1, 'criteria[0][searchtype]': 'contains',
+     'criteria[0][value]': 'srv', 'criteria[1][link]': 'OR', 'criteria[1][field]': 12,
+     'criteria[1][searchtype]': 'equals', 'criteria[1][value]': 2,
+     'forcedisplay[0]': 1, 'forcedisplay[1]': 2}
+"""
+from typing import Any, Dict, Iterable, List, Optional
+
+from .errors import GLPIError
+
+# Logical operators between criteria
+LINKS = ("AND", "OR", "AND NOT", "OR NOT")
+
+# Columns returned when forcedisplay isn't given: 1 = name, 2 = ID
+DEFAULT_FORCEDISPLAY = (1, 2)
+
+
+def criterion(
+    field: int, value: Any, searchtype: str = "contains", link: str = "AND"
+) -> Dict[str, Any]:
+    """Build one search criterion.
+
+    Args:
+        field: Search option ID (see /listSearchOptions/:itemtype)
+        value: Value to match
+        searchtype: contains, equals, notequals, lessthan, morethan, under, notunder
+        link: How it combines with the previous criterion (AND, OR, AND NOT, OR NOT)
+
+    Returns:
+        Criterion dictionary
+    """
+    return {"link": link, "field": field, "searchtype": searchtype, "value": value}
+
+
+def meta_criterion(
+    itemtype: str, field: int, value: Any, searchtype: str = "contains", link: str = "AND"
+) -> Dict[str, Any]:
+    """Build a criterion on a linked itemtype (GLPI metacriteria).
+
+    Args:
+        itemtype: Linked itemtype (e.g., 'Computer' when searching tickets)
+        field: Search option ID of the linked itemtype
+        value: Value to match
+        searchtype: Match type (see criterion)
+        link: Logical operator (see criterion)
+
+    Returns:
+        Metacriterion dictionary
+    """
+    return {**criterion(field, value, searchtype, link), "itemtype": itemtype}
+
+
+def parse_criterion(text: str) -> Dict[str, Any]:
+    """Parse a '[LINK:]FIELD:SEARCHTYPE:VALUE' command-line criterion.
+
+    Examples:
+        >>> parse_criterion("12:equals:2")
+        {'link': 'AND', 'field': 12, 'searchtype': 'equals', 'value': '2'}
+        >>> parse_criterion("or not:1:contains:a:b")
+        {'link': 'OR NOT', 'field': 1, 'searchtype': 'contains', 'value': 'a:b'}
+
+    Args:
+        text: Criterion text; LINK may use spaces or underscores ('AND_NOT')
+
+    Returns:
+        Criterion dictionary
+
+    Raises:
+        GLPIError: If the text is malformed
+    """
+    parts = text.split(":")
+    link = "AND"
+    if parts and parts[0].replace("_", " ").strip().upper() in LINKS:
+        link = parts.pop(0).replace("_", " ").strip().upper()
+
+    if len(parts) < 3 or not parts[0].strip().isdigit():
+        raise GLPIError(f"Critério inválido: {text!r} (use [LINK:]CAMPO:TIPO:VALOR)")
+
+    field, searchtype, value = parts[0], parts[1], ":".join(parts[2:])
+    return criterion(int(field), value, searchtype.strip(), link)
+
+
+def _flatten(prefix: str, items: Iterable[Dict[str, Any]], params: Dict[str, Any]):
+    """Write criteria (and nested groups) as prefix[i][key] parameters."""
+    for i, item in enumerate(items):
+        link = item.get("link", "AND")
+        if link not in LINKS:
+            raise GLPIError(f"Operador inválido: {link} (use {', '.join(LINKS)})")
+        # GLPI ignores the link of the first criterion; skip the default to keep URLs short
+        if i > 0 or link != "AND":
+            params[f"{prefix}[{i}][link]"] = link
+
+        if "criteria" in item:
+            _flatten(f"{prefix}[{i}][criteria]", item["criteria"], params)
+            continue
+
+        if "itemtype" in item:
+            params[f"{prefix}[{i}][itemtype]"] = item["itemtype"]
+        params[f"{prefix}[{i}][field]"] = item.get("field", 1)
+        params[f"{prefix}[{i}][searchtype]"] = item.get("searchtype", "contains")
+        params[f"{prefix}[{i}][value]"] = item.get("value", "")
+
+
+def build_search_params(
+    criteria: Optional[List[Dict[str, Any]]] = None,
+    forcedisplay: Optional[Iterable[int]] = None,
+    metacriteria: Optional[List[Dict[str, Any]]] = None,
+) -> Dict[str, Any]:
+    """Build /search query parameters.
+
+    Args:
+        criteria: Criteria dictionaries (see criterion); a dictionary with a
+            "criteria" list is a parenthesized group
+        forcedisplay: Search option IDs to return (default: 1 and 2)
+        metacriteria: Criteria on linked itemtypes (see meta_criterion)
+
+    Returns:
+        Query parameter dictionary
+
+    Raises:
+        GLPIError: If a link operator is invalid
+    """
+    params: Dict[str, Any] = {}
+    _flatten("criteria", criteria or [], params)
+    _flatten("metacriteria", metacriteria or [], params)
+
+    columns = DEFAULT_FORCEDISPLAY if forcedisplay is None else forcedisplay
+    for i, column in enumerate(columns):
+        params[f"forcedisplay[{i}]"] = column
+    return params
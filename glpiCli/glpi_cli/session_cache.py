@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+"""On-disk cache of GLPI session tokens shared across CLI invocations.
+
+Tokens are stored in ~/.cache/glpi/sessions.json (or $XDG_CACHE_HOME/glpi),
+readable only by the owner, keyed by a hash of URL and credentials.
+"""
+import hashlib
+import json
+import os
+import re
+import time
+from pathlib import Path
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+from .config import DEFAULT_SESSION_TTL
+
+
+def default_cache_dir() -> Path:
+    """Get the GLPI CLI cache directory.
+
+    Returns:
+        $XDG_CACHE_HOME/glpi or ~/.cache/glpi
+    """
+    base = os.getenv("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(base) / "glpi"
+
+
+def server_cache_dir(url: Optional[str]) -> Path:
+    """Get the cache directory for data downloaded from one GLPI server.
+
+    Local copies of server data (dropdown tables, fingerprint index, mirror)
+    live here so two instances never share rows keyed by the same IDs.
+
+    Examples:
+        >>> server_cache_dir("https://glpi.example.com/apirest.php").name
+        'glpi.example.com-ae421332'
+
+    Args:
+        url: GLPI API URL (None = the shared cache directory)
+
+    Returns:
+        <cache dir>/servers/<host>-<hash of URL>, or <cache dir> without a URL
+    """
+    if not url:
+        return default_cache_dir()
+    url = url.rstrip("/")
+    host = re.sub(r"[^A-Za-z0-9.-]+", "_", urlsplit(url).netloc) or "glpi"
+    digest = hashlib.sha256(url.encode("utf-8")).hexdigest()[:8]
+    return default_cache_dir() / "servers" / f"{host}-{digest}"
+
+
+class SessionCache:
+    """Session-Token cache with a TTL."""
+
+    def __init__(self, path: Optional[Path] = None, ttl: int = DEFAULT_SESSION_TTL):
+        """Initialize session cache.
+
+        Args:
+            path: Cache file (default: <cache dir>/sessions.json)
+            ttl: Seconds a cached token is trusted before re-authenticating
+        """
+        self.path = path or default_cache_dir() / "sessions.json"
+        self.ttl = ttl
+
+    @staticmethod
+    def make_key(url: str, app_token: str, user_token: str) -> str:
+        """Build a cache key that doesn't expose the credentials.
+
+        Args:
+            url: GLPI API URL
+            app_token: App-Token
+            user_token: User token
+
+        Returns:
+            Hex digest identifying this URL/credentials pair
+        """
+        raw = f"{url.rstrip('/')}\n{app_token}\n{user_token}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def load(self, key: str) -> Optional[str]:
+        """Get a cached session token if it is still within the TTL.
+
+        Args:
+            key: Cache key from make_key()
+
+        Returns:
+            Session token or None
+        """
+        entry = self._read().get(key)
+        if not entry:
+            return None
+
+        if time.time() - entry.get("created", 0) > self.ttl:
+            return None
+
+        return entry.get("session_token")
+
+    def store(self, key: str, session_token: str):
+        """Save a session token.
+
+        Args:
+            key: Cache key from make_key()
+            session_token: Token returned by initSession
+        """
+        entries = self._read()
+        entries[key] = {"session_token": session_token, "created": time.time()}
+        self._write(entries)
+
+    def clear(self, key: str):
+        """Forget a session token.
+
+        Args:
+            key: Cache key from make_key()
+        """
+        entries = self._read()
+        if entries.pop(key, None) is not None:
+            self._write(entries)
+
+    def _read(self) -> Dict[str, Dict]:
+        """Read all entries, treating a missing or corrupt file as empty."""
+        try:
+            with open(self.path, "r") as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def _write(self, entries: Dict[str, Dict]):
+        """Atomically write all entries with 0600 permissions."""
+        self.path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+
+        tmp_path = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(entries, f)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            # A cache that can't be written just means a fresh login next time
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
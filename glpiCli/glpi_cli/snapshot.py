@@ -0,0 +1,406 @@
+# -*- coding: utf-8 -*-
+"""Resumable compressed NDJSON export of several itemtypes (glpi snapshot).
+
+Every itemtype is paged at the same time on one thread pool, so the
+--concurrency budget is shared: a large Computer table doesn't wait for
+Software to finish. Each page is serialized and compressed on the worker
+that fetched it and appended to <Itemtype>.ndjson.gz (or .zst) as its own
+gzip member / zstd frame, in ID order, as soon as the pages before it are
+written; concatenated members are a valid stream for zcat/zstdcat.
+
+manifest.json records, after every appended page, how many bytes and items
+each file holds and the last ID written. A crashed or interrupted export is
+resumed from there: the file is truncated to the recorded size, the last
+written page is fetched again and rows with IDs already written are dropped,
+so rows that shifted between pages in the meantime are neither lost nor
+duplicated. Finished files get their SHA-256 in the manifest.
+"""
+import gzip
+import hashlib
+import os
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+)
+
+from . import fast_json
+from .choices import COMPRESSIONS
+from .errors import GLPIError
+
+if TYPE_CHECKING:
+    from .client import GLPIClient
+
+EXTENSIONS = {"gzip": ".ndjson.gz", "zstd": ".ndjson.zst", "none": ".ndjson"}
+
+MANIFEST_NAME = "manifest.json"
+
+MANIFEST_VERSION = 1
+
+
+class _Page(NamedTuple):
+    """A fetched range window, ready to be appended."""
+
+    start: int
+    fetched: int
+    total: Optional[int]
+    rows: int
+    last_id: Optional[int]
+    data: bytes
+
+
+def compressor(name: str) -> Callable[[bytes], bytes]:
+    """Get the function compressing one page into a self-contained member.
+
+    Args:
+        name: One of COMPRESSIONS
+
+    Returns:
+        Function bytes -> compressed bytes
+
+    Raises:
+        GLPIError: If zstd is asked for without the zstandard package
+    """
+    if name == "gzip":
+        return lambda data: gzip.compress(data, compresslevel=6)
+    if name == "zstd":
+        try:
+            import zstandard
+        except ImportError:
+            raise GLPIError("Compressão zstd requer o pacote zstandard (pip install zstandard)")
+        # ZstdCompressor objects aren't thread-safe; one per call is cheap
+        return lambda data: zstandard.ZstdCompressor(level=3).compress(data)
+    if name == "none":
+        return lambda data: data
+    raise GLPIError(f"Compressão desconhecida: {name} (use {', '.join(COMPRESSIONS)})")
+
+
+def file_sha256(path: Path) -> str:
+    """Hex SHA-256 of a file, read in 1 MiB blocks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class _Export:
+    """One itemtype being exported: its file, manifest entry and page queue."""
+
+    def __init__(self, itemtype: str, entry: Dict[str, Any], path: Path, page_size: int):
+        self.itemtype = itemtype
+        self.entry = entry
+        self.path = path
+        self.step = page_size
+        self.page_size = page_size
+        # Range starts not yet requested; None until the first page is in
+        self.remaining: Optional[Deque[int]] = None
+        # Requested range starts, in the order their pages are written
+        self.queue: Deque[int] = deque()
+        self.ready: Dict[int, _Page] = {}
+        self.file: Optional[IO[bytes]] = None
+
+    def open(self) -> int:
+        """Open the file, dropping whatever follows the last recorded page.
+
+        A file shorter than the manifest says (lost or damaged) is exported
+        again from the start.
+
+        Returns:
+            Range start of the first window to fetch
+        """
+        size = self.path.stat().st_size if self.path.exists() else 0
+        if self.entry["bytes"] and size >= self.entry["bytes"]:
+            self.file = open(self.path, "r+b")
+            self.file.truncate(self.entry["bytes"])
+            self.file.seek(self.entry["bytes"])
+        else:
+            self.file = open(self.path, "wb")
+            self.entry.update(bytes=0, items=0, next=0, last_id=None)
+        self.entry["total"] = None
+
+        # Rows with IDs up to this one were written before a resume
+        self.written_up_to = self.entry["last_id"]
+        # Re-fetch the last written page: rows may have shifted since
+        start = max(0, self.entry["next"] - self.page_size) if self.written_up_to else 0
+        self.queue.append(start)
+        return start
+
+    def plan(self, page: _Page):
+        """Lay out the windows still to fetch after a page arrives.
+
+        With a Content-Range total every window is known after the first
+        page; without one, windows are walked one at a time until a short page.
+        """
+        end = page.start + page.fetched
+        if page.total is None:
+            self.remaining = deque([end] if page.fetched >= self.step else [])
+            return
+        self.entry["total"] = page.total
+        # The server may cap the window size, so step by what it returned
+        if page.fetched and page.fetched < self.step and end < page.total:
+            self.step = page.fetched
+        self.remaining = deque(range(end, page.total, self.step) if page.fetched else ())
+
+    def next_start(self) -> Optional[int]:
+        """Range start of the next window to fetch, or None if there is none yet."""
+        if not self.remaining:
+            return None
+        start = self.remaining.popleft()
+        self.queue.append(start)
+        return start
+
+    def write_ready(self) -> bool:
+        """Append the pages that are next in order.
+
+        Returns:
+            True if at least one page was written
+        """
+        wrote = False
+        while self.queue and self.queue[0] in self.ready:
+            page = self.ready.pop(self.queue.popleft())
+            if page.data:
+                self.file.write(page.data)
+            self.entry["bytes"] += len(page.data)
+            self.entry["items"] += page.rows
+            self.entry["next"] = page.start + page.fetched
+            if page.last_id is not None:
+                self.entry["last_id"] = page.last_id
+            wrote = True
+        if wrote:
+            # On disk before save() records the new size: after an OS crash the
+            # manifest must never point past the end of the data
+            self.file.flush()
+            os.fsync(self.file.fileno())
+        return wrote
+
+    @property
+    def done(self) -> bool:
+        return self.remaining is not None and not (self.remaining or self.queue or self.ready)
+
+    def finish(self):
+        self.file.close()
+        self.entry["complete"] = True
+        self.entry["sha256"] = file_sha256(self.path)
+
+    def fail(self, error: GLPIError):
+        if self.file is not None:
+            self.file.close()
+        self.entry["error"] = error.message
+        self.remaining = deque()
+        self.queue.clear()
+        self.ready.clear()
+
+
+class Snapshot:
+    """Output directory of a snapshot and its manifest."""
+
+    def __init__(
+        self,
+        out_dir: Path,
+        url: str,
+        compression: str = "gzip",
+        page_size: int = 500,
+        dropdowns: str = "server",
+        restart: bool = False,
+    ):
+        """Open the output directory, resuming the export recorded there.
+
+        Args:
+            out_dir: Directory for the NDJSON files and manifest.json
+            url: GLPI API URL (an export is only resumed against the same one)
+            compression: One of COMPRESSIONS
+            page_size: Items per range window
+            dropdowns: --dropdowns mode the rows are written with
+            restart: Ignore a previous export in out_dir and start over
+
+        Raises:
+            GLPIError: If out_dir holds an export made with other settings
+        """
+        self.out_dir = out_dir
+        self.compress = compressor(compression)
+        self.path = out_dir / MANIFEST_NAME
+        out_dir.mkdir(parents=True, exist_ok=True)
+
+        settings = {
+            "version": MANIFEST_VERSION,
+            "url": url,
+            "compression": compression,
+            "page_size": page_size,
+            "dropdowns": dropdowns,
+        }
+        manifest = None
+        if self.path.exists() and not restart:
+            manifest = fast_json.loads(self.path.read_bytes())
+            changed = [key for key, value in settings.items() if manifest.get(key) != value]
+            if changed:
+                raise GLPIError(
+                    f"{self.path} é de uma exportação com outro(a) {', '.join(changed)}; "
+                    "use --restart ou outro diretório"
+                )
+        self.manifest = manifest or {**settings, "itemtypes": {}}
+        self.resumed = manifest is not None
+
+    def _entry(self, itemtype: str) -> Dict[str, Any]:
+        entries = self.manifest["itemtypes"]
+        if itemtype not in entries:
+            entries[itemtype] = {
+                "file": itemtype + EXTENSIONS[self.manifest["compression"]],
+                "total": None,
+                "items": 0,
+                "bytes": 0,
+                "next": 0,
+                "last_id": None,
+                "complete": False,
+                "sha256": None,
+            }
+        # A failed export is resumed like an interrupted one
+        entries[itemtype].pop("error", None)
+        return entries[itemtype]
+
+    def save(self):
+        """Write the manifest atomically."""
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        tmp.write_text(fast_json.dumps(self.manifest, indent=True) + "\n", encoding="utf-8")
+        os.replace(tmp, self.path)
+
+    def run(
+        self,
+        client: "GLPIClient",
+        itemtypes: Iterable[str],
+        concurrency: int = 8,
+        params: Optional[Dict[str, Any]] = None,
+        transform: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None,
+        progress: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+    ) -> Dict[str, Any]:
+        """Export (or finish exporting) itemtypes.
+
+        Args:
+            client: GLPI client with an open session
+            itemtypes: Itemtypes to export; those already complete are skipped
+            concurrency: Max range windows in flight, across all itemtypes
+            params: Extra query parameters of every page (e.g., expand_dropdowns)
+            transform: Applied to each row before it is written
+            progress: Called with (itemtype, manifest entry) as each one ends
+
+        Returns:
+            The manifest: settings plus, per itemtype, file, total, items,
+            bytes, next, last_id, complete, sha256 and error (if it failed)
+        """
+        page_size = self.manifest["page_size"]
+        params = {**(params or {}), "sort": "id", "order": "ASC"}
+        exports: List[_Export] = []
+        for itemtype in dict.fromkeys(itemtypes):
+            entry = self._entry(itemtype)
+            if entry["complete"]:
+                continue
+            exports.append(_Export(itemtype, entry, self.out_dir / entry["file"], page_size))
+        self.manifest["started_at"] = time.strftime("%Y-%m-%d %H:%M:%S")
+        self.manifest.pop("finished_at", None)
+        self.save()
+
+        def fetch(export: _Export, start: int) -> _Page:
+            try:
+                items, total = client.list_page(export.itemtype, start, export.step, **params)
+            except GLPIError as e:
+                # Past the end: the collection shrank, or it is empty
+                if e.glpi_error != "ERROR_RANGE_EXCEED_TOTAL":
+                    raise
+                items, total = [], None
+            rows = [
+                row
+                for row in items
+                if not (export.written_up_to and (row.get("id") or 0) <= export.written_up_to)
+            ]
+            if transform is not None:
+                rows = [transform(row) for row in rows]
+            data = "".join(fast_json.dumps(row) + "\n" for row in rows).encode("utf-8")
+            last_id = max((row.get("id") or 0 for row in rows), default=None)
+            return _Page(
+                start=start,
+                fetched=len(items),
+                total=total,
+                rows=len(rows),
+                last_id=last_id,
+                data=self.compress(data) if rows else b"",
+            )
+
+        # Pages fetched but not yet written count against the window too,
+        # so one slow page can't make the others pile up in memory
+        window = max(1, concurrency) * 2
+        pending: Dict[Future, _Export] = {}
+        turn = 0
+
+        with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+
+            def submit(export: _Export, start: int):
+                pending[executor.submit(fetch, export, start)] = export
+
+            def held() -> int:
+                return len(pending) + sum(len(export.ready) for export in exports)
+
+            def refill():
+                # Round-robin, resuming where the last call stopped, so every
+                # itemtype keeps a share of the budget
+                nonlocal turn
+                idle = 0
+                while idle < len(exports) and held() < window:
+                    export = exports[turn % len(exports)]
+                    turn += 1
+                    start = export.next_start()
+                    if start is None:
+                        idle += 1
+                    else:
+                        submit(export, start)
+                        idle = 0
+
+            for export in exports:
+                submit(export, export.open())
+
+            try:
+                while pending:
+                    finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        export = pending.pop(future)
+                        if export.entry.get("error"):
+                            continue
+                        try:
+                            page = future.result()
+                        except GLPIError as e:
+                            export.fail(e)
+                            self.save()
+                            if progress:
+                                progress(export.itemtype, export.entry)
+                            continue
+
+                        if export.remaining is None or export.entry["total"] is None:
+                            export.plan(page)
+                        export.ready[page.start] = page
+                        if export.write_ready():
+                            if export.done:
+                                export.finish()
+                            self.save()
+                            if export.done and progress:
+                                progress(export.itemtype, export.entry)
+                    refill()
+            finally:
+                for future in pending:
+                    future.cancel()
+                for export in exports:
+                    if export.file is not None and not export.file.closed:
+                        export.file.close()
+
+        self.manifest["finished_at"] = time.strftime("%Y-%m-%d %H:%M:%S")
+        self.save()
+        return self.manifest
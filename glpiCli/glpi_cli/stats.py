@@ -0,0 +1,401 @@
+# -*- coding: utf-8 -*-
+"""One-pass ticket statistics over the search stream (glpi stats).
+
+Rows come from /search/:itemtype with only the columns the grouping and the
+metrics need (forcedisplay), and the filters are sent as search criteria,
+so GLPI does the filtering and each row is a few dozen bytes. Rows are
+folded into per-group accumulators as pages arrive: memory grows with the
+number of groups, not of tickets.
+
+The accumulators are columnar (one list per counter, indexed by group), so
+the optional pandas engine can aggregate a chunk of rows vectorized and add
+its partial sums to the same columns.
+"""
+import math
+import re
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .choices import STATS_ENGINES
+from .errors import GLPIError
+from .search import criterion
+
+# ITIL (Ticket, Problem, Change) fields known by name -> search option ID
+ITIL_FIELDS = {
+    "name": 1,
+    "id": 2,
+    "priority": 3,
+    "users_id_requester": 4,
+    "users_id_assign": 5,
+    "itilcategories_id": 7,
+    "groups_id_assign": 8,
+    "requesttypes_id": 9,
+    "urgency": 10,
+    "impact": 11,
+    "status": 12,
+    "type": 14,
+    "date": 15,
+    "closedate": 16,
+    "solvedate": 17,
+    "date_mod": 19,
+    "users_id_recipient": 22,
+    "groups_id_requester": 71,
+    "entities_id": 80,
+    "locations_id": 83,
+}
+
+STATUS_FIELD = ITIL_FIELDS["status"]
+DATE_FIELD = ITIL_FIELDS["date"]
+SOLVEDATE_FIELD = ITIL_FIELDS["solvedate"]
+
+# Solved (5) and closed (6) tickets are out of the backlog
+CLOSED_STATUSES = (5, 6)
+
+# Metric -> search options it reads
+METRICS = {
+    "count": (),
+    "backlog": (STATUS_FIELD,),
+    "solved": (SOLVEDATE_FIELD,),
+    "mttr": (DATE_FIELD, SOLVEDATE_FIELD),
+    "max_ttr": (DATE_FIELD, SOLVEDATE_FIELD),
+    "mean_age": (DATE_FIELD, STATUS_FIELD),
+}
+
+# format="ISO8601" in to_datetime, which parses what datetime.fromisoformat does
+PANDAS_MIN_VERSION = (2, 0)
+
+# Accumulator columns, one value per group
+_COUNTERS = ("count", "open", "ttr_n", "ttr_sum", "ttr_max", "age_n", "age_sum")
+
+GroupKey = Tuple[Any, ...]
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+def field_id(name: str) -> int:
+    """Search option ID of a field given by name or number.
+
+    Examples:
+        >>> field_id("itilcategories_id")
+        7
+        >>> field_id("80")
+        80
+
+    Raises:
+        GLPIError: If the name is unknown
+    """
+    if name.isdigit():
+        return int(name)
+    if name not in ITIL_FIELDS:
+        raise GLPIError(
+            f"Campo desconhecido: {name} (use o número da opção de busca ou um de "
+            f"{', '.join(ITIL_FIELDS)})"
+        )
+    return ITIL_FIELDS[name]
+
+
+def filter_criteria(
+    statuses: Optional[Sequence[str]] = None,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """Search criteria for the stats filters.
+
+    Examples:
+        >>> filter_criteria(["1", "2"], since="2024-01-01")  # doctest: +NORMALIZE_WHITESPACE
+        [{'link': 'AND', 'criteria': [{'link': 'AND', 'field': 12, 'searchtype': 'equals',
+        'value': '1'}, {'link': 'OR', 'field': 12, 'searchtype': 'equals', 'value': '2'}]},
+        {'link': 'AND', 'field': 15, 'searchtype': 'morethan', 'value': '2024-01-01'}]
+
+    Args:
+        statuses: Status values (1-6, or GLPI's notold/old/all)
+        since: Opened at or after this date
+        until: Opened before this date
+
+    Returns:
+        Criteria list (statuses are OR-ed inside one group)
+    """
+    criteria: List[Dict[str, Any]] = []
+    if statuses:
+        group = [
+            criterion(STATUS_FIELD, value, "equals", link="OR" if i else "AND")
+            for i, value in enumerate(statuses)
+        ]
+        criteria.append({"link": "AND", "criteria": group})
+    if since:
+        criteria.append(criterion(DATE_FIELD, since, "morethan"))
+    if until:
+        criteria.append(criterion(DATE_FIELD, until, "lessthan"))
+    return criteria
+
+
+def required_fields(group_by: Sequence[int], metrics: Sequence[str]) -> List[int]:
+    """Search options to request (forcedisplay) for a grouping and metrics.
+
+    Raises:
+        GLPIError: If a metric is unknown
+    """
+    fields = [*group_by]
+    for metric in metrics:
+        if metric not in METRICS:
+            raise GLPIError(f"Métrica desconhecida: {metric} (use {', '.join(METRICS)})")
+        fields.extend(METRICS[metric])
+    return [*dict.fromkeys(fields)]
+
+
+def _key_value(value: Any) -> Any:
+    """Hashable group value: multi-valued columns (several technicians) are joined."""
+    if isinstance(value, list):
+        return ", ".join(str(v) for v in value)
+    return value
+
+
+def _status(value: Any) -> Optional[int]:
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str) and value.isdigit():
+        return int(value)
+    return None
+
+
+def _seconds(value: Any) -> Optional[float]:
+    """Wall-clock seconds of a GLPI datetime (no time zone, like the server's)."""
+    if not value or not isinstance(value, str):
+        return None
+    try:
+        moment = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    return (moment.replace(tzinfo=None) - _EPOCH).total_seconds()
+
+
+class Aggregation:
+    """Per-group counters of a stats run."""
+
+    def __init__(self, group_by: Sequence[int], now: Optional[float] = None):
+        """Start with no groups.
+
+        Args:
+            group_by: Search option IDs forming the group key
+            now: Reference time for ticket ages (default: now)
+        """
+        self.group_by = [str(field) for field in group_by]
+        moment = datetime.fromtimestamp(now if now is not None else time.time())
+        self.now = (moment - _EPOCH).total_seconds()
+        self.rows = 0
+        self._slots: Dict[GroupKey, int] = {}
+        self.columns: Dict[str, List[float]] = {name: [] for name in _COUNTERS}
+
+    def _slot(self, key: GroupKey) -> int:
+        slot = self._slots.get(key)
+        if slot is None:
+            slot = self._slots[key] = len(self._slots)
+            for name, column in self.columns.items():
+                column.append(-math.inf if name == "ttr_max" else 0)
+        return slot
+
+    def add_rows(self, rows: Iterable[Dict[str, Any]]):
+        """Fold search rows in, one at a time."""
+        group_by = self.group_by
+        status_key, date_key, solved_key = str(STATUS_FIELD), str(DATE_FIELD), str(SOLVEDATE_FIELD)
+        count, is_open = self.columns["count"], self.columns["open"]
+        ttr_n, ttr_sum, ttr_max = (self.columns[name] for name in ("ttr_n", "ttr_sum", "ttr_max"))
+        age_n, age_sum = self.columns["age_n"], self.columns["age_sum"]
+
+        for row in rows:
+            slot = self._slot(tuple(_key_value(row.get(key)) for key in group_by))
+            self.rows += 1
+            count[slot] += 1
+
+            opened = _seconds(row.get(date_key))
+            solved = _seconds(row.get(solved_key))
+            if opened is not None and solved is not None:
+                ttr = solved - opened
+                ttr_n[slot] += 1
+                ttr_sum[slot] += ttr
+                if ttr > ttr_max[slot]:
+                    ttr_max[slot] = ttr
+
+            if _status(row.get(status_key)) not in CLOSED_STATUSES:
+                is_open[slot] += 1
+                if opened is not None:
+                    age_n[slot] += 1
+                    age_sum[slot] += self.now - opened
+
+    def add_chunk(self, rows: List[Dict[str, Any]]):
+        """Fold a chunk of search rows in with pandas (same result as add_rows)."""
+        import pandas
+
+        if not rows:
+            return
+        fields = [str(field) for field in (DATE_FIELD, SOLVEDATE_FIELD, STATUS_FIELD)]
+        frame = pandas.DataFrame.from_records(
+            rows, columns=[*dict.fromkeys([*self.group_by, *fields])]
+        )
+        keys = self.group_by
+        if not keys:
+            keys = ["_all"]
+            frame["_all"] = 0
+        for key in keys:
+            frame[key] = _key_column(pandas, frame[key])
+
+        opened = _wall_seconds(pandas, frame[fields[0]])
+        solved = _wall_seconds(pandas, frame[fields[1]])
+        is_open = ~pandas.to_numeric(frame[fields[2]], errors="coerce").isin(CLOSED_STATUSES)
+        frame = frame[keys].assign(
+            ttr=solved - opened,
+            open=is_open.astype(int),
+            age=(self.now - opened).where(is_open),
+        )
+
+        grouped = frame.groupby(keys, dropna=False, sort=False).agg(
+            count=("open", "size"),
+            open=("open", "sum"),
+            ttr_n=("ttr", "count"),
+            ttr_sum=("ttr", "sum"),
+            ttr_max=("ttr", "max"),
+            age_n=("age", "count"),
+            age_sum=("age", "sum"),
+        )
+
+        for key, values in zip(grouped.index, grouped.itertuples(index=False)):
+            key = key if isinstance(key, tuple) else (key,)
+            slot = self._slot(tuple(_plain(value) for value in key) if self.group_by else ())
+            for name in _COUNTERS:
+                value = _plain(getattr(values, name))
+                if value is None:
+                    continue
+                if name == "ttr_max":
+                    self.columns[name][slot] = max(self.columns[name][slot], value)
+                else:
+                    self.columns[name][slot] += value
+        self.rows += len(rows)
+
+    def results(self, metrics: Sequence[str], names: Sequence[str]) -> List[Dict[str, Any]]:
+        """One dictionary per group, sorted by group key.
+
+        Args:
+            metrics: Metrics to report (see METRICS); times are in hours
+            names: Output name of each group_by column
+
+        Returns:
+            List of {group column: value, ..., metric: value} dictionaries
+        """
+        columns = self.columns
+        results = []
+        for key, slot in sorted(self._slots.items(), key=lambda pair: _sort_key(pair[0])):
+            row: Dict[str, Any] = dict(zip(names, key))
+            ttr_n, age_n = columns["ttr_n"][slot], columns["age_n"][slot]
+            values = {
+                "count": int(columns["count"][slot]),
+                "backlog": int(columns["open"][slot]),
+                "solved": int(ttr_n),
+                "mttr": _hours(columns["ttr_sum"][slot] / ttr_n) if ttr_n else None,
+                "max_ttr": _hours(columns["ttr_max"][slot]) if ttr_n else None,
+                "mean_age": _hours(columns["age_sum"][slot] / age_n) if age_n else None,
+            }
+            row.update((metric, values[metric]) for metric in metrics)
+            results.append(row)
+        return results
+
+
+def _plain(value: Any) -> Any:
+    """NumPy scalar -> Python value; NaN -> None."""
+    if hasattr(value, "item"):
+        value = value.item()
+    if isinstance(value, float) and math.isnan(value):
+        return None
+    return value
+
+
+def _key_column(pandas, column) -> Any:
+    """Group column as Python values: IDs back from float (missing ones made
+    the column float) to int, NaN to None, multi-valued lists joined."""
+    if column.dtype.kind == "f":
+        try:
+            column = column.astype("Int64")
+        except TypeError:
+            pass
+    column = column.astype(object)
+    column = column.where(column.notna(), None)
+    if column.map(type).eq(list).any():
+        column = column.map(_key_value)
+    return column
+
+
+def _wall_seconds(pandas, column) -> Any:
+    """Vectorized _seconds: NaN where the value isn't a datetime."""
+    moments = pandas.to_datetime(column, errors="coerce", format="ISO8601")
+    return (moments - pandas.Timestamp(_EPOCH)).dt.total_seconds()
+
+
+def _hours(seconds: float) -> float:
+    return round(seconds / 3600, 2)
+
+
+def _sort_key(key: GroupKey) -> Tuple:
+    # None first, then numbers, then text, whatever mix a column holds
+    return tuple(
+        (0, 0, "") if v is None else (1, v, "") if isinstance(v, (int, float)) else (2, 0, str(v))
+        for v in key
+    )
+
+
+def pandas_available() -> bool:
+    """Whether the pandas engine can be used (pandas >= PANDAS_MIN_VERSION installed)."""
+    try:
+        import pandas
+    except ImportError:
+        return False
+    # On older pandas every date would be coerced to NaT without an error
+    version = tuple(int(part) for part in re.findall(r"\d+", pandas.__version__)[:2])
+    return version >= PANDAS_MIN_VERSION
+
+
+def aggregate(
+    rows: Iterable[Dict[str, Any]],
+    group_by: Sequence[int],
+    engine: str = "auto",
+    chunk_size: int = 20000,
+    now: Optional[float] = None,
+    on_chunk: Optional[Callable[[Aggregation], None]] = None,
+) -> Aggregation:
+    """Aggregate a stream of search rows.
+
+    Args:
+        rows: Search rows keyed by search option ID (e.g., GLPIClient.iter_search)
+        group_by: Search option IDs forming the group key
+        engine: python (row by row), pandas (vectorized per chunk of rows) or
+            auto (pandas when pandas >= 2.0 is installed)
+        chunk_size: Rows buffered per pandas chunk (bounds memory)
+        now: Reference time for ticket ages (default: now)
+        on_chunk: Called after each pandas chunk (progress)
+
+    Returns:
+        Aggregation holding the per-group counters
+
+    Raises:
+        GLPIError: If engine is pandas and pandas >= 2.0 isn't installed
+    """
+    if engine not in STATS_ENGINES:
+        raise GLPIError(f"Engine desconhecida: {engine} (use {', '.join(STATS_ENGINES)})")
+    if engine == "pandas" and not pandas_available():
+        raise GLPIError("Engine pandas requer o pacote pandas >= 2.0 (pip install 'pandas>=2')")
+    use_pandas = engine == "pandas" or (engine == "auto" and pandas_available())
+
+    aggregation = Aggregation(group_by, now)
+    if not use_pandas:
+        aggregation.add_rows(rows)
+        return aggregation
+
+    chunk: List[Dict[str, Any]] = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= chunk_size:
+            aggregation.add_chunk(chunk)
+            chunk = []
+            if on_chunk:
+                on_chunk(aggregation)
+    aggregation.add_chunk(chunk)
+    return aggregation
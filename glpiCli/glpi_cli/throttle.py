@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+"""Request pacing for GLPIClient: rate limit, adaptive concurrency and backoff.
+
+All threads of a client share one TokenBucket (requests per second) and one
+AdaptiveConcurrency limit. The limit follows AIMD: it grows by about one
+slot per window of successful requests and is halved when the server
+answers 429/5xx, times out or responds much slower than usual, so bulk
+operations settle at the highest parallelism the server tolerates.
+"""
+import random
+import threading
+import time
+from typing import Optional
+
+
+def backoff_delay(attempt: int, base: float = 0.5, cap: float = 30.0) -> float:
+    """Seconds to wait before a retry, with full jitter.
+
+    Args:
+        attempt: Zero-based retry number
+        base: Delay ceiling of the first retry
+        cap: Maximum delay ceiling
+
+    Returns:
+        Random delay in [0, min(cap, base * 2 ** attempt)]
+    """
+    return random.uniform(0, min(cap, base * 2**attempt))
+
+
+class TokenBucket:
+    """Thread-safe token bucket limiting requests per second."""
+
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        """Initialize the bucket full.
+
+        Args:
+            rate: Tokens added per second (0 disables the limit)
+            burst: Bucket capacity (default: one second worth of tokens, at least 1)
+        """
+        self.rate = rate
+        self.capacity = float(burst if burst is not None else max(rate, 1))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Take one token, sleeping until one is available."""
+        if self.rate <= 0:
+            return
+
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+class AdaptiveConcurrency:
+    """AIMD limit on requests in flight."""
+
+    def __init__(
+        self,
+        limit: int,
+        minimum: int = 1,
+        backoff: float = 0.5,
+        latency_factor: float = 3.0,
+        min_spike: float = 0.5,
+        enabled: bool = True,
+    ):
+        """Initialize the limiter at its maximum.
+
+        Args:
+            limit: Starting and maximum number of requests in flight
+            minimum: Floor the limit never drops below
+            backoff: Factor applied to the limit on congestion
+            latency_factor: A response slower than this multiple of the
+                average latency counts as congestion
+            min_spike: Responses faster than this many seconds never count as spikes
+            enabled: When False the limit stays fixed at its maximum
+        """
+        self.maximum = max(limit, minimum)
+        self.minimum = minimum
+        self.backoff = backoff
+        self.latency_factor = latency_factor
+        self.min_spike = min_spike
+        self.enabled = enabled
+        self.limit = float(self.maximum)
+        self.in_flight = 0
+        self.avg_latency: Optional[float] = None
+        self._last_decrease = 0.0
+        self._cond = threading.Condition()
+
+    def acquire(self):
+        """Wait for a free slot."""
+        with self._cond:
+            while self.in_flight >= int(self.limit):
+                self._cond.wait()
+            self.in_flight += 1
+
+    def release(self, latency: Optional[float] = None, congested: bool = False):
+        """Free a slot and adjust the limit from the request outcome.
+
+        Args:
+            latency: Seconds the request took (None if it failed without a response)
+            congested: The server signalled overload (429/5xx, timeout)
+        """
+        with self._cond:
+            self.in_flight -= 1
+
+            if latency is not None and not congested:
+                if self.avg_latency is not None:
+                    congested = latency > max(
+                        self.avg_latency * self.latency_factor, self.min_spike
+                    )
+                # Spikes still feed the average so a lasting slowdown becomes the new normal
+                self.avg_latency = (
+                    latency
+                    if self.avg_latency is None
+                    else 0.8 * self.avg_latency + 0.2 * latency
+                )
+
+            if self.enabled:
+                if congested:
+                    self._decrease()
+                else:
+                    self.limit = min(self.maximum, self.limit + 1 / self.limit)
+
+            self._cond.notify_all()
+
+    def _decrease(self):
+        """Multiplicative decrease, at most once per average round trip."""
+        now = time.monotonic()
+        # Requests already in flight when the first error came back report the same congestion
+        if now - self._last_decrease < max(self.avg_latency or 0, 0.1):
+            return
+        self._last_decrease = now
+        self.limit = max(self.minimum, self.limit * self.backoff)
@@ -1,4 +1,7 @@
 """Utility functions for GLPI CLI."""
+import json
+import re
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 
 # Common GLPI ItemTypes with their correct PascalCase format
@@ -104,3 +107,115 @@ def get_available_itemtypes() -> list[str]:
         List of ItemType names in PascalCase
     """
     return sorted(set(KNOWN_ITEMTYPES.values()))
+
+
+_CONTENT_RANGE_RE = re.compile(r"(\d+)-(\d+)/(\d+)")
+
+
+def parse_content_range(header: Optional[str]) -> Optional[Tuple[int, int, int]]:
+    """Parse GLPI's Content-Range header.
+
+    Examples:
+        >>> parse_content_range("0-49/1234")
+        (0, 49, 1234)
+        >>> parse_content_range(None) is None
+        True
+
+    Args:
+        header: Header value in the form 'start-end/total'
+
+    Returns:
+        Tuple of (start, end, total), or None if missing or malformed
+    """
+    if not header:
+        return None
+
+    match = _CONTENT_RANGE_RE.search(header)
+    if not match:
+        return None
+
+    start, end, total = (int(g) for g in match.groups())
+    return start, end, total
+
+
+def parse_ids(lines: Iterable[str]) -> List[int]:
+    """Parse item IDs separated by whitespace or commas, skipping # comments.
+
+    Examples:
+        >>> parse_ids(["1 2,3", "# comment", "", "42"])
+        [1, 2, 3, 42]
+
+    Args:
+        lines: Text lines (e.g., a file or stdin)
+
+    Returns:
+        List of IDs in input order
+
+    Raises:
+        ValueError: If a token isn't an integer
+    """
+    ids = []
+    for line in lines:
+        line = line.split("#", 1)[0]
+        for token in line.replace(",", " ").split():
+            try:
+                ids.append(int(token))
+            except ValueError:
+                raise ValueError(f"ID inválido: {token!r}")
+    return ids
+
+
+def parse_ndjson(lines: Iterable[str]) -> List[Dict[str, Any]]:
+    """Parse one JSON object per line, skipping blank lines.
+
+    A bare integer stands for {"id": <integer>}, so a list of IDs can be
+    piped straight into delete.
+
+    Examples:
+        >>> parse_ndjson(['{"id": 1, "status": 2}', "", "7"])
+        [{'id': 1, 'status': 2}, {'id': 7}]
+
+    Args:
+        lines: Text lines (e.g., a file or stdin)
+
+    Returns:
+        List of dictionaries in input order
+
+    Raises:
+        ValueError: If a line isn't a JSON object or integer
+    """
+    items = []
+    for number, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        try:
+            value = json.loads(line)
+        except ValueError:
+            raise ValueError(f"Linha {number}: JSON inválido")
+        if isinstance(value, int) and not isinstance(value, bool):
+            value = {"id": value}
+        if not isinstance(value, dict):
+            raise ValueError(f"Linha {number}: esperado um objeto JSON")
+        items.append(value)
+    return items
+
+
+def project_fields(item: Dict[str, Any], fields: Optional[Iterable[str]]) -> Dict[str, Any]:
+    """Keep only the requested top-level keys of an item, in the given order.
+
+    Examples:
+        >>> project_fields({"id": 1, "name": "a", "status": 2}, ["name", "id"])
+        {'name': 'a', 'id': 1}
+        >>> project_fields({"id": 1}, None)
+        {'id': 1}
+
+    Args:
+        item: Item data
+        fields: Keys to keep, or None to keep everything
+
+    Returns:
+        Projected item (missing keys are skipped)
+    """
+    if not fields or not isinstance(item, dict):
+        return item
+    return {field: item[field] for field in fields if field in item}
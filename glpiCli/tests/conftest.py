@@ -0,0 +1,32 @@
+"""Shared fixtures: a fake GLPI server (benchmarks/fake_glpi.py) and a Config for it."""
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "benchmarks"))
+
+from fake_glpi import make_server  # noqa: E402
+
+from glpi_cli.config import Config  # noqa: E402
+
+
+@pytest.fixture
+def fake_glpi():
+    """Fake GLPI server with 250 rows per itemtype and no added latency."""
+    server, url = make_server(base_latency=0, join_latency=0, items=250, item_latency=0)
+    yield server, url
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def config(fake_glpi, tmp_path, monkeypatch):
+    """Config pointing at fake_glpi, ignoring the user's config.yml and caches."""
+    _, url = fake_glpi
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    monkeypatch.setenv("GLPI_URL", url)
+    monkeypatch.setenv("GLPI_APP_TOKEN", "app")
+    monkeypatch.setenv("GLPI_USER_TOKEN", "user")
+    return Config()
@@ -0,0 +1,67 @@
+"""Tests for AsyncGLPIClient against the fake GLPI server."""
+import asyncio
+import time
+
+from glpi_cli.async_client import AsyncGLPIClient
+from glpi_cli.client import GLPIClient
+
+
+async def collect(config, **kwargs):
+    async with AsyncGLPIClient(config, concurrency=4) as glpi:
+        return [item async for item in glpi.iter_items("Computer", **kwargs)]
+
+
+def test_iter_items_matches_sync_client(config):
+    client = GLPIClient(config)
+    client.init_session()
+    expected = [item["id"] for item in client.iter_items("Computer", page_size=40)]
+    client.close()
+
+    items = asyncio.run(collect(config, page_size=40))
+
+    assert [item["id"] for item in items] == expected
+    assert len(expected) == 250
+
+
+def test_breaking_out_of_iter_items_closes_the_iterator(config, fake_glpi):
+    server, _ = fake_glpi
+
+    async def first_items():
+        async with AsyncGLPIClient(config, concurrency=2) as glpi:
+            seen = []
+            async for item in glpi.iter_items("Computer", page_size=10):
+                seen.append(item["id"])
+                if len(seen) == 15:
+                    break
+            return seen
+
+    assert len(asyncio.run(first_items())) == 15
+    assert server.counters["killSession"] == 1
+
+
+def test_aclose_closes_connections_after_kill_even_if_cancelled(config, fake_glpi):
+    server, _ = fake_glpi
+    events = []
+
+    async def cancel_during_aclose():
+        glpi = AsyncGLPIClient(config)
+        await glpi.init_session()
+        kill_session, close = glpi.client.kill_session, glpi.client.close
+
+        def slow_kill_session(*args):
+            time.sleep(0.2)
+            kill_session(*args)
+            events.append("killed")
+
+        glpi.client.kill_session = slow_kill_session
+        glpi.client.close = lambda: (events.append("closed"), close())
+
+        closing = asyncio.ensure_future(glpi.aclose())
+        await asyncio.sleep(0.05)
+        closing.cancel()
+        await asyncio.sleep(0.4)
+
+    asyncio.run(cancel_during_aclose())
+
+    assert events == ["killed", "closed"]
+    assert server.counters["killSession"] == 1
@@ -0,0 +1,54 @@
+"""Tests for the response cache."""
+from glpi_cli.cache import ResponseCache
+
+PARAMS = {"expand_dropdowns": "true"}
+
+
+def test_key_is_scoped_by_url_and_user_token():
+    key = ResponseCache.make_key("http://a/apirest.php", "u1", "Computer", 42, PARAMS)
+
+    assert key == ResponseCache.make_key("http://a/apirest.php/", "u1", "Computer", 42, PARAMS)
+    assert key != ResponseCache.make_key("http://b/apirest.php", "u1", "Computer", 42, PARAMS)
+    assert key != ResponseCache.make_key("http://a/apirest.php", "u2", "Computer", 42, PARAMS)
+    assert "u1" not in key
+
+
+def test_entries_of_other_servers_are_not_served(tmp_path):
+    cache = ResponseCache(path=tmp_path / "responses.sqlite")
+    key_a = ResponseCache.make_key("http://a/apirest.php", "u", "Computer", 42, PARAMS)
+    key_b = ResponseCache.make_key("http://b/apirest.php", "u", "Computer", 42, PARAMS)
+
+    cache.put(key_a, "Computer", 42, {"id": 42, "name": "from-a"}, etag='"a"')
+
+    assert cache.get(key_a).data["name"] == "from-a"
+    assert cache.get(key_b) is None
+
+
+def test_default_ttl_always_revalidates(tmp_path):
+    cache = ResponseCache(path=tmp_path / "responses.sqlite")
+    key = ResponseCache.make_key("http://a/apirest.php", "u", "Computer", 42, PARAMS)
+
+    cache.put(key, "Computer", 42, {"id": 42}, etag='"a"')
+
+    assert cache.get(key).fresh is False
+
+
+def test_invalidate_drops_every_entry_of_the_items(tmp_path):
+    cache = ResponseCache(path=tmp_path / "responses.sqlite", ttl=3600)
+    keys = {
+        (url, item_id): ResponseCache.make_key(url, "u", "Computer", item_id, PARAMS)
+        for url in ("http://a/apirest.php", "http://b/apirest.php")
+        for item_id in (1, 2)
+    }
+    for (_, item_id), key in keys.items():
+        cache.put(key, "Computer", item_id, {"id": item_id})
+    other = ResponseCache.make_key("http://a/apirest.php", "u", "Ticket", 1, PARAMS)
+    cache.put(other, "Ticket", 1, {"id": 1})
+
+    cache.invalidate("Computer", [1])
+
+    assert [key for key in keys.values() if cache.get(key)] == [
+        keys["http://a/apirest.php", 2],
+        keys["http://b/apirest.php", 2],
+    ]
+    assert cache.get(other) is not None
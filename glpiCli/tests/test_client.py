@@ -0,0 +1,162 @@
+"""Tests for GLPIClient against the fake GLPI server."""
+import time
+
+import pytest
+import requests
+
+from glpi_cli.cache import ResponseCache
+from glpi_cli.client import GLPIClient
+from glpi_cli.errors import GLPIError
+
+
+def test_negative_max_retries_still_sends_one_request(config):
+    config.max_retries = -1
+    client = GLPIClient(config)
+    client.init_session()
+
+    assert client.max_retries == 0
+    assert client.get_item("Computer", 1)["id"] == 1
+    client.close()
+
+
+@pytest.fixture
+def client(config):
+    client = GLPIClient(config)
+    client.init_session()
+    yield client
+    client.close()
+
+
+def canned_response(status: int, body: bytes, content_type: str = "text/html") -> requests.Response:
+    response = requests.Response()
+    response.status_code = status
+    response._content = body
+    response.headers["Content-Type"] = content_type
+    response.url = "http://glpi/apirest.php/Computer"
+    return response
+
+
+def test_add_items_returns_new_ids_in_input_order(client, fake_glpi):
+    server, _ = fake_glpi
+    items = [{"name": f"novo-{n}"} for n in range(5)]
+
+    results = [*client.add_items("Computer", items, batch_size=2, workers=2)]
+
+    assert [item for item, _, _ in results] == items
+    assert all(error is None for _, _, error in results)
+    # Batches run in parallel, so IDs follow arrival order; each maps to its own input
+    for item, item_id, _ in results:
+        assert server.dataset.get("Computer", item_id)["name"] == item["name"]
+    assert sorted(item_id for _, item_id, _ in results) == [251, 252, 253, 254, 255]
+
+
+def test_update_items_reports_mixed_multi_status_per_item(client, fake_glpi):
+    server, _ = fake_glpi
+    items = [{"id": 1, "name": "um"}, {"id": 999, "name": "x"}, {"id": 3, "name": "três"}]
+
+    results = [*client.update_items("Computer", items, batch_size=3)]
+
+    assert [item_id for _, item_id, _ in results] == [1, 999, 3]
+    assert [error is None for _, _, error in results] == [True, False, True]
+    assert results[1][2].status_code == 207
+    assert "não encontrado" in results[1][2].message
+    assert server.dataset.get("Computer", 3)["name"] == "três"
+
+
+def test_delete_items_reports_missing_items(client, fake_glpi):
+    server, _ = fake_glpi
+
+    results = [*client.delete_items("Computer", [{"id": 2}, {"id": 2}], batch_size=1, workers=1)]
+
+    assert [error is None for _, _, error in results] == [True, False]
+    assert server.dataset.get("Computer", 2) is None
+
+
+def test_no_content_means_every_item_succeeded(client, monkeypatch):
+    monkeypatch.setattr(client.http, "request", lambda *a, **kw: canned_response(204, b""))
+
+    results = [*client.update_items("Computer", [{"id": 1}, {"id": 2}])]
+
+    assert results == [({"id": 1}, 1, None), ({"id": 2}, 2, None)]
+
+
+def test_undecodable_success_body_fails_every_item(client, monkeypatch):
+    login_page = canned_response(200, b"<html>login page</html>")
+    monkeypatch.setattr(client.http, "request", lambda *a, **kw: login_page)
+
+    results = [*client.add_items("Computer", [{"name": "a"}, {"name": "b"}])]
+
+    assert [item_id for _, item_id, _ in results] == [None, None]
+    for _, _, error in results:
+        assert "Resposta inválida do servidor (HTTP 200)" in str(error)
+
+
+def test_undecodable_error_body_is_reported_with_its_status(client, monkeypatch):
+    proxy_error = canned_response(500, b"<html>Internal Server Error</html>")
+    monkeypatch.setattr(client.http, "request", lambda *a, **kw: proxy_error)
+
+    (_, _, error), = client.add_items("Computer", [{"name": "a"}])
+
+    assert error.status_code == 500
+    assert "conex" not in error.message
+
+
+def test_writes_drop_cached_responses_of_changed_items(config, tmp_path):
+    client = GLPIClient(config, response_cache=ResponseCache(tmp_path / "r.sqlite", ttl=3600))
+    client.init_session()
+    client.get_item("Computer", 1)
+    client.get_item("Computer", 2)
+
+    [*client.update_items("Computer", [{"id": 1, "name": "renomeado"}])]
+    [*client.delete_items("Computer", [{"id": 2}])]
+
+    assert client.get_item("Computer", 1)["name"] == "renomeado"
+    with pytest.raises(GLPIError):
+        client.get_item("Computer", 2)
+    client.close()
+
+
+def test_get_items_keeps_input_order_and_isolates_failures(client):
+    ids = [5, 9999, 3, 1, 9998, 2]
+
+    results = [*client.get_items("Computer", ids, workers=4)]
+
+    assert [item_id for item_id, _, _ in results] == ids
+    for item_id, item, error in results:
+        if item_id > 250:
+            assert item is None and error.status_code == 404
+        else:
+            assert error is None and item["id"] == item_id
+
+
+def test_get_items_completion_order_yields_fast_items_first(client, monkeypatch):
+    get_item = client.get_item
+
+    def slow_first(itemtype, item_id, **params):
+        if item_id == 1:
+            time.sleep(0.3)
+        return get_item(itemtype, item_id, **params)
+
+    monkeypatch.setattr(client, "get_item", slow_first)
+
+    results = [item_id for item_id, _, _ in client.get_items("Computer", [1, 2, 3], ordered=False)]
+
+    assert results[-1] == 1
+    assert sorted(results) == [1, 2, 3]
+
+
+def test_get_items_reads_ids_lazily(client):
+    pulled = []
+
+    def ids():
+        for item_id in range(1, 101):
+            pulled.append(item_id)
+            yield item_id
+
+    results = client.get_items("Computer", ids(), workers=2)
+    first = next(results)
+    results.close()
+
+    assert first[0] == 1
+    # 2 * workers queued, plus one refill after the first result
+    assert len(pulled) == 5
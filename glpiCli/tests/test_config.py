@@ -0,0 +1,79 @@
+"""Tests for Config loading (env vars, config.yml, invalid values)."""
+import pytest
+
+from glpi_cli.config import DEFAULT_POOL_SIZE, Config
+
+CREDENTIALS = {"GLPI_URL": "http://glpi/apirest.php", "GLPI_APP_TOKEN": "a", "GLPI_USER_TOKEN": "u"}
+
+
+@pytest.fixture
+def home(tmp_path, monkeypatch):
+    """Empty HOME with the credentials in env and no GLPI_* tunables."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    for name in ("GLPI_TIMEOUT", "GLPI_POOL_SIZE", "GLPI_MAX_RETRIES", "GLPI_CACHE_TTL"):
+        monkeypatch.delenv(name, raising=False)
+    for name, value in CREDENTIALS.items():
+        monkeypatch.setenv(name, value)
+    return tmp_path
+
+
+def write_config(home, text: str):
+    path = home / ".config" / "glpi" / "config.yml"
+    path.parent.mkdir(parents=True)
+    path.write_text(text)
+
+
+def test_invalid_env_value_is_reported_not_raised(home, monkeypatch):
+    monkeypatch.setenv("GLPI_TIMEOUT", "abc")
+
+    config = Config()
+
+    assert config.validate() == (False, "GLPI_TIMEOUT inválido: 'abc'")
+
+
+def test_file_tunables_apply_with_credentials_in_env(home):
+    write_config(home, "timeout: 3\ncache_ttl: 7\n")
+
+    config = Config()
+
+    assert config.validate() == (True, None)
+    assert config.timeout == 3.0
+    assert config.cache_ttl == 7
+
+
+def test_env_tunable_overrides_file(home, monkeypatch):
+    write_config(home, "cache_ttl: 7\n")
+    monkeypatch.setenv("GLPI_CACHE_TTL", "9")
+
+    assert Config().cache_ttl == 9
+
+
+def test_invalid_file_value_is_reported_and_others_still_load(home):
+    write_config(home, "pool_size: lots\ncache_ttl: 7\n")
+
+    config = Config()
+
+    valid, message = config.validate()
+    assert not valid
+    assert "pool_size" in message and "'lots'" in message
+    assert config.pool_size == DEFAULT_POOL_SIZE
+    assert config.cache_ttl == 7
+
+
+def test_credentials_from_file_when_env_missing(home, monkeypatch):
+    monkeypatch.delenv("GLPI_USER_TOKEN")
+    write_config(home, "user_token: from-file\n")
+
+    config = Config()
+
+    assert config.user_token == "from-file"
+    assert config.url == CREDENTIALS["GLPI_URL"]
+
+
+def test_negative_max_retries_is_clamped(home, monkeypatch):
+    monkeypatch.setenv("GLPI_MAX_RETRIES", "-1")
+
+    config = Config()
+
+    assert config.validate() == (True, None)
+    assert config.max_retries == 0
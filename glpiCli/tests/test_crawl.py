@@ -0,0 +1,62 @@
+"""Tests for glpi crawl against the fake GLPI server."""
+import pytest
+
+from glpi_cli.client import GLPIClient
+from glpi_cli.crawl import crawl, expansion_links
+
+
+@pytest.fixture
+def client(config):
+    client = GLPIClient(config)
+    client.init_session()
+    yield client
+    client.close()
+
+
+def node_ids(graph, itemtype):
+    return sorted(node["id"] for node in graph["nodes"] if node["itemtype"] == itemtype)
+
+
+def test_depth_zero_fetches_only_the_root(client, fake_glpi):
+    server, _ = fake_glpi
+
+    graph = crawl(client, "Ticket", 1, depth=0)
+
+    assert graph["nodes"] == [
+        {"itemtype": "Ticket", "id": 1, "depth": 0, "item": graph["nodes"][0]["item"]}
+    ]
+    assert graph["edges"] == []
+    assert server.counters["item"] == 1
+    assert server.counters["linked"] == 0
+
+
+def test_every_item_is_fetched_once_within_the_depth(client, fake_glpi):
+    server, _ = fake_glpi
+
+    graph = crawl(client, "Ticket", 1, depth=2, follow=["Ticket", "Computer"])
+
+    visited = [(node["itemtype"], node["id"]) for node in graph["nodes"]]
+    assert len(visited) == len(set(visited))
+    assert server.counters["item"] == len(visited)
+    assert max(node["depth"] for node in graph["nodes"]) == 2
+    # Every ticket links tickets 1-39, so they are all one hop from the root
+    assert {node["depth"] for node in graph["nodes"] if node["itemtype"] == "Ticket"} == {0, 1}
+    # Linked items are listed for the 39 tickets of layers 0 and 1, not for layer 2
+    assert server.counters["linked"] == 39
+    assert len(graph["edges"]) > len(visited) - 1
+
+
+def test_contract_links_use_contracts_id(client, fake_glpi):
+    graph = crawl(client, "Computer", 1, depth=1, follow=["Contract"])
+
+    assert node_ids(graph, "Contract") == [1, 2]
+    assert {edge["via"] for edge in graph["edges"]} == {"_contracts"}
+
+
+def test_contract_link_ids_are_not_followed():
+    # expand_dropdowns turned contracts_id into the contract name
+    item = {
+        "_contracts": [{"id": 100, "contracts_id": "Suporte 24x7"}, {"id": 101, "contracts_id": 2}]
+    }
+
+    assert [*expansion_links(item)] == [(("Contract", 2), "_contracts")]
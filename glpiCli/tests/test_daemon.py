@@ -0,0 +1,193 @@
+"""Tests for the glpi serve socket protocol and GLPI_SOCKET forwarding."""
+import socket
+import subprocess
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+from glpi_cli import daemon
+
+PROJECT_DIR = Path(__file__).resolve().parent.parent
+
+FORWARD = (
+    "import sys; from pathlib import Path; from glpi_cli.daemon import forward; "
+    "sys.exit(forward(Path(sys.argv[1]), sys.argv[2:]))"
+)
+MAIN = "from glpi_cli.cli import main; main()"
+
+# Multi-byte characters straddle the chunk boundaries
+LINES = [f'{{"id": {n}, "name": "manutenção {n}"}}\n' for n in range(50)]
+
+
+class Daemon:
+    """glpi serve stand-in answering on a socket with a recording command."""
+
+    def __init__(self, path, command):
+        self.path = path
+        self.command = command
+        self.calls = []
+        self._listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._listener.bind(str(path))
+        self._listener.listen(1)
+        self._listener.settimeout(0.05)
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._serve)
+        self._thread.start()
+
+    def _run(self, argv):
+        self.calls.append(argv)
+        return self.command(argv)
+
+    def _serve(self):
+        while not self._stopped.is_set():
+            try:
+                conn, _ = self._listener.accept()
+            except socket.timeout:
+                continue
+            with conn:
+                daemon._handle(conn, self._run)
+
+    def stop(self):
+        self._stopped.set()
+        self._thread.join()
+        self._listener.close()
+
+
+@pytest.fixture
+def serve(tmp_path):
+    started = []
+
+    def start(command):
+        started.append(Daemon(tmp_path / "daemon.sock", command))
+        return started[-1]
+
+    yield start
+    for running in started:
+        running.stop()
+
+
+def glpi(script: str, *args: str, stdin: str = "") -> subprocess.CompletedProcess:
+    """Run the forwarding side in its own process, like a real `glpi` call.
+
+    The daemon swaps sys.stdin/stdout/stderr while a command runs, so the two
+    ends can't share an interpreter.
+    """
+    return subprocess.run(
+        [sys.executable, "-c", script, *args],
+        input=stdin.encode("utf-8"),
+        capture_output=True,
+        cwd=PROJECT_DIR,
+        timeout=30,
+        check=False,
+    )
+
+
+def forward(path: Path, argv, stdin: str = "") -> subprocess.CompletedProcess:
+    return glpi(FORWARD, str(path), *argv, stdin=stdin)
+
+
+def test_forward_relays_output_and_exit_code(serve):
+    def command(argv):
+        sys.stdout.write("saída\n")
+        sys.stderr.write("aviso\n")
+        return 3
+
+    running = serve(command)
+    result = forward(running.path, ["list", "ticket"])
+
+    assert result.returncode == 3
+    assert running.calls == [["list", "ticket"]]
+    assert (result.stdout.decode(), result.stderr.decode()) == ("saída\n", "aviso\n")
+
+
+def test_forward_without_daemon_returns_none(tmp_path):
+    assert daemon.forward(tmp_path / "missing.sock", ["list", "ticket"]) is None
+
+
+def test_stdin_is_streamed_in_chunks(serve, monkeypatch):
+    monkeypatch.setattr(daemon, "STDIN_CHUNK_SIZE", 64)
+    buffered = []
+    fill = daemon._RemoteStdin._fill
+
+    def recording_fill(self):
+        buffered.append(self._available())
+        return fill(self)
+
+    monkeypatch.setattr(daemon._RemoteStdin, "_fill", recording_fill)
+
+    def command(argv):
+        for line in sys.stdin:
+            sys.stdout.write(line.upper())
+        return 0
+
+    running = serve(command)
+    text = "".join(LINES)
+    result = forward(running.path, ["add", "ticket"], stdin=text)
+
+    assert result.returncode == 0
+    assert result.stdout.decode() == text.upper()
+    # One frame per chunk, each asked for only once the text before it was used up
+    assert len(buffered) > len(text.encode("utf-8")) // 64
+    assert max(buffered) < 64
+
+
+def test_remote_stdin_read_and_readline(serve, monkeypatch):
+    monkeypatch.setattr(daemon, "STDIN_CHUNK_SIZE", 16)
+
+    def command(argv):
+        first = sys.stdin.readline()
+        partial = sys.stdin.readline(5)
+        sized = sys.stdin.read(40)
+        rest = sys.stdin.read()
+        sys.stdout.write("|".join([first, partial, sized, rest]))
+        return 0
+
+    running = serve(command)
+    text = "".join(LINES)
+    result = forward(running.path, ["delete", "ticket"], stdin=text)
+
+    start = len(LINES[0])
+    parts = [LINES[0], text[start : start + 5], text[start + 5 : start + 45], text[start + 45 :]]
+    assert result.stdout.decode() == "|".join(parts)
+
+
+def test_empty_stdin_reads_as_end_of_input(serve):
+    def command(argv):
+        sys.stdout.write(repr([sys.stdin.read(), sys.stdin.readline()]))
+        return 0
+
+    running = serve(command)
+    result = forward(running.path, ["add", "ticket"])
+
+    assert result.stdout.decode() == "['', '']"
+
+
+def test_main_forwards_to_daemon(serve, monkeypatch):
+    running = serve(lambda argv: 5)
+    monkeypatch.setenv("GLPI_SOCKET", str(running.path))
+
+    result = glpi(MAIN, "--compact", "get", "ticket", "1")
+
+    assert result.returncode == 5
+    assert running.calls == [["--compact", "get", "ticket", "1"]]
+
+
+def test_main_runs_in_process_without_daemon(tmp_path, monkeypatch):
+    monkeypatch.setenv("GLPI_SOCKET", str(tmp_path / "missing.sock"))
+
+    result = glpi(MAIN, "--help")
+
+    assert result.returncode == 0
+    assert "Usage:" in result.stdout.decode()
+
+
+def test_main_never_forwards_shell_or_serve(serve, monkeypatch):
+    running = serve(lambda argv: 5)
+    monkeypatch.setenv("GLPI_SOCKET", str(running.path))
+
+    result = glpi(MAIN, "serve", "--help")
+
+    assert result.returncode == 0
+    assert running.calls == []
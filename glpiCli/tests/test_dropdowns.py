@@ -0,0 +1,34 @@
+"""Tests for client-side dropdown resolution."""
+from fake_glpi import make_server
+
+from glpi_cli.client import GLPIClient
+from glpi_cli.dropdowns import DropdownCache
+
+
+def resolve_entity(config, url: str, entity_id: int) -> str:
+    """Resolve an entities_id through the default cache file of a server."""
+    config.url = url
+    client = GLPIClient(config)
+    client.init_session()
+    cache = DropdownCache(url=client.base_url)
+    try:
+        return cache.resolve(client, {"id": 1, "entities_id": entity_id})["entities_id"]
+    finally:
+        cache.close()
+        client.close()
+
+
+def test_tables_are_scoped_by_server(config, fake_glpi):
+    _, url_a = fake_glpi
+    server_b, url_b = make_server(base_latency=0, join_latency=0, items=250, item_latency=0)
+    server_b.dataset.update("Entity", {"id": 2, "name": "Entidade do B"})
+    try:
+        name_a = resolve_entity(config, url_a, 2)
+        name_b = resolve_entity(config, url_b, 2)
+    finally:
+        server_b.shutdown()
+        server_b.server_close()
+
+    assert name_a != "Entidade do B"
+    assert name_b == "Entidade do B"
+    assert DropdownCache(url=url_a).path != DropdownCache(url=url_b).path
@@ -0,0 +1,80 @@
+"""Tests for JSON backend selection and output parity."""
+import datetime
+
+import pytest
+
+from glpi_cli import fast_json
+
+SAMPLE = {
+    "id": 42,
+    "name": "Manutenção preventiva",
+    "url": "https://glpi/front/ticket.form.php?id=42",
+    "_tickets": [{"id": 1, "status": 6}, {"id": 2, "status": None}],
+    "ratio": 0.5,
+    "active": True,
+    3: "chave numérica",
+    "date": datetime.date(2025, 1, 2),
+}
+
+
+def unavailable():
+    raise ImportError("not installed")
+
+
+@pytest.fixture
+def loaders(monkeypatch):
+    """Make every backend loadable (as stdlib), so tests don't depend on installs."""
+    for name in fast_json.BACKENDS:
+        monkeypatch.setitem(fast_json._LOADERS, name, fast_json._stdlib)
+    monkeypatch.delenv("GLPI_JSON_BACKEND", raising=False)
+    return fast_json._LOADERS
+
+
+def test_prefers_orjson_then_ujson(loaders, monkeypatch):
+    assert fast_json._select()[0] == "orjson"
+
+    monkeypatch.setitem(loaders, "orjson", unavailable)
+    assert fast_json._select()[0] == "ujson"
+
+    monkeypatch.setitem(loaders, "ujson", unavailable)
+    assert fast_json._select()[0] == "stdlib"
+    assert fast_json.available_backends() == ["stdlib"]
+
+
+def test_environment_forces_a_backend(loaders, monkeypatch):
+    monkeypatch.setenv("GLPI_JSON_BACKEND", "ujson")
+
+    assert fast_json._select()[0] == "ujson"
+
+
+def test_forced_backend_that_is_missing_falls_back_to_stdlib(loaders, monkeypatch):
+    monkeypatch.setitem(loaders, "ujson", unavailable)
+    monkeypatch.setenv("GLPI_JSON_BACKEND", "ujson")
+
+    assert fast_json._select()[0] == "stdlib"
+
+
+def test_unknown_forced_backend_uses_preference_order(loaders, monkeypatch):
+    monkeypatch.setenv("GLPI_JSON_BACKEND", "simdjson")
+
+    assert fast_json._select()[0] == "orjson"
+
+
+@pytest.mark.parametrize("backend", fast_json.available_backends())
+@pytest.mark.parametrize("indent", [False, True])
+def test_installed_backends_match_stdlib_output(backend, indent):
+    loads, dumps = fast_json.load_backend(backend)
+    stdlib_loads, stdlib_dumps = fast_json.load_backend("stdlib")
+
+    text = dumps(SAMPLE, indent=indent)
+
+    assert text == stdlib_dumps(SAMPLE, indent=indent)
+    assert loads(text) == stdlib_loads(text)
+    assert loads(text.encode("utf-8")) == stdlib_loads(text)
+
+
+@pytest.mark.parametrize("backend", fast_json.available_backends())
+def test_installed_backends_encode_integers_beyond_64_bits(backend):
+    _, dumps = fast_json.load_backend(backend)
+
+    assert dumps({"id": 2**70}) == '{"id":1180591620717411303424}'
@@ -0,0 +1,70 @@
+"""Tests for the local fingerprint index against the fake GLPI server."""
+import pytest
+
+from glpi_cli.client import GLPIClient
+from glpi_cli.errors import GLPIError
+from glpi_cli.fingerprint_index import FingerprintIndex
+
+PLUGIN_ITEMTYPE = "PluginFieldsProblemfingerprint"
+
+
+@pytest.fixture
+def client(config, fake_glpi):
+    server, _ = fake_glpi
+    # The fake's plugin records have no date_mod: give them increasing ones
+    for item_id in range(1, 251):
+        row = server.dataset.get(PLUGIN_ITEMTYPE, item_id)
+        row["date_mod"] = f"2025-01-01 {item_id // 60:02d}:{item_id % 60:02d}:00"
+
+    client = GLPIClient(config)
+    client.init_session()
+    yield client
+    client.close()
+
+
+@pytest.fixture
+def index(tmp_path):
+    index = FingerprintIndex(path=tmp_path / "fingerprints.sqlite")
+    yield index
+    index.close()
+
+
+def test_build_indexes_every_record_and_sets_the_watermark(client, index):
+    assert index.build(client, "Problem", page_size=40) == 250
+
+    state = index.state("Problem")
+    assert state["records"] == 250
+    assert state["watermark"] == "2025-01-01 04:10:00"
+    assert index.lookup("Problem", "fp-000007") == [
+        {"id": 7, "items_id": 7, "date_mod": "2025-01-01 00:07:00"}
+    ]
+
+
+def test_sync_fetches_only_records_modified_since_the_watermark(client, index, fake_glpi):
+    server, _ = fake_glpi
+    index.build(client, "Problem")
+    server.dataset.update(PLUGIN_ITEMTYPE, {"id": 5, "fingerprint": "novo-5"})
+    server.dataset.update(PLUGIN_ITEMTYPE, {"id": 80, "fingerprint": "novo-80"})
+    pages_before = server.counters["collection"]
+
+    # The 2 changed records, plus the one at the watermark (same-second updates)
+    assert index.sync(client, "Problem", page_size=10) == 3
+
+    assert server.counters["collection"] - pages_before == 1
+    assert [row["id"] for row in index.lookup("Problem", "novo-5")] == [5]
+    assert index.lookup("Problem", "fp-000005") == []
+    state = index.state("Problem")
+    assert state["records"] == 250
+    assert state["watermark"] == server.dataset.get(PLUGIN_ITEMTYPE, 80)["date_mod"]
+
+
+def test_sync_without_changes_keeps_the_watermark(client, index):
+    index.build(client, "Problem")
+
+    assert index.sync(client, "Problem") == 1
+    assert index.state("Problem")["watermark"] == "2025-01-01 04:10:00"
+
+
+def test_sync_requires_a_built_index(client, index):
+    with pytest.raises(GLPIError, match="ainda não foi criado"):
+        index.sync(client, "Problem")
@@ -0,0 +1,21 @@
+"""Startup import budget of glpi_cli.cli (see benchmarks/bench_import_time.py)."""
+from bench_import_time import LAZY_MODULES, measure
+
+# bench_import_time.py's budget is 80 ms; the margin absorbs slow CI machines
+BUDGET_MS = 120
+
+
+def test_cli_import_stays_lazy_and_within_budget(monkeypatch):
+    # Bytecode is written and reused, as in an installed package
+    monkeypatch.delenv("PYTHONDONTWRITEBYTECODE", raising=False)
+    measure("glpi_cli.cli")
+
+    samples = []
+    imported = set()
+    for _ in range(3):
+        micros, modules = measure("glpi_cli.cli")
+        samples.append(micros / 1000)
+        imported |= modules
+
+    assert [name for name in LAZY_MODULES if name in imported] == []
+    assert min(samples) < BUDGET_MS
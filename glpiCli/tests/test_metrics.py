@@ -0,0 +1,120 @@
+"""Tests for request metrics (glpi --trace)."""
+import json
+
+import pytest
+
+from glpi_cli import client as client_module
+from glpi_cli.client import GLPIClient
+from glpi_cli.errors import GLPIError
+from glpi_cli.metrics import MetricsRegistry, endpoint_of, percentile
+
+
+@pytest.mark.parametrize("pct, expected", [(0, 1), (1, 1), (50, 5), (90, 9), (95, 10), (100, 10)])
+def test_percentile_is_nearest_rank(pct, expected):
+    assert percentile([7, 3, 10, 1, 5, 9, 2, 8, 4, 6], pct) == expected
+
+
+def test_percentile_of_one_value():
+    assert percentile([0.25], 50) == percentile([0.25], 95) == 0.25
+
+
+@pytest.mark.parametrize(
+    "method, path, expected",
+    [
+        ("GET", "/Ticket/42", "GET Ticket/:id"),
+        ("GET", "Ticket/42/Item_Ticket/", "GET Ticket/:id/Item_Ticket"),
+        ("PUT", "Ticket", "PUT Ticket"),
+        ("GET", "PluginFieldsProblemfingerprint", "GET PluginFieldsProblemfingerprint"),
+    ],
+)
+def test_endpoint_of_collapses_ids(method, path, expected):
+    assert endpoint_of(method, path) == expected
+
+
+def test_summary_aggregates_events_per_endpoint():
+    registry = MetricsRegistry()
+    for elapsed, attempt, status in [(0.1, 0, 200), (0.3, 0, 404), (0.2, 1, None)]:
+        registry(
+            {
+                "event": "request",
+                "endpoint": "GET Ticket/:id",
+                "attempt": attempt,
+                "elapsed": elapsed,
+                "status": status,
+                "bytes": 1024,
+            }
+        )
+    registry({"event": "decode", "endpoint": "GET Ticket/:id", "elapsed": 0.002})
+    registry(
+        {
+            "event": "request",
+            "endpoint": "GET Ticket",
+            "attempt": 0,
+            "elapsed": 1.0,
+            "status": 200,
+            "bytes": 0,
+        }
+    )
+
+    slowest, tickets = registry.summary()
+
+    assert slowest["endpoint"] == "GET Ticket"
+    assert tickets["endpoint"] == "GET Ticket/:id"
+    assert tickets["requests"] == 3
+    assert tickets["retries"] == 1
+    assert tickets["errors"] == 2
+    assert tickets["bytes"] == 3072
+    assert tickets["p50_ms"] == pytest.approx(200)
+    assert tickets["max_ms"] == pytest.approx(300)
+    assert tickets["decode_ms"] == pytest.approx(2)
+    assert registry.format_summary().splitlines()[0].split()[:3] == ["ENDPOINT", "REQS", "RETRY"]
+
+
+@pytest.fixture
+def client(config):
+    client = GLPIClient(config)
+    client.init_session()
+    yield client
+    client.close()
+
+
+def test_client_hooks_report_requests_and_decodes(client, tmp_path):
+    trace_path = tmp_path / "trace.jsonl"
+    with open(trace_path, "w") as trace_file:
+        registry = MetricsRegistry(trace_file)
+        client.hooks.append(registry)
+        client.get_item("Ticket", 1)
+        client.get_item("Ticket", 2)
+        with pytest.raises(GLPIError):
+            client.get_item("Ticket", 9999)
+        client.hooks.remove(registry)
+        client.get_item("Ticket", 3)
+
+    events = [json.loads(line) for line in trace_path.read_text().splitlines()]
+    assert events == registry.events
+    requests = [e for e in events if e["event"] == "request"]
+    assert [e["status"] for e in requests] == [200, 200, 404]
+    assert {e["endpoint"] for e in events} == {"GET Ticket/:id"}
+    assert all(e["elapsed"] >= e["ttfb"] >= 0 and e["bytes"] > 0 for e in requests)
+    assert sum(e["event"] == "decode" for e in events) == 2
+
+    (row,) = registry.summary()
+    assert (row["requests"], row["errors"], row["retries"]) == (3, 1, 0)
+
+
+def test_client_hooks_count_retries(client, fake_glpi, monkeypatch):
+    server, _ = fake_glpi
+    monkeypatch.setattr(client_module, "backoff_delay", lambda attempt: 0)
+    registry = MetricsRegistry()
+    client.hooks.append(registry)
+    server.error_rate = 1.0
+
+    with pytest.raises(GLPIError):
+        client.get_item("Ticket", 1)
+
+    attempts = [e["attempt"] for e in registry.events]
+    assert attempts == [*range(client.max_retries + 1)]
+    assert {e["status"] for e in registry.events} == {503}
+    (row,) = registry.summary()
+    assert row["retries"] == client.max_retries
+    assert row["errors"] == client.max_retries + 1
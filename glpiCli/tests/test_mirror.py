@@ -0,0 +1,28 @@
+"""Tests for the local SQLite mirror."""
+from glpi_cli.client import GLPIClient
+from glpi_cli.mirror import Mirror
+
+
+def test_status_filter_uses_itil_number_and_asset_state_name(tmp_path):
+    store = Mirror(tmp_path / "mirror.sqlite")
+    store._upsert("Ticket", [{"id": 1, "status": 2}, {"id": 2, "status": 5}])
+    store._upsert("Computer", [{"id": 1, "states_id": "Em uso"}, {"id": 2, "states_id": 0}])
+
+    assert [t["id"] for t in store.query("Ticket", status="2")] == [1]
+    assert [c["id"] for c in store.query("Computer", status="Em uso")] == [1]
+    store.close()
+
+
+def test_sync_then_query(config):
+    client = GLPIClient(config)
+    client.init_session()
+    store = Mirror()
+    try:
+        count, full = store.sync(client, "Ticket", page_size=60)
+        ids = [t["id"] for t in store.query("Ticket", status="2")]
+    finally:
+        store.close()
+        client.close()
+
+    assert (count, full) == (250, True)
+    assert ids == [i for i in range(1, 251) if i % 6 + 1 == 2]
@@ -0,0 +1,113 @@
+"""Tests for search criteria building and paginated search."""
+import pytest
+
+from glpi_cli.client import GLPIClient
+from glpi_cli.errors import GLPIError
+from glpi_cli.search import build_search_params, criterion, meta_criterion, parse_criterion
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("12:equals:2", criterion(12, "2", "equals")),
+        ("OR:1:contains:srv", criterion(1, "srv", link="OR")),
+        ("and_not:12:equals:6", criterion(12, "6", "equals", link="AND NOT")),
+        ("1:contains:http://a:8080", criterion(1, "http://a:8080")),
+    ],
+)
+def test_parse_criterion(text, expected):
+    assert parse_criterion(text) == expected
+
+
+@pytest.mark.parametrize("text", ["12:equals", "name:contains:srv", "OR:12:equals", ""])
+def test_parse_criterion_rejects_malformed_text(text):
+    with pytest.raises(GLPIError, match="Critério inválido"):
+        parse_criterion(text)
+
+
+def test_build_search_params_flattens_groups_and_metacriteria():
+    params = build_search_params(
+        [
+            criterion(12, 2, "equals"),
+            {
+                "link": "AND NOT",
+                "criteria": [criterion(1, "a"), criterion(1, "b", link="OR")],
+            },
+        ],
+        forcedisplay=[19],
+        metacriteria=[meta_criterion("Computer", 1, "srv")],
+    )
+
+    assert params == {
+        "criteria[0][field]": 12,
+        "criteria[0][searchtype]": "equals",
+        "criteria[0][value]": 2,
+        "criteria[1][link]": "AND NOT",
+        "criteria[1][criteria][0][field]": 1,
+        "criteria[1][criteria][0][searchtype]": "contains",
+        "criteria[1][criteria][0][value]": "a",
+        "criteria[1][criteria][1][link]": "OR",
+        "criteria[1][criteria][1][field]": 1,
+        "criteria[1][criteria][1][searchtype]": "contains",
+        "criteria[1][criteria][1][value]": "b",
+        "metacriteria[0][itemtype]": "Computer",
+        "metacriteria[0][field]": 1,
+        "metacriteria[0][searchtype]": "contains",
+        "metacriteria[0][value]": "srv",
+        "forcedisplay[0]": 19,
+    }
+
+
+def test_build_search_params_keeps_a_non_default_first_link():
+    params = build_search_params([criterion(1, "a", link="AND NOT")], forcedisplay=[])
+
+    assert params["criteria[0][link]"] == "AND NOT"
+    assert not any(key.startswith("forcedisplay") for key in params)
+
+
+def test_build_search_params_rejects_unknown_link():
+    with pytest.raises(GLPIError, match="Operador inválido"):
+        build_search_params([criterion(1, "a"), criterion(1, "b", link="XOR")])
+
+
+@pytest.fixture
+def client(config):
+    client = GLPIClient(config)
+    client.init_session()
+    yield client
+    client.close()
+
+
+@pytest.mark.parametrize("concurrency", [1, 3])
+def test_iter_search_pages_through_every_match_in_order(client, fake_glpi, concurrency):
+    server, _ = fake_glpi
+
+    rows = client.iter_search(
+        "Ticket", [criterion(12, "2", "equals")], page_size=10, concurrency=concurrency
+    )
+
+    # status = id % 6 + 1
+    assert [row["2"] for row in rows] == [i for i in range(1, 251) if i % 6 + 1 == 2]
+    assert server.counters["search"] == 5
+
+
+def test_search_with_groups_matches_left_to_right(client):
+    criteria = [
+        {"criteria": [criterion(1, "0001"), criterion(2, "250", "equals", link="OR")]},
+        criterion(12, "1", "equals", link="AND NOT"),
+    ]
+
+    rows = [*client.iter_search("Ticket", criteria, page_size=50)]
+
+    expected = [
+        i for i in range(1, 251) if ("0001" in f"ticket-{i:05d}" or i == 250) and i % 6 + 1 != 1
+    ]
+    assert sorted(row["2"] for row in rows) == expected
+
+
+def test_search_items_returns_one_range_window(client):
+    rows = client.search_items(
+        "Ticket", [criterion(12, "2", "equals")], range_start=10, range_limit=5
+    )
+
+    assert [row["2"] for row in rows] == [61, 67, 73, 79, 85]
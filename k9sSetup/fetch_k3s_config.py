@@ -35,13 +35,17 @@
 # Import local modules
 from src.inventory import load_inventories, extract_hosts_from_inventory, update_inventory_repo
 from src.network import is_private_network, check_vpn_requirement, check_network_requirement
-from src.ssh import load_ssh_config, make_ssh_client, get_internal_ip, fetch_remote_file_cached
+from src.ssh import (
+    load_ssh_config, make_ssh_client, get_internal_ip, fetch_remote_file_cached,
+    fetch_remote_file_probed
+)
 from src.kubeconfig import update_kubeconfig_server, merge_kubeconfig
 from src.tunnel import (
-    get_unique_port, get_tunnel_pid_file, is_tunnel_running,
+    get_unique_port, get_tunnel_pid_file, get_tunnel_lock_file, is_tunnel_running,
     kill_tunnel, kill_all_tunnels, create_tunnel, save_tunnel_pid
 )
 from src.cli import select_company, select_host, custom_style
+from src.locking import file_lock
 from src.logging_config import setup_logging, get_logger
 
 # Load environment variables from .env file
@@ -69,6 +73,8 @@
 
 TUNNEL_STATE_DIR = Path.home() / ".local" / "state" / "k9s-tunnels"
 CACHE_DIR = Path.home() / ".cache" / "k9s-config"
+# Serializes ~/.kube/config read-modify-write between parallel connections
+KUBECONFIG_LOCK_FILE = TUNNEL_STATE_DIR / "kubeconfig.lock"
 
 
 def fetch_and_merge_kubeconfig(
@@ -124,18 +130,21 @@ def fetch_and_merge_kubeconfig(
         ssh_client = make_ssh_client(hostname, username, keyfile, port, proxycmd)
 
     try:
-        # Get internal IP
-        internal_ip = get_internal_ip(ssh_client)
-        logger.debug(f"Detected internal IP for {host_alias}")
-
         # Define context name and cache path
         context_name = f"{company}-{host_alias}"
         cache_path = CACHE_DIR / f"{context_name}.yml"
 
-        # Fetch kubeconfig with caching
-        content, was_cached = fetch_remote_file_cached(
-            ssh_client, remote_path, cache_path
-        )
+        # Internal IP and kubeconfig (with caching) in a single round trip
+        probed = fetch_remote_file_probed(ssh_client, remote_path, cache_path)
+        if probed:
+            internal_ip, content, was_cached = probed
+        else:
+            # Remote shell couldn't run the probe: separate commands + SFTP
+            internal_ip = get_internal_ip(ssh_client)
+            content, was_cached = fetch_remote_file_cached(
+                ssh_client, remote_path, cache_path
+            )
+        logger.debug(f"Detected internal IP for {host_alias}")
 
         # Generate unique port
         local_port = get_unique_port(context_name, port_range_start, port_range_size)
@@ -147,7 +156,8 @@ def fetch_and_merge_kubeconfig(
         )
 
         # Merge into ~/.kube/config
-        merge_kubeconfig(new_content, context_name)
+        with file_lock(KUBECONFIG_LOCK_FILE):
+            merge_kubeconfig(new_content, context_name)
 
         return context_name, local_port, internal_ip, new_content, was_cached
     finally:
@@ -289,20 +299,23 @@ def main():
 
                 # Setup SSH tunnel
                 print(f"\nSetting up SSH tunnel...")
-                if is_tunnel_running(context_name):
-                    print(f"✓ Tunnel already running for {context_name}")
-                else:
-                    # Use hostname (from inventory) instead of alias (from ssh config)
-                    ssh_target = f"{username}@{hostname}"
-                    print(f"Creating tunnel: {ssh_target} -> localhost:{local_port} -> {internal_ip}:6443")
-                    try:
-                        pid = create_tunnel(ssh_target, internal_ip, local_port, TARGET_PORT)
-                        save_tunnel_pid(context_name, pid)
-                        print(f"✓ SSH tunnel created (PID: {pid})")
-                    except Exception as e:
-                        print(f"⚠️  Failed to create tunnel: {e}")
-                        print(f"   You'll need to create it manually:")
-                        print(f"   ssh -f -N -L {local_port}:{internal_ip}:{TARGET_PORT} {ssh_target}")
+                # Same per-context lock as multi_connect.py, so two runs can't
+                # both find no tunnel and open one each on the same port
+                with file_lock(get_tunnel_lock_file(context_name)):
+                    if is_tunnel_running(context_name):
+                        print(f"✓ Tunnel already running for {context_name}")
+                    else:
+                        # Use hostname (from inventory) instead of alias (from ssh config)
+                        ssh_target = f"{username}@{hostname}"
+                        print(f"Creating tunnel: {ssh_target} -> localhost:{local_port} -> {internal_ip}:6443")
+                        try:
+                            pid = create_tunnel(ssh_target, internal_ip, local_port, TARGET_PORT)
+                            save_tunnel_pid(context_name, pid)
+                            print(f"✓ SSH tunnel created (PID: {pid})")
+                        except Exception as e:
+                            print(f"⚠️  Failed to create tunnel: {e}")
+                            print(f"   You'll need to create it manually:")
+                            print(f"   ssh -f -N -L {local_port}:{internal_ip}:{TARGET_PORT} {ssh_target}")
 
                 print(f"\nYou can now use kubectl/k9s directly!")
                 print(f"  kubectl get nodes")
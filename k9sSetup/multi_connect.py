@@ -11,13 +11,16 @@
 1. Lists all available clusters from inventory
 2. Allows multi-select via checkbox interface
 3. Validates network requirements (VPN/sshuttle)
-4. Connects to each cluster sequentially
+4. Connects to the clusters in parallel (max_parallel_connections at a time)
 5. Sets first cluster as active context
 """
 
 import os
 import sys
 import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import List, Dict, Any, Tuple, Optional
 import questionary
@@ -30,8 +33,9 @@
 from src.ssh import load_ssh_config
 from src.tunnel import (
     is_tunnel_running, create_tunnel, save_tunnel_pid,
-    save_network_metadata, TUNNEL_STATE_DIR
+    save_network_metadata, get_tunnel_lock_file, TUNNEL_STATE_DIR
 )
+from src.locking import file_lock
 from src.logging_config import setup_logging, get_logger
 from fetch_k3s_config import fetch_and_merge_kubeconfig
 
@@ -49,6 +53,7 @@
 TARGET_PORT = int(get_config_value(config, 'k3s_api_port', 6443))
 PORT_RANGE_START = int(get_config_value(config, 'port_range_start', 16443))
 PORT_RANGE_SIZE = int(get_config_value(config, 'port_range_size', 10000))
+MAX_PARALLEL_CONNECTIONS = int(get_config_value(config, 'max_parallel_connections', 4))
 SSH_CONFIG_PATH = os.path.expanduser("~/.ssh/config")
 
 inventory_from_config = get_config_value(config, 'inventory_path', None)
@@ -210,6 +215,22 @@ def show_network_warnings(selected_clusters: List[Dict[str, Any]]) -> bool:
         return False
 
 
+# Keeps progress lines of parallel connections from interleaving mid-line
+_print_lock = threading.Lock()
+
+
+def progress(context_name: str, message: str) -> None:
+    """
+    Print a progress line for one cluster, prefixed with its context name.
+
+    Args:
+        context_name: Context being connected
+        message: Progress message
+    """
+    with _print_lock:
+        print(f"   [{context_name}] {message}", flush=True)
+
+
 def connect_cluster(cluster: Dict[str, Any], logger) -> Dict[str, Any]:
     """
     Connect to a single cluster.
@@ -226,7 +247,8 @@ def connect_cluster(cluster: Dict[str, Any], logger) -> Dict[str, Any]:
                 'local_port': int,
                 'internal_ip': str,
                 'tunnel_pid': int,
-                'error': str|None
+                'error': str|None,
+                'elapsed': float (seconds)
             }
     """
     company = cluster['company']
@@ -241,8 +263,10 @@ def connect_cluster(cluster: Dict[str, Any], logger) -> Dict[str, Any]:
         'internal_ip': None,
         'tunnel_pid': None,
         'error': None,
+        'elapsed': 0.0,
         'cluster': cluster
     }
+    started = time.monotonic()
 
     try:
         # Load SSH config
@@ -250,7 +274,7 @@ def connect_cluster(cluster: Dict[str, Any], logger) -> Dict[str, Any]:
 
         # Fetch and merge kubeconfig
         logger.info(f"Connecting to {context_name}...")
-        print(f"\n📡 Connecting to {context_name}...")
+        progress(context_name, "📡 Connecting...")
 
         context_name, local_port, internal_ip, new_content, was_cached = fetch_and_merge_kubeconfig(
             company=company,
@@ -267,24 +291,26 @@ def connect_cluster(cluster: Dict[str, Any], logger) -> Dict[str, Any]:
         result['internal_ip'] = internal_ip
 
         if was_cached:
-            print(f"   ✓ Using cached kubeconfig")
+            progress(context_name, "✓ Using cached kubeconfig")
         else:
-            print(f"   ✓ Fetched kubeconfig from remote")
-
-        # Setup tunnel
-        if is_tunnel_running(context_name):
-            print(f"   ✓ Tunnel already running")
-            # Get existing PID
-            pid_file = TUNNEL_STATE_DIR / f"{context_name}.pid"
-            if pid_file.exists():
-                with open(pid_file) as f:
-                    result['tunnel_pid'] = int(f.read().strip())
-        else:
-            print(f"   Creating tunnel: localhost:{local_port} → {internal_ip}:6443")
-            pid = create_tunnel(host_alias, internal_ip, local_port, TARGET_PORT)
-            save_tunnel_pid(context_name, pid)
-            result['tunnel_pid'] = pid
-            print(f"   ✓ Tunnel created (PID: {pid})")
+            progress(context_name, "✓ Fetched kubeconfig from remote")
+
+        # Setup tunnel; the lock keeps another connection to the same context
+        # (this run or another process) from spawning a second tunnel
+        with file_lock(get_tunnel_lock_file(context_name)):
+            if is_tunnel_running(context_name):
+                progress(context_name, "✓ Tunnel already running")
+                # Get existing PID
+                pid_file = TUNNEL_STATE_DIR / f"{context_name}.pid"
+                if pid_file.exists():
+                    with open(pid_file) as f:
+                        result['tunnel_pid'] = int(f.read().strip())
+            else:
+                progress(context_name, f"Creating tunnel: localhost:{local_port} → {internal_ip}:6443")
+                pid = create_tunnel(host_alias, internal_ip, local_port, TARGET_PORT)
+                save_tunnel_pid(context_name, pid)
+                result['tunnel_pid'] = pid
+                progress(context_name, f"✓ Tunnel created (PID: {pid})")
 
         # Save network metadata
         if cluster['network_type'] or cluster['needs_vpn']:
@@ -301,18 +327,60 @@ def connect_cluster(cluster: Dict[str, Any], logger) -> Dict[str, Any]:
                 internal_ip=internal_ip
             )
 
-        print(f"   ✓ Context '{context_name}' configured")
+        progress(context_name, f"✓ Context '{context_name}' configured")
         result['success'] = True
 
     except Exception as e:
         error_msg = str(e)
         logger.error(f"Failed to connect to {context_name}: {error_msg}")
-        print(f"   ✗ Failed: {error_msg}")
+        progress(context_name, f"✗ Failed: {error_msg}")
         result['error'] = error_msg
 
+    result['elapsed'] = time.monotonic() - started
     return result
 
 
+def connect_clusters(
+    clusters: List[Dict[str, Any]],
+    logger,
+    max_workers: int = MAX_PARALLEL_CONNECTIONS
+) -> List[Dict[str, Any]]:
+    """
+    Connect to several clusters in parallel on a bounded thread pool.
+
+    Each connection spends most of its time waiting on SSH round trips, so
+    threads overlap them. Prints one line per finished cluster.
+
+    Args:
+        clusters: Cluster info dicts to connect
+        logger: Logger instance
+        max_workers: Maximum simultaneous connections (1 = sequential)
+
+    Returns:
+        list: connect_cluster() results, in the same order as clusters
+    """
+    results: List[Optional[Dict[str, Any]]] = [None] * len(clusters)
+    workers = max(1, min(max_workers, len(clusters)))
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(connect_cluster, cluster, logger): i
+            for i, cluster in enumerate(clusters)
+        }
+        for done, future in enumerate(as_completed(futures), 1):
+            result = future.result()
+            results[futures[future]] = result
+            mark = "✓" if result['success'] else "✗"
+            with _print_lock:
+                print(
+                    f"{mark} [{done}/{len(clusters)}] {result['context_name']} "
+                    f"({result['elapsed']:.1f}s)",
+                    flush=True
+                )
+
+    return [r for r in results if r is not None]
+
+
 def set_current_context(context_name: str) -> bool:
     """
     Set kubectl current context.
@@ -421,15 +489,16 @@ def main():
         print("Cancelled.")
         sys.exit(0)
 
-    # Connect to each cluster
+    # Connect to the clusters in parallel
+    workers = max(1, min(MAX_PARALLEL_CONNECTIONS, len(selected)))
     print("\n" + "="*60)
-    print("Connecting to clusters...")
+    print(f"Connecting to {len(selected)} clusters ({workers} at a time)...")
     print("="*60)
 
-    results = []
-    for cluster in selected:
-        result = connect_cluster(cluster, logger)
-        results.append(result)
+    started = time.monotonic()
+    results = connect_clusters(selected, logger, MAX_PARALLEL_CONNECTIONS)
+    wall_time = time.monotonic() - started
+    cluster_time = sum(r['elapsed'] for r in results)
 
     # Show summary
     successful = [r for r in results if r['success']]
@@ -455,6 +524,16 @@ def main():
         for r in failed:
             print(f"  ✗ {r['context_name']} - {r['error']}")
 
+    speedup = cluster_time / wall_time if wall_time else 1.0
+    print(
+        f"\n⏱ Total: {wall_time:.1f}s wall time, {cluster_time:.1f}s sum of "
+        f"per-cluster times ({speedup:.1f}x)"
+    )
+    logger.info(
+        f"Connected {len(successful)}/{len(results)} clusters in {wall_time:.1f}s "
+        f"(sum of per-cluster times: {cluster_time:.1f}s)"
+    )
+
     if not successful:
         print("\nNo clusters connected successfully.")
         sys.exit(1)
@@ -2,7 +2,7 @@
 
 Supports loading config from YAML files and merging with environment variables.
 Environment variables take precedence over file values.
-Numeric values (ports, ranges) are normalized to int type.
+Numeric values (ports, ranges, parallelism) are normalized to int type.
 """
 
 import os
@@ -36,7 +36,8 @@ def load_config(config_path: str) -> Dict[str, Any]:
             with open(config_file) as f:
                 file_config = yaml.safe_load(f) or {}
                 # Normalize numeric fields from YAML to int type
-                for key in ['k3s_api_port', 'port_range_start', 'port_range_size']:
+                for key in ['k3s_api_port', 'port_range_start', 'port_range_size',
+                            'max_parallel_connections']:
                     if key in file_config:
                         try:
                             file_config[key] = int(file_config[key])
@@ -53,6 +54,7 @@ def load_config(config_path: str) -> Dict[str, Any]:
         'k3s_api_port': 'K3S_API_PORT',
         'port_range_start': 'PORT_RANGE_START',
         'port_range_size': 'PORT_RANGE_SIZE',
+        'max_parallel_connections': 'MAX_PARALLEL_CONNECTIONS',
     }
 
     for config_key, env_var in env_var_mapping.items():
@@ -0,0 +1,62 @@
+"""
+File locks for k9s-config state shared between threads and processes.
+
+multi_connect.py connects clusters in parallel, and fetch_k3s_config.py or
+another multi_connect.py may run at the same time, so writes to
+~/.kube/config and to the tunnel state directory are serialized with
+flock(2) locks on dedicated lock files.
+"""
+
+import fcntl
+import os
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Union
+
+
+@contextmanager
+def file_lock(lock_path: Union[str, Path]) -> Iterator[None]:
+    """
+    Hold an exclusive lock on a lock file for the duration of a with block.
+
+    Blocks until the lock is free. Each call opens the file again, so the lock
+    also excludes other threads of the same process. The lock file is kept
+    (removing it would race with processes waiting on it).
+
+    Args:
+        lock_path: Lock file path (created with its parent directory if missing)
+
+    Example:
+        with file_lock(Path.home() / ".local/state/k9s-tunnels/kubeconfig.lock"):
+            merge_kubeconfig(content, context_name)
+    """
+    lock_path = Path(lock_path)
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+
+    fd = os.open(lock_path, os.O_RDWR | os.O_CREAT, 0o600)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+    finally:
+        os.close(fd)
+
+
+def write_file_atomic(path: Union[str, Path], content: str) -> None:
+    """
+    Replace a file's content so readers never see it empty or partial.
+
+    Writes a temporary file in the same directory and renames it over path.
+
+    Args:
+        path: File to write
+        content: New content
+    """
+    path = Path(path)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    with open(tmp_path, 'w') as f:
+        f.write(content)
+    os.replace(tmp_path, path)
@@ -6,6 +6,8 @@
 """
 
 import os
+import re
+import shlex
 import time
 import hashlib
 from pathlib import Path
@@ -17,6 +19,13 @@
 
 logger = get_logger()
 
+# Internal IPv4 detection, tried in order until one prints a usable address
+INTERNAL_IP_COMMANDS = [
+    "ip -4 addr show scope global | awk '/inet /{print $2}' | cut -d/ -f1 | head -n1",
+    "hostname -I | awk '{print $1}'",
+    "ip route get 1.1.1.1 | awk '{for(i=1;i<=NF;i++) if($i==\"src\") print $(i+1)}' | head -n1",
+]
+
 
 def load_ssh_config(alias: str, ssh_config_path: Optional[str] = None) -> Dict[str, Any]:
     """
@@ -166,26 +175,37 @@ def get_internal_ip(ssh: SSHClient) -> str:
         RuntimeError: If no valid internal IP is found
     """
     # Try a sequence of commands; return first non-loopback IPv4 found
-    cmds = [
-        "ip -4 addr show scope global | awk '/inet /{print $2}' | cut -d/ -f1 | head -n1",
-        "hostname -I | awk '{print $1}'",
-        "ip route get 1.1.1.1 | awk '{for(i=1;i<=NF;i++) if($i==\"src\") print $(i+1)}' | head -n1",
-    ]
-
-    for cmd in cmds:
+    for cmd in INTERNAL_IP_COMMANDS:
         stdin, stdout, stderr = ssh.exec_command(cmd)
-        out = stdout.read().decode().strip()
-        if out:
-            # if command returned multiple IPs, take first token
-            ip = out.split()[0]
-            if ip and not ip.startswith("127.") and "." in ip:
-                return str(ip)
+        ip = _parse_ipv4(stdout.read().decode())
+        if ip:
+            return ip
 
     raise RuntimeError(
         "Could not detect internal IPv4 on remote host using tried commands."
     )
 
 
+def _parse_ipv4(output: str) -> Optional[str]:
+    """
+    Get the first token of a command output if it is a non-loopback IPv4.
+
+    Args:
+        output: Output of one of INTERNAL_IP_COMMANDS
+
+    Returns:
+        str|None: IPv4 address, or None if unusable
+    """
+    out = output.strip()
+    if not out:
+        return None
+    # if command returned multiple IPs, take first token
+    ip = out.split()[0]
+    if ip and not ip.startswith("127.") and "." in ip:
+        return str(ip)
+    return None
+
+
 def fetch_remote_file(ssh: SSHClient, path: str, max_retries: int = 2) -> str:
     """
     Fetch file contents from remote host via SFTP with retry logic.
@@ -339,3 +359,181 @@ def fetch_remote_file_cached(
     logger.debug(f"Updated cache: {cache_path}")
 
     return content, False
+
+
+# Separates the key=value header of probe_remote output from the file content
+PROBE_CONTENT_MARKER = "@@k9s-probe-content@@"
+
+
+def _probe_script(path: str, known_hash: Optional[str], fetch_content: bool) -> str:
+    """
+    Build the shell script run by probe_remote.
+
+    Args:
+        path: Remote file path
+        known_hash: SHA256 the caller already has (content is skipped if equal)
+        fetch_content: Print the content after PROBE_CONTENT_MARKER
+
+    Returns:
+        str: POSIX sh script printing key=value lines, then optionally the content
+    """
+    # "-" never equals a computed hash, so content is sent when nothing is known
+    known = known_hash if known_hash and re.fullmatch(r"[0-9a-f]{64}", known_hash) else "-"
+    lines = ["echo probe=1", f"f={shlex.quote(path)}"]
+    for i, cmd in enumerate(INTERNAL_IP_COMMANDS):
+        lines.append(f'echo "ip{i}=$( ({cmd}) 2>/dev/null)"')
+    lines += [
+        'if [ -r "$f" ]; then echo readable=1; fi',
+        "h=$( (sha256sum \"$f\" || shasum -a 256 \"$f\") 2>/dev/null | awk '{print $1}')",
+        'echo "hash=$h"',
+        "echo \"stat=$( (stat -c '%s %Y' \"$f\" || stat -f '%z %m' \"$f\") 2>/dev/null)\"",
+    ]
+    if fetch_content:
+        lines += [
+            f'if [ -r "$f" ] && [ "$h" != "{known}" ]; then',
+            f"  echo {PROBE_CONTENT_MARKER}",
+            '  cat "$f"',
+            "fi",
+        ]
+    return "\n".join(lines)
+
+
+def probe_remote(
+    ssh: SSHClient,
+    path: str,
+    known_hash: Optional[str] = None,
+    fetch_content: bool = True
+) -> Optional[Dict[str, Any]]:
+    """
+    Get internal IP and file hash, size, mtime and content in one round trip.
+
+    Replaces get_internal_ip() (up to 3 exec_command calls),
+    get_remote_file_hash() (up to 2) and fetch_remote_file() (an SFTP
+    session) with a single exec_command, which matters on slow jump hosts.
+    The content is only sent when its hash differs from known_hash.
+
+    Args:
+        ssh: Connected SSHClient instance
+        path: Remote file path
+        known_hash: SHA256 of the local copy, if any
+        fetch_content: Send the file content when the hashes differ
+
+    Returns:
+        dict|None: Probe result, or None if the remote shell didn't run the
+        probe (caller should fall back to the separate calls)
+            {
+                'internal_ip': str|None,
+                'readable': bool,
+                'hash': str|None,
+                'size': int|None,
+                'mtime': int|None,
+                'content': str|None  (None when not sent or incomplete),
+                'complete': bool  (False when the content sent doesn't
+                                   match hash and size)
+            }
+    """
+    script = _probe_script(path, known_hash, fetch_content)
+    stdin, stdout, stderr = ssh.exec_command(f"sh -c {shlex.quote(script)}")
+    raw = stdout.read()
+    exit_status = stdout.channel.recv_exit_status()
+
+    head, marker, body = raw.partition(f"\n{PROBE_CONTENT_MARKER}\n".encode())
+    fields: Dict[str, str] = {}
+    for line in head.decode(errors="replace").splitlines():
+        key, _, value = line.partition("=")
+        fields.setdefault(key, value.strip())
+
+    if fields.get("probe") != "1":
+        logger.debug("Remote probe produced no header; remote shell may not be POSIX")
+        return None
+
+    internal_ip = None
+    for i in range(len(INTERNAL_IP_COMMANDS)):
+        internal_ip = _parse_ipv4(fields.get(f"ip{i}", ""))
+        if internal_ip:
+            break
+
+    file_hash = fields.get("hash", "")
+    size, _, mtime = fields.get("stat", "").partition(" ")
+
+    # A dropped channel or a failed cat leaves a partial body after the marker
+    complete = not marker or (
+        exit_status == 0
+        and len(file_hash) == 64
+        and hashlib.sha256(body).hexdigest() == file_hash
+        and size.isdigit()
+        and len(body) == int(size)
+    )
+    if not complete:
+        logger.warning(
+            f"Remote probe content of {path} doesn't match its hash/size "
+            f"(exit status {exit_status}, {len(body)} bytes received)"
+        )
+
+    return {
+        'internal_ip': internal_ip,
+        'readable': fields.get("readable") == "1",
+        'hash': file_hash if len(file_hash) == 64 else None,
+        'size': int(size) if size.isdigit() else None,
+        'mtime': int(mtime) if mtime.isdigit() else None,
+        'content': body.decode() if marker and complete else None,
+        'complete': complete,
+    }
+
+
+def fetch_remote_file_probed(
+    ssh: SSHClient,
+    remote_path: str,
+    cache_path: Path
+) -> Optional[tuple[str, str, bool]]:
+    """
+    Detect internal IP and fetch a file with hash-based caching, in one round trip.
+
+    Same result as get_internal_ip() plus fetch_remote_file_cached(), using
+    probe_remote().
+
+    Args:
+        ssh: Connected SSHClient instance
+        remote_path: Remote file path to read
+        cache_path: Local cache file path
+
+    Returns:
+        tuple|None: (internal_ip, file_contents, was_cached), or None if the
+        probe couldn't run (use get_internal_ip/fetch_remote_file_cached)
+
+    Raises:
+        RuntimeError: If no internal IP is found or the file isn't readable
+    """
+    local_hash = get_local_file_hash(cache_path)
+    probe = probe_remote(ssh, remote_path, known_hash=local_hash)
+    if probe is None:
+        return None
+
+    if not probe['internal_ip']:
+        raise RuntimeError(
+            "Could not detect internal IPv4 on remote host using tried commands."
+        )
+    if not probe['readable']:
+        raise RuntimeError(f"Remote file not readable: {remote_path}")
+
+    if not probe['complete']:
+        # Never cache a partial kubeconfig; re-read it over SFTP with retries
+        content, was_cached = fetch_remote_file_cached(ssh, remote_path, cache_path)
+        return probe['internal_ip'], content, was_cached
+
+    if probe['content'] is None:
+        logger.info(f"Cache hit! Using cached kubeconfig (hash: {probe['hash'][:16]}...)")
+        with open(cache_path, 'r') as f:
+            return probe['internal_ip'], f.read(), True
+
+    remote_hash = probe['hash'] or "unknown"
+    logger.info(f"Cache miss. Downloaded kubeconfig (remote hash: {remote_hash[:16]}...)")
+    content = probe['content']
+
+    # Update cache
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(cache_path, 'w') as f:
+        f.write(content)
+    logger.debug(f"Updated cache: {cache_path}")
+
+    return probe['internal_ip'], content, False
@@ -11,6 +11,7 @@
 import time
 from pathlib import Path
 from typing import Optional
+from .locking import write_file_atomic
 from .logging_config import get_logger
 
 logger = get_logger()
@@ -69,6 +70,24 @@ def get_tunnel_pid_file(context_name: str, state_dir: Optional[Path] = None) ->
     return state_dir / f"{context_name}.pid"
 
 
+def get_tunnel_lock_file(context_name: str, state_dir: Optional[Path] = None) -> Path:
+    """
+    Get the lock file path guarding a tunnel's check-create-save sequence.
+
+    Args:
+        context_name: Kubernetes context name
+        state_dir: Custom state directory (default: TUNNEL_STATE_DIR)
+
+    Returns:
+        Path: Path to lock file (use with src.locking.file_lock)
+    """
+    if state_dir is None:
+        state_dir = TUNNEL_STATE_DIR
+
+    state_dir.mkdir(parents=True, exist_ok=True)
+    return state_dir / f"{context_name}.lock"
+
+
 def is_tunnel_running(context_name: str, state_dir: Optional[Path] = None) -> bool:
     """
     Check if tunnel for this context is already running.
@@ -186,6 +205,9 @@ def save_tunnel_pid(context_name: str, pid: Optional[int], state_dir: Optional[P
     """
     Save tunnel PID to file.
 
+    The file is replaced atomically: is_tunnel_running() treats an empty or
+    partial PID file as stale and removes it.
+
     Args:
         context_name: Kubernetes context name
         pid: Process ID of tunnel
@@ -193,8 +215,7 @@ def save_tunnel_pid(context_name: str, pid: Optional[int], state_dir: Optional[P
     """
     if pid:
         pid_file = get_tunnel_pid_file(context_name, state_dir)
-        with open(pid_file, 'w') as f:
-            f.write(str(pid))
+        write_file_atomic(pid_file, str(pid))
 
 
 def get_network_metadata_file(context_name: str, state_dir: Optional[Path] = None) -> Path:
@@ -255,8 +276,7 @@ def save_network_metadata(
 
     try:
         import yaml
-        with open(network_file, 'w') as f:
-            yaml.safe_dump(metadata, f, default_flow_style=False)
+        write_file_atomic(network_file, yaml.safe_dump(metadata, default_flow_style=False))
         logger.debug(f"Saved network metadata for {context_name}")
     except Exception as e:
         logger.warning(f"Failed to save network metadata for {context_name}: {e}")
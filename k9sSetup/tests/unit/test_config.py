@@ -118,6 +118,21 @@ def test_converts_numeric_strings_in_yaml(self):
         finally:
             Path(config_path).unlink()
 
+    def test_max_parallel_connections_from_env(self):
+        """Reads MAX_PARALLEL_CONNECTIONS env var as int."""
+        import os
+        original = os.environ.get('MAX_PARALLEL_CONNECTIONS')
+
+        try:
+            os.environ['MAX_PARALLEL_CONNECTIONS'] = '8'
+            config = load_config('/nonexistent')
+            assert config.get('max_parallel_connections') == 8
+        finally:
+            if original:
+                os.environ['MAX_PARALLEL_CONNECTIONS'] = original
+            elif 'MAX_PARALLEL_CONNECTIONS' in os.environ:
+                del os.environ['MAX_PARALLEL_CONNECTIONS']
+
     def test_handles_malformed_yaml(self):
         """Handles malformed YAML gracefully with warning."""
         with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
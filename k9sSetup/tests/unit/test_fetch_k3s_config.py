@@ -68,7 +68,8 @@ def test_closes_ssh_connection_on_error(self):
         mock_ssh = MagicMock()
 
         with patch('fetch_k3s_config.make_ssh_client', return_value=mock_ssh):
-            with patch('fetch_k3s_config.get_internal_ip', side_effect=RuntimeError("Failed")):
+            with patch('fetch_k3s_config.fetch_remote_file_probed',
+                       side_effect=RuntimeError("Failed")):
                 with pytest.raises(RuntimeError):
                     fetch_and_merge_kubeconfig(
                         company="test",
@@ -87,7 +88,8 @@ def test_uses_custom_port_range(self):
         """Uses custom port range when specified."""
         mock_ssh = MagicMock()
 
-        with patch('fetch_k3s_config.get_internal_ip', return_value="10.0.0.1"):
+        with patch('fetch_k3s_config.fetch_remote_file_probed', return_value=None), \
+                patch('fetch_k3s_config.get_internal_ip', return_value="10.0.0.1"):
             with patch('fetch_k3s_config.fetch_remote_file_cached') as mock_fetch:
                 mock_fetch.return_value = ("""
 apiVersion: v1
@@ -120,6 +122,34 @@ def test_uses_custom_port_range(self):
 
         assert 20000 <= port < 25000
 
+    def test_uses_single_probe_when_available(self):
+        """Gets IP and kubeconfig from the combined probe, skipping the separate calls."""
+        mock_ssh = MagicMock()
+        content = "apiVersion: v1\nclusters:\n- cluster:\n    server: https://10.0.0.1:6443\n"
+
+        with patch('fetch_k3s_config.fetch_remote_file_probed',
+                   return_value=("10.0.0.7", content, True)) as mock_probe, \
+                patch('fetch_k3s_config.get_internal_ip') as mock_ip, \
+                patch('fetch_k3s_config.fetch_remote_file_cached') as mock_fetch, \
+                patch('fetch_k3s_config.merge_kubeconfig'):
+            _, _, internal_ip, _, was_cached = fetch_and_merge_kubeconfig(
+                company="test",
+                host_alias="host",
+                host_info={},
+                ssh_config={},
+                remote_path="/path",
+                target_port=6443,
+                port_range_start=16443,
+                port_range_size=10000,
+                ssh_client=mock_ssh
+            )
+
+        assert internal_ip == "10.0.0.7"
+        assert was_cached is True
+        mock_probe.assert_called_once()
+        mock_ip.assert_not_called()
+        mock_fetch.assert_not_called()
+
 
 class TestMainScriptIntegration:
     """Integration tests for main script flow."""
@@ -0,0 +1,91 @@
+"""Unit tests for locking module."""
+
+import tempfile
+import threading
+import time
+from pathlib import Path
+from src.locking import file_lock, write_file_atomic
+
+
+class TestFileLock:
+    """Tests for file_lock context manager."""
+
+    def test_creates_lock_file_and_parent_dir(self):
+        """Creates missing parent directories and the lock file."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            lock_path = Path(tmpdir) / "state" / "test.lock"
+
+            with file_lock(lock_path):
+                assert lock_path.exists()
+
+            # Lock file is kept for the next holder
+            assert lock_path.exists()
+
+    def test_excludes_other_threads(self):
+        """Only one thread at a time runs the locked block."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            lock_path = Path(tmpdir) / "test.lock"
+            inside = []
+            overlaps = []
+
+            def worker():
+                with file_lock(lock_path):
+                    inside.append(1)
+                    if len(inside) > 1:
+                        overlaps.append(1)
+                    time.sleep(0.01)
+                    inside.pop()
+
+            threads = [threading.Thread(target=worker) for _ in range(8)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+            assert overlaps == []
+
+    def test_releases_lock_on_exception(self):
+        """Releases the lock when the block raises."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            lock_path = Path(tmpdir) / "test.lock"
+
+            try:
+                with file_lock(lock_path):
+                    raise RuntimeError("boom")
+            except RuntimeError:
+                pass
+
+            acquired = threading.Event()
+
+            def worker():
+                with file_lock(lock_path):
+                    acquired.set()
+
+            t = threading.Thread(target=worker)
+            t.start()
+            t.join(timeout=2)
+            assert acquired.is_set()
+
+
+class TestWriteFileAtomic:
+    """Tests for write_file_atomic function."""
+
+    def test_writes_new_file(self):
+        """Creates file with given content."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "test.pid"
+
+            write_file_atomic(path, "12345")
+
+            assert path.read_text() == "12345"
+
+    def test_replaces_existing_file_without_leftovers(self):
+        """Replaces content and leaves no temporary file behind."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "test.pid"
+            path.write_text("111")
+
+            write_file_atomic(path, "222")
+
+            assert path.read_text() == "222"
+            assert [p.name for p in Path(tmpdir).iterdir()] == ["test.pid"]
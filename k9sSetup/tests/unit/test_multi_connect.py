@@ -0,0 +1,177 @@
+"""Unit tests for parallel cluster connection in multi_connect."""
+
+import sys
+import threading
+import time
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import multi_connect
+from multi_connect import connect_clusters
+
+
+def make_cluster(name, delay=0.0, fail=False):
+    """Cluster info dict as built from the inventory, plus test behaviour."""
+    return {
+        'company': "acme",
+        'host_alias': name,
+        'host_info': {},
+        'network_type': None,
+        'network_range': None,
+        'needs_vpn': False,
+        'delay': delay,
+        'fail': fail,
+    }
+
+
+class FakeConnect:
+    """connect_cluster stand-in that sleeps, fails on demand and tracks concurrency."""
+
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+        self.started = []
+        self._lock = threading.Lock()
+
+    def __call__(self, cluster, logger):
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            self.started.append(cluster['host_alias'])
+        started = time.monotonic()
+        time.sleep(cluster['delay'])
+        with self._lock:
+            self.active -= 1
+        if cluster['fail']:
+            error = f"SSH connection to {cluster['host_alias']} failed"
+        else:
+            error = None
+        return {
+            'success': error is None,
+            'context_name': f"{cluster['company']}-{cluster['host_alias']}",
+            'local_port': None if error else 16443,
+            'internal_ip': None if error else "10.0.0.1",
+            'tunnel_pid': None if error else 4242,
+            'error': error,
+            'elapsed': time.monotonic() - started,
+            'cluster': cluster,
+        }
+
+
+def run_connect(clusters, max_workers):
+    fake = FakeConnect()
+    with patch.object(multi_connect, 'connect_cluster', side_effect=fake) as mock_connect:
+        results = connect_clusters(clusters, MagicMock(), max_workers=max_workers)
+    return results, fake, mock_connect
+
+
+class TestConnectClusters:
+    """Tests for connect_clusters function."""
+
+    def test_keeps_input_order_when_later_clusters_finish_first(self):
+        """Results follow the input order, not completion order."""
+        clusters = [
+            make_cluster("slow", delay=0.2),
+            make_cluster("medium", delay=0.1),
+            make_cluster("fast", delay=0.0),
+        ]
+
+        results, _, _ = run_connect(clusters, max_workers=3)
+
+        assert [r['context_name'] for r in results] == ["acme-slow", "acme-medium", "acme-fast"]
+        assert [r['cluster'] for r in results] == clusters
+
+    def test_runs_connections_in_parallel(self):
+        """Sleeping connections overlap up to max_workers."""
+        clusters = [make_cluster(f"h{i}", delay=0.2) for i in range(4)]
+
+        started = time.monotonic()
+        _, fake, _ = run_connect(clusters, max_workers=4)
+        elapsed = time.monotonic() - started
+
+        assert fake.peak == 4
+        assert elapsed < 0.6
+
+    def test_clamps_pool_to_max_workers(self):
+        """Never more than max_workers connections at a time."""
+        clusters = [make_cluster(f"h{i}", delay=0.05) for i in range(6)]
+
+        _, fake, _ = run_connect(clusters, max_workers=2)
+
+        assert fake.peak == 2
+
+    def test_clamps_pool_to_number_of_clusters(self):
+        """The pool is no larger than the cluster list."""
+        clusters = [make_cluster("a"), make_cluster("b")]
+
+        with patch.object(multi_connect, 'ThreadPoolExecutor',
+                          wraps=multi_connect.ThreadPoolExecutor) as pool:
+            with patch.object(multi_connect, 'connect_cluster', side_effect=FakeConnect()):
+                connect_clusters(clusters, MagicMock(), max_workers=16)
+
+        pool.assert_called_once_with(max_workers=2)
+
+    def test_non_positive_max_workers_runs_sequentially(self):
+        """max_workers below 1 still connects, one cluster at a time."""
+        clusters = [make_cluster(f"h{i}", delay=0.02) for i in range(3)]
+
+        results, fake, _ = run_connect(clusters, max_workers=0)
+
+        assert fake.peak == 1
+        assert fake.started == ["h0", "h1", "h2"]
+        assert all(r['success'] for r in results)
+
+    def test_failing_cluster_does_not_stop_the_others(self):
+        """A failed connection is reported and the rest still connect."""
+        clusters = [
+            make_cluster("ok1", delay=0.05),
+            make_cluster("broken", fail=True),
+            make_cluster("ok2", delay=0.05),
+        ]
+
+        results, _, mock_connect = run_connect(clusters, max_workers=2)
+
+        assert mock_connect.call_count == 3
+        assert [r['success'] for r in results] == [True, False, True]
+        assert results[1]['error'] == "SSH connection to broken failed"
+
+    def test_reports_elapsed_time_per_cluster(self, capsys):
+        """Each result carries its elapsed time, printed with the cluster."""
+        clusters = [make_cluster("a", delay=0.1), make_cluster("b")]
+
+        results, _, _ = run_connect(clusters, max_workers=2)
+
+        assert results[0]['elapsed'] >= 0.1
+        assert results[1]['elapsed'] < results[0]['elapsed']
+        out = capsys.readouterr().out
+        assert "✓ [1/2] acme-b" in out
+        assert "✓ [2/2] acme-a" in out
+
+    def test_empty_cluster_list(self):
+        """No clusters: no connections, no results."""
+        results, _, mock_connect = run_connect([], max_workers=4)
+
+        assert results == []
+        mock_connect.assert_not_called()
+
+
+class TestConnectClusterElapsed:
+    """connect_cluster fills in elapsed even when it fails."""
+
+    def test_failure_result_has_elapsed(self):
+        """An exception inside the connection still yields a timed result."""
+        cluster = make_cluster("broken")
+
+        def slow_failure(*args, **kwargs):
+            time.sleep(0.05)
+            raise RuntimeError("no route to host")
+
+        with patch.object(multi_connect, 'load_ssh_config', side_effect=slow_failure):
+            result = multi_connect.connect_cluster(cluster, MagicMock())
+
+        assert result['success'] is False
+        assert result['error'] == "no route to host"
+        assert result['elapsed'] >= 0.05
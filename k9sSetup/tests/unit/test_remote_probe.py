@@ -0,0 +1,363 @@
+"""Round-trip harness for the combined remote probe (probe_remote).
+
+FakeRemoteHost stands in for a connected SSHClient: every exec_command runs
+in a local sh (with stub `ip` and `hostname` commands on PATH) and every
+open_sftp opens the local file, and each of them counts as one round trip.
+The same host serves the separate calls (get_internal_ip,
+get_remote_file_hash, fetch_remote_file) and the probe, so their results
+and round-trip counts can be compared.
+"""
+
+import hashlib
+import io
+import os
+import stat
+import subprocess
+import tempfile
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.ssh import (
+    fetch_remote_file_cached,
+    fetch_remote_file_probed,
+    get_internal_ip,
+    probe_remote,
+)
+
+KUBECONFIG = """apiVersion: v1
+clusters:
+- cluster:
+    server: https://127.0.0.1:6443
+  name: default
+users:
+- name: default
+  user:
+    token: test-token
+"""
+
+IP_ADDR_OUTPUT = "    inet 10.20.0.5/24 brd 10.20.0.255 scope global eth0"
+ROUTE_OUTPUT = "1.1.1.1 via 10.20.0.1 dev eth0 src 10.20.0.5 uid 1000"
+
+
+class FakeSftpFile:
+    """Remote file opened through FakeSftp."""
+
+    def __init__(self, host, path):
+        self._host = host
+        self._file = open(path, "rb")
+
+    def read(self):
+        data = self._file.read()
+        self._host.bytes_received += len(data)
+        return data
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self._file.close()
+
+
+class FakeSftp:
+    """SFTP session of FakeRemoteHost."""
+
+    def __init__(self, host):
+        self._host = host
+
+    def open(self, path, mode="r"):
+        return FakeSftpFile(self._host, path)
+
+    def close(self):
+        pass
+
+
+class FakeChannelFile(io.BytesIO):
+    """stdout of FakeRemoteHost.exec_command, with the command's exit status."""
+
+    def __init__(self, data: bytes, exit_status: int):
+        super().__init__(data)
+        self.channel = MagicMock()
+        self.channel.recv_exit_status.return_value = exit_status
+
+
+class FakeRemoteHost:
+    """SSHClient stand-in that runs commands locally and counts round trips."""
+
+    def __init__(self, root: Path, ip_addr: str = IP_ADDR_OUTPUT, hostname_i: str = "",
+                 route: str = ROUTE_OUTPUT):
+        """
+        Create the stub commands.
+
+        Args:
+            root: Scratch directory
+            ip_addr: Output of `ip -4 addr show scope global`
+            hostname_i: Output of `hostname -I`
+            route: Output of `ip route get 1.1.1.1`
+        """
+        self.round_trips = 0
+        self.bytes_received = 0
+        # Bytes dropped from the end of the next command's output, like a
+        # channel closed early
+        self.truncate = 0
+        self.bin_dir = Path(tempfile.mkdtemp(prefix="bin", dir=root))
+        self._stub("ip", f'if [ "$1" = route ]; then echo "{route}"; else echo "{ip_addr}"; fi')
+        self._stub("hostname", f'echo "{hostname_i}"')
+
+    def _stub(self, name: str, body: str):
+        path = self.bin_dir / name
+        path.write_text(f"#!/bin/sh\n{body}\n")
+        path.chmod(path.stat().st_mode | stat.S_IXUSR)
+
+    def exec_command(self, cmd):
+        self.round_trips += 1
+        env = dict(os.environ, PATH=f"{self.bin_dir}{os.pathsep}{os.environ['PATH']}")
+        result = subprocess.run(["sh", "-c", cmd], capture_output=True, env=env)
+        out = result.stdout[:len(result.stdout) - self.truncate]
+        self.truncate = 0
+        self.bytes_received += len(out)
+        return io.BytesIO(), FakeChannelFile(out, result.returncode), io.BytesIO()
+
+    def open_sftp(self):
+        self.round_trips += 1
+        return FakeSftp(self)
+
+
+@pytest.fixture
+def workdir():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir)
+        remote_file = root / "k3s.yaml"
+        remote_file.write_text(KUBECONFIG)
+        yield root, remote_file, root / "cache" / "ctx.yml"
+
+
+def legacy_fetch(host, remote_file, cache_path):
+    """The separate calls fetch_and_merge_kubeconfig made before the probe."""
+    internal_ip = get_internal_ip(host)
+    content, was_cached = fetch_remote_file_cached(host, str(remote_file), cache_path)
+    return internal_ip, content, was_cached
+
+
+class TestProbeRemote:
+    """Tests for probe_remote function."""
+
+    def test_reports_ip_hash_size_mtime_and_content(self, workdir):
+        """Returns everything about the host and file from one exec_command."""
+        root, remote_file, _ = workdir
+        host = FakeRemoteHost(root)
+
+        probe = probe_remote(host, str(remote_file))
+
+        assert host.round_trips == 1
+        assert probe['internal_ip'] == "10.20.0.5"
+        assert probe['readable'] is True
+        assert probe['hash'] == hashlib.sha256(KUBECONFIG.encode()).hexdigest()
+        assert probe['size'] == len(KUBECONFIG.encode())
+        assert probe['mtime'] == int(remote_file.stat().st_mtime)
+        assert probe['content'] == KUBECONFIG
+
+    def test_skips_content_when_hash_matches(self, workdir):
+        """Doesn't send the content the caller already has."""
+        root, remote_file, _ = workdir
+        host = FakeRemoteHost(root)
+        known = hashlib.sha256(KUBECONFIG.encode()).hexdigest()
+
+        probe = probe_remote(host, str(remote_file), known_hash=known)
+
+        assert probe['hash'] == known
+        assert probe['content'] is None
+
+    def test_skips_content_when_not_requested(self, workdir):
+        """fetch_content=False only reports metadata."""
+        root, remote_file, _ = workdir
+        host = FakeRemoteHost(root)
+
+        probe = probe_remote(host, str(remote_file), fetch_content=False)
+
+        assert probe['hash'] is not None
+        assert probe['content'] is None
+
+    def test_falls_back_past_loopback_and_empty_outputs(self, workdir):
+        """Picks the first usable address, like get_internal_ip."""
+        root, remote_file, _ = workdir
+        host = FakeRemoteHost(root, ip_addr="    inet 127.0.0.1/8", hostname_i="",
+                              route=ROUTE_OUTPUT)
+
+        probe = probe_remote(host, str(remote_file))
+
+        assert probe['internal_ip'] == "10.20.0.5"
+        assert host.round_trips == 1
+
+    def test_reports_missing_file(self, workdir):
+        """Missing file: not readable, no hash, no content."""
+        root, _, _ = workdir
+        host = FakeRemoteHost(root)
+
+        probe = probe_remote(host, str(root / "missing.yaml"))
+
+        assert probe['readable'] is False
+        assert probe['hash'] is None
+        assert probe['size'] is None
+        assert probe['content'] is None
+
+    def test_handles_path_with_spaces_and_quotes(self, workdir):
+        """Quotes the remote path for the shell."""
+        root, _, _ = workdir
+        host = FakeRemoteHost(root)
+        remote_file = root / "it's a file.yaml"
+        remote_file.write_text(KUBECONFIG)
+
+        probe = probe_remote(host, str(remote_file))
+
+        assert probe['content'] == KUBECONFIG
+
+    def test_rejects_truncated_content(self, workdir):
+        """Content cut short by the channel doesn't match the hash and size."""
+        root, remote_file, _ = workdir
+        host = FakeRemoteHost(root)
+        host.truncate = 10
+
+        probe = probe_remote(host, str(remote_file))
+
+        assert probe['complete'] is False
+        assert probe['content'] is None
+        assert probe['hash'] == hashlib.sha256(KUBECONFIG.encode()).hexdigest()
+
+    def test_rejects_content_of_failed_command(self, workdir):
+        """A non-zero exit status marks the content incomplete."""
+        root, remote_file, _ = workdir
+        host = FakeRemoteHost(root)
+        original = host.exec_command
+
+        def failing_exec(cmd):
+            stdin, stdout, stderr = original(cmd)
+            stdout.channel.recv_exit_status.return_value = 1
+            return stdin, stdout, stderr
+
+        host.exec_command = failing_exec
+
+        probe = probe_remote(host, str(remote_file))
+
+        assert probe['complete'] is False
+        assert probe['content'] is None
+
+    def test_returns_none_when_shell_cannot_run_probe(self):
+        """Returns None when the output has no probe header."""
+        mock_ssh = MagicMock()
+        mock_stdout = MagicMock()
+        mock_stdout.read.return_value = b"fish: Unknown command: sh\n"
+        mock_ssh.exec_command.return_value = (None, mock_stdout, None)
+
+        assert probe_remote(mock_ssh, "/etc/rancher/k3s/k3s.yaml") is None
+
+
+class TestFetchRemoteFileProbed:
+    """Tests for fetch_remote_file_probed function."""
+
+    def test_downloads_then_serves_from_cache(self, workdir):
+        """Cold cache downloads and stores; warm cache reuses the local copy."""
+        root, remote_file, cache_path = workdir
+        host = FakeRemoteHost(root)
+
+        assert fetch_remote_file_probed(host, str(remote_file), cache_path) == (
+            "10.20.0.5", KUBECONFIG, False
+        )
+        assert cache_path.read_text() == KUBECONFIG
+
+        assert fetch_remote_file_probed(host, str(remote_file), cache_path) == (
+            "10.20.0.5", KUBECONFIG, True
+        )
+
+    def test_refetches_when_remote_changes(self, workdir):
+        """A changed remote file replaces the cached copy."""
+        root, remote_file, cache_path = workdir
+        host = FakeRemoteHost(root)
+        fetch_remote_file_probed(host, str(remote_file), cache_path)
+
+        remote_file.write_text(KUBECONFIG.replace("test-token", "new-token"))
+        _, content, was_cached = fetch_remote_file_probed(host, str(remote_file), cache_path)
+
+        assert was_cached is False
+        assert "new-token" in content
+        assert cache_path.read_text() == content
+
+    def test_raises_when_no_internal_ip(self, workdir):
+        """Raises RuntimeError like get_internal_ip."""
+        root, remote_file, cache_path = workdir
+        host = FakeRemoteHost(root, ip_addr="", hostname_i="", route="")
+
+        with pytest.raises(RuntimeError, match="Could not detect internal IPv4"):
+            fetch_remote_file_probed(host, str(remote_file), cache_path)
+
+    def test_raises_when_file_unreadable(self, workdir):
+        """Raises RuntimeError for a missing remote file."""
+        root, _, cache_path = workdir
+        host = FakeRemoteHost(root)
+
+        with pytest.raises(RuntimeError, match="not readable"):
+            fetch_remote_file_probed(host, str(root / "missing.yaml"), cache_path)
+
+
+    def test_refetches_over_sftp_when_probe_content_truncated(self, workdir):
+        """A truncated probe body is never cached; the file is read over SFTP."""
+        root, remote_file, cache_path = workdir
+        host = FakeRemoteHost(root)
+        host.truncate = 10
+
+        result = fetch_remote_file_probed(host, str(remote_file), cache_path)
+
+        assert result == ("10.20.0.5", KUBECONFIG, False)
+        assert cache_path.read_text() == KUBECONFIG
+
+
+class TestRoundTrips:
+    """Separate calls vs probe: same results, fewer round trips."""
+
+    def test_cold_cache(self, workdir):
+        """IP command + hash command + SFTP session vs one probe."""
+        root, remote_file, cache_path = workdir
+        legacy_host = FakeRemoteHost(root)
+        probe_host = FakeRemoteHost(root)
+
+        legacy = legacy_fetch(legacy_host, remote_file, root / "legacy.yml")
+        probed = fetch_remote_file_probed(probe_host, str(remote_file), cache_path)
+
+        assert probed == legacy
+        assert legacy_host.round_trips == 3
+        assert probe_host.round_trips == 1
+
+    def test_warm_cache(self, workdir):
+        """IP command + hash command vs one probe that sends no content."""
+        root, remote_file, cache_path = workdir
+        host = FakeRemoteHost(root)
+        fetch_remote_file_probed(host, str(remote_file), cache_path)
+        cold_bytes = host.bytes_received
+
+        host.round_trips = host.bytes_received = 0
+        legacy = legacy_fetch(host, remote_file, cache_path)
+        legacy_trips = host.round_trips
+
+        host.round_trips = host.bytes_received = 0
+        probed = fetch_remote_file_probed(host, str(remote_file), cache_path)
+
+        assert probed == legacy == ("10.20.0.5", KUBECONFIG, True)
+        assert legacy_trips == 2
+        assert host.round_trips == 1
+        assert host.bytes_received <= cold_bytes - len(KUBECONFIG)
+
+    def test_ip_detection_fallbacks(self, workdir):
+        """All three IP commands needed: five round trips vs one."""
+        root, remote_file, cache_path = workdir
+        host = FakeRemoteHost(root, ip_addr="", hostname_i="", route=ROUTE_OUTPUT)
+
+        legacy = legacy_fetch(host, remote_file, root / "legacy.yml")
+        legacy_trips = host.round_trips
+
+        host.round_trips = 0
+        probed = fetch_remote_file_probed(host, str(remote_file), cache_path)
+
+        assert probed == legacy
+        assert legacy_trips == 5
+        assert host.round_trips == 1
@@ -12,7 +12,8 @@
     kill_tunnel,
     kill_all_tunnels,
     create_tunnel,
-    save_tunnel_pid
+    save_tunnel_pid,
+    get_tunnel_lock_file
 )
 
 
@@ -275,3 +276,28 @@ def test_does_nothing_when_pid_is_none(self):
 
             pid_file = state_dir / "test.pid"
             assert not pid_file.exists()
+
+    def test_replaces_pid_without_temp_leftovers(self):
+        """Overwrites an existing PID file and leaves only the PID file."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            state_dir = Path(tmpdir)
+
+            save_tunnel_pid("test-context", 111, state_dir)
+            save_tunnel_pid("test-context", 222, state_dir)
+
+            assert (state_dir / "test-context.pid").read_text() == "222"
+            assert [p.name for p in state_dir.iterdir()] == ["test-context.pid"]
+
+
+class TestGetTunnelLockFile:
+    """Tests for get_tunnel_lock_file function."""
+
+    def test_returns_lock_path_next_to_pid_file(self):
+        """Lock file lives in the state dir, named after the context."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            state_dir = Path(tmpdir) / "state"
+
+            lock_file = get_tunnel_lock_file("test-context", state_dir)
+
+            assert lock_file == state_dir / "test-context.lock"
+            assert state_dir.exists()